@@ -10,7 +10,7 @@ import os
 import sys
 import json
 from datetime import datetime
-from src.agents import InterviewAgent, ReasoningExtractor, ProfileGeneratorAgent
+from src.agents import InterviewAgent
 from src.tools import ProfileSaver
 
 
@@ -29,6 +29,38 @@ def print_user_message(message: str):
     print(f"You: {message}")
 
 
+def stream_agent_reply(agent, user_input: str, session_id: str, show_reasoning: bool):
+    """Print the agent's reply token by token as it is generated.
+
+    Returns:
+        (final response dict, reasoning text or None)
+    """
+    reasoning_parts = []
+    streamed = False
+    response = None
+    for event in agent.stream_message(user_input, thread_id=session_id):
+        if event["type"] == "reasoning":
+            if show_reasoning and not reasoning_parts and not streamed:
+                print("\n💭 [Reasoning]: ", end="", flush=True)
+            reasoning_parts.append(event["text"])
+            if show_reasoning and not streamed:
+                print(event["text"], end="", flush=True)
+        elif event["type"] == "token":
+            if not streamed:
+                print("\n\n🎭 Agent: " if show_reasoning and reasoning_parts else "\n🎭 Agent: ", end="", flush=True)
+                streamed = True
+            print(event["text"], end="", flush=True)
+        else:
+            response = event
+
+    if streamed:
+        print("\n")
+    elif response is not None:
+        # Nothing was streamed (e.g. the turn ended in profile generation)
+        print_agent_message(response["message"])
+    return response, "".join(reasoning_parts) or None
+
+
 def print_status(turn_count: int, max_turns: int = 12):
     """Print current progress."""
     progress = "●" * turn_count + "○" * (max_turns - turn_count)
@@ -63,9 +95,7 @@ def main():
     try:
         print("Initializing agents...")
         agent = InterviewAgent()
-        profile_generator = ProfileGeneratorAgent()
         profile_saver = ProfileSaver()
-        reasoning_extractor = ReasoningExtractor()
         print("✓ Agents initialized\n")
     except Exception as e:
         print(f"❌ Failed to initialize: {e}")
@@ -116,14 +146,7 @@ def main():
             print("\n\nInterview interrupted.")
             # Generate profile before exiting
             print("\nGenerating profile from interview so far...")
-            profile_data = profile_generator.generate_profile(
-                conversation_history,
-                metadata={
-                    'turn_count': turn_count,
-                    'completion_status': 'interrupted',
-                    'early_termination': True
-                }
-            )
+            profile_data = agent.generate_profile(session_id, completion_status='interrupted')
             # Save profile
             try:
                 profile_paths = profile_saver.save_session_summary(
@@ -146,15 +169,8 @@ def main():
             print("\nEnding interview early...")
             print("Generating your literary profile...\n")
             
-            # Generate profile using dedicated agent
-            profile_data = profile_generator.generate_profile(
-                conversation_history,
-                metadata={
-                    'turn_count': turn_count,
-                    'completion_status': 'early_exit',
-                    'early_termination': True
-                }
-            )
+            # Generate profile from the session state (stored, so get_profile sees it too)
+            profile_data = agent.generate_profile(session_id, completion_status='early_exit')
             
             # Display and save profile
             print_separator("=")
@@ -187,16 +203,10 @@ def main():
             
             break
 
-        # Send message to agent
+        # Send message to agent, rendering the reply as it streams in
         try:
-            print(f"[Sending {len(user_input)} chars...]")
-            response = agent.send_message(user_input, thread_id=session_id)
-            
-            # Extract reasoning if available
-            reasoning = None
-            if response.get("messages"):
-                latest_msg = response["messages"][-1]
-                reasoning = reasoning_extractor.extract_reasoning(latest_msg)
+            print_user_message(user_input)
+            response, reasoning = stream_agent_reply(agent, user_input, session_id, show_reasoning)
             
             # Track conversation
             conversation_history.append({"role": "user", "content": user_input})
@@ -205,13 +215,6 @@ def main():
                 assistant_entry["reasoning_content"] = reasoning
             conversation_history.append(assistant_entry)
             turn_count += 1
-
-            print_user_message(user_input)
-            print_agent_message(response["message"])
-            
-            # Show reasoning if enabled
-            if show_reasoning and reasoning:
-                print(f"\n💭 [Reasoning]: {reasoning[:300]}..." if len(reasoning) > 300 else f"\n💭 [Reasoning]: {reasoning}")
             
             print_status(turn_count)  # Use local turn count for display
 
@@ -221,16 +224,10 @@ def main():
                 print("\n🎉 Interview Complete!\n")
                 print_separator("=")
 
-                # Generate profile using dedicated profile generator agent
+                # The graph already generated the profile on its final turn; this
+                # reads it back (and only calls the model if it did not)
                 print("Generating your comprehensive literary profile...\n")
-                profile_data = profile_generator.generate_profile(
-                    conversation_history,
-                    metadata={
-                        'turn_count': turn_count,
-                        'completion_status': 'complete',
-                        'early_termination': False
-                    }
-                )
+                profile_data = agent.generate_profile(session_id)
                 
                 # Show profile generation reasoning if available
                 if show_reasoning and isinstance(profile_data, dict) and "_reasoning" in profile_data:
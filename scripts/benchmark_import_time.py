@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Measure how long importing WREN modules takes, using ``python -X importtime``.
+
+Each module is imported in a fresh interpreter several times; the fastest run
+is reported (the others mostly measure disk cache and scheduler noise), along
+with the heaviest imports pulled in. Results can be appended to a JSON-lines
+file to track startup over time, and ``--max-ms`` turns the script into a
+regression check that exits non-zero when an import gets too slow.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py src.agents src.utils.llm_factory --runs 5
+    python scripts/benchmark_import_time.py --record benchmarks/import_times.jsonl --max-ms 1500
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Keys the import must not need; set so settings/API-key checks can't hide a slow path
+BENCH_ENV = {"MOONSHOT_API_KEY": "sk-benchmark"}
+
+
+def _importtime(code: str) -> List[Tuple[str, int]]:
+    """Run ``code`` in a fresh interpreter; (module, self microseconds) per import."""
+    env = {**os.environ, **BENCH_ENV}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        imports.append((name.strip(), int(self_us)))
+    return imports
+
+
+def import_profile(module: str, startup: Set[str]) -> Tuple[int, Dict[str, int]]:
+    """Import a module in a fresh interpreter and parse its ``-X importtime`` log.
+
+    Args:
+        module: Dotted module name
+        startup: Modules every interpreter imports before running any code (excluded)
+
+    Returns:
+        (total microseconds, microseconds spent in each top-level package)
+    """
+    packages: Dict[str, int] = {}
+    total = 0
+    for name, self_us in _importtime(f"import {module}"):
+        if name in startup:
+            continue
+        # Self times add up to the total without double counting nested imports
+        total += self_us
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return total, packages
+
+
+def benchmark(module: str, runs: int) -> Dict:
+    """Fastest of ``runs`` imports of ``module`` with its heaviest packages."""
+    startup = {name for name, _ in _importtime("pass")}
+    best_total, best_packages = None, {}
+    for _ in range(runs):
+        total, packages = import_profile(module, startup)
+        if best_total is None or total < best_total:
+            best_total, best_packages = total, packages
+    heaviest = sorted(best_packages.items(), key=lambda item: item[1], reverse=True)[:8]
+    return {
+        "module": module,
+        "total_ms": round(best_total / 1000, 1),
+        "heaviest": [{"package": name, "ms": round(us / 1000, 1)} for name, us in heaviest]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=["src.agents"], help="modules to import (default: src.agents)")
+    parser.add_argument("--runs", type=int, default=3, help="imports per module; the fastest is reported")
+    parser.add_argument("--record", help="append results to this JSON-lines file")
+    parser.add_argument("--max-ms", type=float, help="exit with status 1 if any module takes longer")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("IMPORT TIME".center(80))
+    print("=" * 80 + "\n")
+
+    results: List[Dict] = []
+    for module in args.modules:
+        try:
+            result = benchmark(module, args.runs)
+        except RuntimeError as e:
+            print(f"✗ {module}: {e}")
+            sys.exit(1)
+        results.append(result)
+        print(f"{module}: {result['total_ms']:.1f} ms (best of {args.runs})")
+        for entry in result["heaviest"]:
+            print(f"  {entry['package']:<32} {entry['ms']:>8.1f} ms")
+        print()
+
+    if args.record:
+        record_path = Path(args.record)
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(record_path, "a", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps({"timestamp": datetime.now().isoformat(), "python": sys.version.split()[0], **result}) + "\n")
+        print(f"✓ Recorded to {record_path}")
+
+    if args.max_ms is not None:
+        slow = [result for result in results if result["total_ms"] > args.max_ms]
+        for result in slow:
+            print(f"✗ {result['module']} took {result['total_ms']:.1f} ms (limit {args.max_ms:.0f} ms)")
+        if slow:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Re-encode legacy pickled checkpoints in Redis with the versioned binary format.
+
+Also turns ``latest`` keys that still hold a full checkpoint blob into id pointers,
+and adds every checkpoint to its thread's sorted-set index, which ``list()``,
+history and forks read.
+With ``--hash-tags``, renames keys to the Redis Cluster layout instead, wrapping
+the session id in a ``{...}`` hash tag so all keys of a session share one slot.
+"""
+
+import redis
+from redis.cluster import RedisCluster
+import os
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.agents.checkpoint_serde import CheckpointSerializer
+from src.agents.redis_checkpointer import RedisCheckpointSaver
+from src.config import settings
+
+load_dotenv()
+
+
+def index_checkpoint(r, key, checkpoint, dry_run):
+    """Add a checkpoint blob's id to its thread's index. Returns 1 if it was (or would be) added."""
+    # Blob keys end in the checkpoint id; the index sits next to them
+    index_key = key.rsplit(b":", 1)[0] + b":index"
+    checkpoint_id = checkpoint["id"]
+    if r.zscore(index_key, checkpoint_id) is not None:
+        return 0
+    if not dry_run:
+        ttl, index_ttl = r.ttl(key), r.ttl(index_key)
+        # Not a transaction: before --hash-tags the two keys may sit in different cluster slots
+        pipe = r.pipeline(transaction=False)
+        pipe.zadd(index_key, {checkpoint_id: RedisCheckpointSaver._checkpoint_score(checkpoint)})
+        # The index must live as long as the longest-lived checkpoint it lists
+        if ttl > 0 and (index_ttl == -2 or 0 <= index_ttl < ttl):
+            pipe.expire(index_key, ttl)
+        pipe.execute()
+    return 1
+
+
+def migrate_value(r, key, serializer, dry_run):
+    """Re-encode one checkpoint blob or message log and index checkpoint blobs.
+
+    Returns (migrated, bytes saved, indexed).
+    """
+    key_type = r.type(key)
+
+    if key_type == b"string" and key.endswith(b":latest"):
+        # Older versions stored a full copy of the blob; replace it with a pointer
+        blob = r.get(key)
+        if not blob:
+            return 0, 0, 0
+        checkpoint_id = serializer.loads(blob)["checkpoint"]["id"]
+        ttl = r.ttl(key)
+        if not dry_run:
+            pipe = r.pipeline(transaction=True)
+            pipe.delete(key)
+            pipe.hset(key, "id", checkpoint_id)
+            # The pointer's ttl is what sliding reads refresh the session to;
+            # keep the session's current TTL, and none for keys without expiry
+            if ttl > 0:
+                pipe.hset(key, "ttl", ttl)
+                pipe.expire(key, ttl)
+            pipe.execute()
+        return 1, len(blob), 0
+
+    if key_type == b"string":
+        blob = r.get(key)
+        if not blob:
+            return 0, 0, 0
+        checkpoint = serializer.loads(blob)
+        indexed = index_checkpoint(r, key, checkpoint["checkpoint"], dry_run)
+        if serializer.is_current(blob):
+            return 0, 0, indexed
+        new_blob = serializer.dumps(checkpoint)
+        if not dry_run:
+            # Preserve the remaining TTL of the session
+            r.set(key, new_blob, keepttl=True)
+        return 1, len(blob) - len(new_blob), indexed
+
+    if key_type == b"list":
+        migrated, saved = 0, 0
+        for i, item in enumerate(r.lrange(key, 0, -1)):
+            if serializer.is_current(item):
+                continue
+            new_item = serializer.dumps(serializer.loads(item))
+            if not dry_run:
+                r.lset(key, i, new_item)
+            migrated += 1
+            saved += len(item) - len(new_item)
+        return migrated, saved, 0
+
+    return 0, 0, 0
+
+
+def retag_key(r, key, dry_run):
+    """Move a key to its hash-tagged name. Returns 1 if it was (or would be) moved."""
+    parts = key.split(b":")
+    if len(parts) < 4 or parts[2].startswith(b"{"):
+        return 0
+    parts[2] = b"{" + parts[2] + b"}"
+    new_key = b":".join(parts)
+
+    if not dry_run:
+        # DUMP/RESTORE instead of RENAME: the new key usually lives in another slot
+        dump = r.dump(key)
+        if dump is None:
+            return 0  # expired or deleted since the scan
+        ttl = r.pttl(key)
+        if ttl == -2:
+            return 0
+        # PTTL is -1 without an expiry; RESTORE takes 0 for that
+        r.restore(new_key, ttl if ttl > 0 else 0, dump, replace=True)
+        r.delete(key)
+    return 1
+
+
+def main():
+    dry_run = "--dry-run" in sys.argv
+    hash_tags = "--hash-tags" in sys.argv
+
+    try:
+        client_cls = RedisCluster if os.getenv('REDIS_CLUSTER', 'false').lower() == 'true' else redis.Redis
+        r = client_cls(
+            host=os.getenv('REDIS_HOST', 'localhost'),
+            port=int(os.getenv('REDIS_PORT', 6379)),
+            password=os.getenv('REDIS_PASSWORD'),
+            decode_responses=False
+        )
+        r.ping()
+        print("✓ Connected to Redis\n")
+    except redis.exceptions.ConnectionError as e:
+        print(f"✗ Redis connection failed: {e}")
+        return
+
+    serializer = CheckpointSerializer(
+        compression=settings.checkpoint_compression,
+        compress_threshold=settings.checkpoint_compress_threshold
+    )
+
+    print("=" * 80)
+    print(f"MIGRATING CHECKPOINTS{' (DRY RUN)' if dry_run else ''}".center(80))
+    print("=" * 80 + "\n")
+
+    if hash_tags:
+        # Collect first so renamed keys aren't visited again by the scan
+        keys = list(r.scan_iter(match="langgraph:checkpoint:*", count=500))
+        moved = sum(retag_key(r, key, dry_run) for key in keys)
+        print(f"Keys scanned: {len(keys)}")
+        print(f"Keys moved to hash-tagged names: {moved}")
+        if dry_run:
+            print("\nRun without --dry-run to apply.")
+        return
+
+    scanned, migrated, saved, indexed = 0, 0, 0, 0
+    for key in r.scan_iter(match="langgraph:checkpoint:*", count=500):
+        scanned += 1
+        try:
+            count, delta, added = migrate_value(r, key, serializer, dry_run)
+        except Exception as e:
+            print(f"  ⚠ Skipped {key.decode('utf-8')}: {e}")
+            continue
+        migrated += count
+        saved += delta
+        indexed += added
+
+    print(f"Keys scanned: {scanned}")
+    print(f"Blobs re-encoded: {migrated}")
+    print(f"Checkpoints indexed: {indexed}")
+    print(f"Bytes saved: {saved / 1024:.1f} KB")
+    if dry_run:
+        print("\nRun without --dry-run to apply.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,20 +2,27 @@
 """View all WREN sessions stored in Redis."""
 
 import redis
-import pickle
+from redis.cluster import RedisCluster
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.agents.redis_checkpointer import RedisCheckpointSaver
+from src.agents.session_summary import build_summary, parse_summary
+
 load_dotenv()
 
 def main():
     # Connect to Redis
     try:
-        r = redis.Redis(
+        client_cls = RedisCluster if os.getenv('REDIS_CLUSTER', 'false').lower() == 'true' else redis.Redis
+        r = client_cls(
             host=os.getenv('REDIS_HOST', 'localhost'),
             port=int(os.getenv('REDIS_PORT', 6379)),
             password=os.getenv('REDIS_PASSWORD'),
-            decode_responses=False  # Need bytes for pickle
+            decode_responses=False  # Checkpoints are binary blobs
         )
         r.ping()
         print("✓ Connected to Redis\n")
@@ -32,7 +39,8 @@ def main():
     print("=" * 80 + "\n")
 
     # Get all checkpoint keys
-    keys = r.keys("langgraph:checkpoint:*:latest")
+    keys = list(r.scan_iter(match="langgraph:checkpoint:*:latest", count=500))
+    saver = RedisCheckpointSaver(r)
     
     if not keys:
         print("No active sessions found.")
@@ -44,7 +52,7 @@ def main():
 
     for key in keys:
         key_str = key.decode('utf-8')
-        session_id = key_str.split(':')[2]
+        session_id = key_str.split(':')[2].strip('{}')
         
         # Get TTL
         ttl = r.ttl(key)
@@ -54,34 +62,32 @@ def main():
         print("-" * 80)
         
         try:
-            # Get and unpickle data
-            data = r.get(key)
-            if not data:
-                print("  [Empty or expired]\n")
-                continue
-                
-            state = pickle.loads(data)
-            checkpoint = state.get('checkpoint', {})
+            # Read the small summary hash; only older sessions need their checkpoint decoded
+            summary = saver.get_summary(session_id)
+            if summary is None:
+                state = saver.get_tuple({"configurable": {"thread_id": session_id}})
+                if not state:
+                    print("  [Empty or expired]\n")
+                    continue
+                summary = parse_summary(build_summary(state.checkpoint))
             
             # Display session info
-            turn_count = checkpoint.get('turn_count', 0)
-            messages = checkpoint.get('messages', [])
-            is_complete = checkpoint.get('is_complete', False)
-            
-            print(f"  Turn count: {turn_count}/12")
-            print(f"  Messages: {len(messages)}")
-            print(f"  Status: {'Complete' if is_complete else 'In progress'}")
+            print(f"  Turn count: {summary['turn_count']}/12")
+            print(f"  Messages: {summary['message_count']}")
+            print(f"  Status: {'Complete' if summary['is_complete'] else 'In progress'}")
+            print(f"  Coverage: {summary['coverage_score']:.0%}")
+            if summary['last_activity']:
+                print(f"  Last activity: {summary['last_activity']}")
             print(f"  TTL: {hours_left:.1f} hours remaining")
             
             # Show last message preview if available
-            if messages:
-                last_msg = messages[-1]
-                content = last_msg.content if hasattr(last_msg, 'content') else str(last_msg)
+            content = summary['last_message']
+            if content:
                 preview = content[:80] + "..." if len(content) > 80 else content
                 print(f"  Last message: {preview}")
             
             # Show profile status
-            profile_data = checkpoint.get('profile_data', {})
+            profile_data = summary['profile_data']
             if profile_data:
                 archetype = profile_data.get('reader_archetype', 'N/A')
                 print(f"  Profile generated: {archetype}")
@@ -95,10 +101,11 @@ def main():
     print(f"Total active sessions: {len(keys)}")
     print("=" * 80)
     
-    # Show Redis info
-    info = r.info('memory')
-    memory_mb = info['used_memory'] / (1024 * 1024)
-    print(f"\nRedis memory usage: {memory_mb:.2f} MB")
+    # Show Redis info (per-node in a cluster, so only for a single instance)
+    if not isinstance(r, RedisCluster):
+        info = r.info('memory')
+        memory_mb = info['used_memory'] / (1024 * 1024)
+        print(f"\nRedis memory usage: {memory_mb:.2f} MB")
 
 
 if __name__ == "__main__":
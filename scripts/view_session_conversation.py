@@ -2,12 +2,16 @@
 """View full conversation from a Redis session in readable format."""
 
 import redis
-import pickle
+from redis.cluster import RedisCluster
 import os
 import sys
+from pathlib import Path
 from dotenv import load_dotenv
 import json
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.agents.redis_checkpointer import RedisCheckpointSaver
+
 load_dotenv()
 
 def view_session(session_id):
@@ -15,7 +19,8 @@ def view_session(session_id):
     
     # Connect to Redis
     try:
-        r = redis.Redis(
+        client_cls = RedisCluster if os.getenv('REDIS_CLUSTER', 'false').lower() == 'true' else redis.Redis
+        r = client_cls(
             host=os.getenv('REDIS_HOST'),
             port=int(os.getenv('REDIS_PORT')),
             password=os.getenv('REDIS_PASSWORD'),
@@ -27,23 +32,23 @@ def view_session(session_id):
         return
 
     # Get session data
-    key = f"langgraph:checkpoint:{session_id}:latest"
-    data = r.get(key)
+    saver = RedisCheckpointSaver(r)
+    key = saver._make_key(session_id)
+    state = saver.get_tuple({"configurable": {"thread_id": session_id}})
     
-    if not data:
+    if not state:
         print(f"Session '{session_id}' not found in Redis")
         print(f"\nTried key: {key}")
         print("\nAvailable sessions:")
-        keys = r.keys("langgraph:checkpoint:*:latest")
+        keys = list(r.scan_iter(match="langgraph:checkpoint:*:latest", count=500))
         for k in keys[:10]:
-            sid = k.decode('utf-8').split(':')[2]
+            sid = k.decode('utf-8').split(':')[2].strip('{}')
             print(f"  - {sid}")
         return
 
-    # Unpickle and display
+    # Display decoded checkpoint
     try:
-        state = pickle.loads(data)
-        checkpoint = state.get('checkpoint', {})
+        checkpoint = state.checkpoint.get('channel_values', {})
         
         print("=" * 80)
         print(f"SESSION: {session_id}".center(80))
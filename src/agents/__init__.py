@@ -1,5 +1,7 @@
 from .interview_agent import InterviewAgent, InterviewState
 from .redis_checkpointer import RedisCheckpointSaver
+from .async_redis_checkpointer import AsyncRedisCheckpointSaver
+from .sqlite_checkpointer import SQLiteCheckpointSaver
 from .reasoning_extractor import ReasoningExtractor
 from .profile_generator import ProfileGeneratorAgent
 
@@ -7,6 +9,8 @@ __all__ = [
     "InterviewAgent", 
     "InterviewState", 
     "RedisCheckpointSaver", 
+    "AsyncRedisCheckpointSaver",
+    "SQLiteCheckpointSaver",
     "ReasoningExtractor",
     "ProfileGeneratorAgent"
 ]
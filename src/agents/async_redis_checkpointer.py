@@ -0,0 +1,394 @@
+"""Async Redis checkpointer for LangGraph runtimes driven by an event loop."""
+
+from typing import Optional, Any, AsyncIterator, Dict, List, Sequence, Tuple, Union
+import redis
+import redis.asyncio as aioredis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.cluster import RedisCluster
+from langgraph.checkpoint.base import Checkpoint, CheckpointTuple
+
+from src.agents.checkpoint_cache import CheckpointCache
+from src.agents.checkpoint_serde import CheckpointSerializer
+from src.agents.redis_health import CircuitBreaker, aguarded, aguarded_iter, pool_stats
+from src.agents.session_summary import build_summary, parse_summary
+from src.agents.redis_checkpointer import (
+    RedisCheckpointSaver,
+    APPEND_MESSAGES_SCRIPT,
+    LIST_PAGE_SIZE,
+    MATCH_TTL_SCRIPT,
+    PRUNE_CHECKPOINTS_SCRIPT,
+    READ_CHECKPOINT_SCRIPT,
+)
+
+
+def create_async_redis_client(
+    host: str,
+    port: int,
+    password: Optional[str] = None,
+    max_connections: int = 50,
+    timeout: int = 5,
+    health_check_interval: int = 30,
+    retries: int = 3,
+    cluster: bool = False
+) -> Union[aioredis.Redis, aioredis.RedisCluster]:
+    """Create an asyncio Redis client backed by a bounded connection pool.
+
+    When every connection is busy, callers wait up to ``timeout`` seconds for
+    one to free up instead of opening more sockets. Idle connections are
+    health-checked and failed commands retried as in ``create_redis_client``.
+
+    Args:
+        host: Redis host
+        port: Redis port
+        password: Optional Redis password
+        max_connections: Upper bound on open connections for this process
+            (per cluster node in cluster mode)
+        timeout: Seconds to wait for a free connection (also used for socket timeouts)
+        health_check_interval: Idle seconds after which a connection is checked
+        retries: Retries per command on connection/timeout errors
+        cluster: Connect to a Redis Cluster through ``host``:``port`` as seed node
+
+    Returns:
+        Async Redis client
+    """
+    retry = Retry(ExponentialBackoff(cap=1.0, base=0.05), retries)
+    if cluster:
+        return aioredis.RedisCluster(
+            host=host,
+            port=port,
+            password=password,
+            max_connections=max_connections,
+            socket_connect_timeout=timeout,
+            socket_timeout=timeout,
+            health_check_interval=health_check_interval,
+            retry=retry
+        )
+    pool = aioredis.BlockingConnectionPool(
+        host=host,
+        port=port,
+        password=password,
+        max_connections=max_connections,
+        timeout=timeout,
+        socket_connect_timeout=timeout,
+        socket_timeout=timeout,
+        health_check_interval=health_check_interval,
+        retry=retry
+    )
+    return aioredis.Redis(connection_pool=pool)
+
+
+class AsyncRedisCheckpointSaver(RedisCheckpointSaver):
+    """Redis checkpoint saver with native async methods.
+
+    Uses the same key layout and record format as ``RedisCheckpointSaver``, so
+    sessions written by either one can be read by the other. The sync methods
+    are inherited and use ``redis_client`` when one is provided, which lets a
+    single compiled graph serve both ``invoke`` and ``ainvoke``.
+    """
+
+    def __init__(
+        self,
+        async_client: aioredis.Redis,
+        redis_client: Optional[redis.Redis] = None,
+        namespace: str = "langgraph:checkpoint",
+        ttl: int = 86400,
+        delta_messages: bool = False,
+        serializer: Optional[CheckpointSerializer] = None,
+        cache: Optional[CheckpointCache] = None,
+        keep_last: Optional[int] = None,
+        turn_ends_only: bool = False,
+        sliding_ttl: bool = False,
+        completed_ttl: Optional[int] = None,
+        cluster_mode: Optional[bool] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """Initialize async Redis checkpointer.
+
+        Args:
+            async_client: redis.asyncio client (see ``create_async_redis_client``)
+            redis_client: Optional blocking client for the inherited sync methods
+            namespace: Key prefix for all checkpoints
+            ttl: Time-to-live for checkpoints in seconds (default 24h)
+            delta_messages: Store messages in an append-only list instead of
+                inside every checkpoint blob
+            serializer: Blob encoder (defaults to zstd-compressed serde output)
+            cache: Optional in-process LRU for decoded checkpoints
+            keep_last: Maximum checkpoints kept per thread (None keeps all until TTL)
+            turn_ends_only: Delete checkpoints superseded within a run, keeping
+                only the last checkpoint of each turn
+            sliding_ttl: Refresh a session's TTL whenever it is read
+            completed_ttl: TTL for sessions whose ``is_complete`` channel is set
+                (defaults to ``ttl``)
+            cluster_mode: Hash-tag keys by thread id (defaults to True for
+                cluster clients)
+            breaker: Optional circuit breaker shared by the sync and async methods
+        """
+        if cluster_mode is None:
+            cluster_mode = isinstance(async_client, aioredis.RedisCluster) or isinstance(redis_client, RedisCluster)
+        super().__init__(
+            redis_client,
+            namespace=namespace,
+            ttl=ttl,
+            delta_messages=delta_messages,
+            serializer=serializer,
+            cache=cache,
+            keep_last=keep_last,
+            turn_ends_only=turn_ends_only,
+            sliding_ttl=sliding_ttl,
+            completed_ttl=completed_ttl,
+            cluster_mode=cluster_mode,
+            breaker=breaker
+        )
+        self.aredis = async_client
+        self._aappend_messages = async_client.register_script(APPEND_MESSAGES_SCRIPT)
+        self._aprune_checkpoints = async_client.register_script(PRUNE_CHECKPOINTS_SCRIPT)
+        self._aread_checkpoint = async_client.register_script(READ_CHECKPOINT_SCRIPT)
+        self._amatch_ttl = async_client.register_script(MATCH_TTL_SCRIPT)
+
+    async def _asplit_messages(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint
+    ) -> Tuple[Checkpoint, Optional[int], int, Optional[str], Optional[Tuple[int, List[bytes]]]]:
+        """Async counterpart of ``_split_messages``."""
+        thread_id, checkpoint_ns, parent_id = self._parse_config(config)
+        parent_entry = self.cache.peek(thread_id, checkpoint_ns, parent_id) if self.cache and parent_id else None
+        if parent_entry is not None:
+            parent_offset, parent_digest = self._cached_log_state(parent_entry)
+            parent_bytes = parent_entry["message_bytes"]
+        else:
+            parent_blob = await self.aredis.get(self._make_key(thread_id, checkpoint_ns, parent_id)) if parent_id else None
+            (parent_offset, parent_digest), parent_bytes = self._offset_from_blob(parent_id, parent_blob), 0
+
+        return self._encode_split(checkpoint, parent_offset, parent_digest, parent_bytes)
+
+    def _awrite_pipeline(self) -> Any:
+        """Async counterpart of ``_write_pipeline``."""
+        return self.aredis.pipeline(transaction=not isinstance(self.aredis, aioredis.RedisCluster))
+
+    async def _aexecute_put(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint: Checkpoint,
+        serialized: bytes,
+        message_offset: Optional[int],
+        append: Optional[Tuple[int, List[bytes]]],
+        superseded_id: str,
+        summary: Dict[str, str]
+    ) -> bool:
+        """Async counterpart of ``_execute_put``."""
+        messages_key = self._make_messages_key(thread_id, checkpoint_ns)
+        async with self._awrite_pipeline() as pipe:
+            transaction = getattr(pipe, "is_transaction", False)
+            if append is not None and transaction:
+                await pipe.watch(messages_key)
+                if await pipe.llen(messages_key) != append[0]:
+                    return False
+                pipe.multi()
+                pipe.rpush(messages_key, *append[1])
+            elif append is not None:
+                self._queue_script(
+                    pipe, self._aappend_messages, keys=[messages_key],
+                    args=[append[0], self._ttl_for(checkpoint)] + append[1]
+                )
+            self._queue_checkpoint_writes(
+                pipe, thread_id, checkpoint_ns, checkpoint, serialized, message_offset,
+                superseded_id=superseded_id, prune_script=self._aprune_checkpoints, summary=summary
+            )
+            try:
+                results = await pipe.execute()
+            except redis.exceptions.WatchError:
+                return False
+        return append is None or transaction or results[0] >= 0
+
+    @aguarded
+    async def aput(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint,
+        metadata: Dict[str, Any],
+        new_versions: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Save a checkpoint to Redis without blocking the event loop.
+
+        Args:
+            config: Configuration with thread_id
+            checkpoint: Checkpoint data to save
+            metadata: Checkpoint metadata
+            new_versions: Version information
+
+        Returns:
+            Config addressing the saved checkpoint
+        """
+        thread_id, checkpoint_ns, _ = self._parse_config(config)
+        superseded_id = self._superseded_parent(config, metadata)
+        summary = build_summary(checkpoint)
+
+        stored, message_offset, message_bytes, message_digest, append = checkpoint, None, 0, None, None
+        if self.delta_messages:
+            stored, message_offset, message_bytes, message_digest, append = await self._asplit_messages(config, checkpoint)
+
+        serialized = self._serialize_record(config, stored, metadata, message_offset, message_digest)
+        if not await self._aexecute_put(
+            thread_id, checkpoint_ns, stored, serialized, message_offset, append, superseded_id, summary
+        ):
+            message_offset, message_bytes = None, 0
+            serialized = self._serialize_record(config, checkpoint, metadata, None)
+            await self._aexecute_put(thread_id, checkpoint_ns, checkpoint, serialized, None, None, superseded_id, summary)
+
+        if self.cache is not None:
+            if superseded_id:
+                self.cache.invalidate(thread_id, checkpoint_ns, superseded_id)
+            self._cache_write(config, checkpoint, metadata, serialized, message_offset, message_bytes)
+
+        return self._checkpoint_config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    @aguarded
+    async def aget_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
+        """Retrieve checkpoint tuple from Redis without blocking the event loop.
+
+        Args:
+            config: Configuration with thread_id
+
+        Returns:
+            CheckpointTuple or None if not found
+        """
+        thread_id, checkpoint_ns, checkpoint_id = self._parse_config(config)
+
+        entry = self.cache.get(thread_id, checkpoint_ns, checkpoint_id) if self.cache is not None else None
+        if entry is not None:
+            cached = entry["tuple"]
+            async with self.aredis.pipeline(transaction=False) as pipe:
+                self._queue_cache_check(pipe, thread_id, checkpoint_ns, checkpoint_id, entry)
+                if self.sliding_ttl:
+                    self._queue_touch(
+                        pipe, thread_id, checkpoint_ns, cached.config["configurable"]["checkpoint_id"], cached.checkpoint
+                    )
+                results = await pipe.execute()
+            if self._cache_check_passes(results, checkpoint_id, entry):
+                self.cache.record_hit()
+                return self.cache.copy_tuple(entry["tuple"])
+            self.cache.record_stale(thread_id, checkpoint_ns, checkpoint_id)
+
+        read = await self._aread_checkpoint(**self._read_args(thread_id, checkpoint_ns, checkpoint_id))
+        if not read:
+            return None
+
+        serialized, message_log, raw_writes = self._unpack_read(read)
+        data = self.serializer.loads(serialized)
+        if raw_writes is None:
+            async with self.aredis.pipeline(transaction=False) as pipe:
+                self._queue_tuple_reads(pipe, thread_id, checkpoint_ns, [data])
+                results = await pipe.execute()
+            message_log, raw_writes = self._split_tuple_reads(results, [data])[0]
+        elif message_log is None:
+            log_range = self._log_range(thread_id, checkpoint_ns, data)
+            message_log = await self.aredis.lrange(*log_range) if log_range else []
+        checkpoint_tuple = self._to_tuple(thread_id, checkpoint_ns, data, message_log, raw_writes)
+
+        if self.cache is not None:
+            return self._cache_read(
+                thread_id, checkpoint_ns, checkpoint_tuple, data, serialized, message_log, checkpoint_id is None
+            )
+        return checkpoint_tuple
+
+    @aguarded_iter
+    async def alist(
+        self,
+        config: Dict[str, Any],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[CheckpointTuple]:
+        """List checkpoints for a thread, newest first.
+
+        Args:
+            config: Configuration with thread_id (and optionally checkpoint_id)
+            filter: Optional metadata key/value pairs that must all match
+            before: Optional config; only checkpoints older than its checkpoint_id are listed
+            limit: Maximum number of results
+
+        Yields:
+            CheckpointTuples
+        """
+        thread_id, checkpoint_ns, checkpoint_id = self._parse_config(config)
+        index_key = self._make_index_key(thread_id, checkpoint_ns)
+
+        start, stop = 0, -1
+        if checkpoint_id:
+            rank = await self.aredis.zrevrank(index_key, checkpoint_id)
+            if rank is None:
+                return
+            start, stop = rank, rank
+        before_id = (before or {}).get("configurable", {}).get("checkpoint_id")
+        if before_id:
+            before_rank = await self.aredis.zrevrank(index_key, before_id)
+            if before_rank is None:
+                return
+            start = max(start, before_rank + 1)
+
+        page_size = limit if limit and not filter else LIST_PAGE_SIZE
+        count = 0
+        while limit is None or count < limit:
+            if stop >= 0 and start > stop:
+                break
+            page_stop = start + page_size - 1
+            if stop >= 0:
+                page_stop = min(page_stop, stop)
+
+            ids = [cid.decode() if isinstance(cid, bytes) else cid
+                   for cid in await self.aredis.zrevrange(index_key, start, page_stop)]
+            if not ids:
+                break
+            start += len(ids)
+
+            blobs = await self.aredis.mget([self._make_key(thread_id, checkpoint_ns, cid) for cid in ids])
+            records = self._decode_page(blobs, filter)
+
+            async with self.aredis.pipeline(transaction=False) as pipe:
+                self._queue_tuple_reads(pipe, thread_id, checkpoint_ns, records)
+                reads = self._split_tuple_reads(await pipe.execute(), records)
+
+            for data, (message_log, raw_writes) in zip(records, reads, strict=True):
+                yield self._to_tuple(thread_id, checkpoint_ns, data, message_log, raw_writes)
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+
+    @aguarded
+    async def aput_writes(
+        self,
+        config: Dict[str, Any],
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        """Persist writes from a completed task without blocking the event loop.
+
+        Args:
+            config: Configuration of the checkpoint the writes belong to
+            writes: Pending writes as (channel, value) pairs
+            task_id: Task identifier
+            task_path: Path of the task that produced the writes
+        """
+        async with self.aredis.pipeline(transaction=False) as pipe:
+            self._queue_writes(pipe, config, writes, task_id, task_path, ttl_script=self._amatch_ttl)
+            await pipe.execute()
+
+        if self.cache is not None:
+            self.cache.invalidate(*self._parse_config(config))
+
+    @aguarded
+    async def aget_summary(self, thread_id: str, checkpoint_ns: str = "") -> Optional[Dict[str, Any]]:
+        """Async counterpart of ``get_summary``."""
+        return parse_summary(await self.aredis.hgetall(self._make_summary_key(thread_id, checkpoint_ns)))
+
+    def health(self) -> Dict[str, Any]:
+        """Connection health and performance counters, including the async pool."""
+        health = super().health()
+        health["pool"] = pool_stats(self.aredis)
+        health["sync_pool"] = pool_stats(self.redis)
+        return health
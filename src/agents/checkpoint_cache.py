@@ -0,0 +1,152 @@
+"""In-process LRU cache sitting in front of the Redis checkpointer."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from langgraph.checkpoint.base import CheckpointTuple, copy_checkpoint
+
+
+class CheckpointCache:
+    """Bounded LRU of decoded checkpoint tuples, keyed by thread and checkpoint id.
+
+    The cache is only a read accelerator: every hit is confirmed against Redis
+    with a tiny version check (newest checkpoint id of the thread and the number
+    of pending writes) by the checkpointer before it is served, so sessions
+    touched by another worker are never read stale.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached checkpoints
+            max_bytes: Maximum total encoded size of cached checkpoints
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+        self._latest: Dict[Tuple[str, str], str] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, thread_id: str, checkpoint_ns: str, checkpoint_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Look up a cached entry.
+
+        Args:
+            thread_id: Session/thread identifier
+            checkpoint_ns: Checkpoint namespace
+            checkpoint_id: Checkpoint ID, or None for the thread's latest checkpoint
+
+        Returns:
+            Entry dict with ``tuple``, ``size``, ``message_bytes`` and
+            ``message_offset``, or None
+        """
+        with self._lock:
+            if checkpoint_id is None:
+                checkpoint_id = self._latest.get((thread_id, checkpoint_ns))
+            entry = self._entries.get((thread_id, checkpoint_ns, checkpoint_id)) if checkpoint_id else None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((thread_id, checkpoint_ns, checkpoint_id))
+            return entry
+
+    def peek(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> Optional[Dict[str, Any]]:
+        """Look up an entry without touching LRU order or the hit/miss counters."""
+        with self._lock:
+            return self._entries.get((thread_id, checkpoint_ns, checkpoint_id))
+
+    def put(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_tuple: CheckpointTuple,
+        size: int,
+        message_bytes: int = 0,
+        message_offset: Optional[int] = None,
+        is_latest: bool = False
+    ) -> None:
+        """Add or replace a cached checkpoint, evicting least recently used entries.
+
+        Args:
+            thread_id: Session/thread identifier
+            checkpoint_ns: Checkpoint namespace
+            checkpoint_tuple: Decoded checkpoint tuple
+            size: Encoded size of the checkpoint including its messages
+            message_bytes: Encoded size of its messages alone
+            message_offset: Length of the thread's message log at this checkpoint
+                (None when messages are stored inline)
+            is_latest: Whether this is now the thread's newest checkpoint
+        """
+        checkpoint_id = checkpoint_tuple.config["configurable"]["checkpoint_id"]
+        key = (thread_id, checkpoint_ns, checkpoint_id)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old["size"]
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = {
+                "tuple": checkpoint_tuple,
+                "size": size,
+                "message_bytes": message_bytes,
+                "message_offset": message_offset
+            }
+            self._bytes += size
+            if is_latest:
+                self._latest[(thread_id, checkpoint_ns)] = checkpoint_id
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                (evicted_thread, evicted_ns, evicted_id), evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted["size"]
+                if self._latest.get((evicted_thread, evicted_ns)) == evicted_id:
+                    del self._latest[(evicted_thread, evicted_ns)]
+
+    def invalidate(self, thread_id: str, checkpoint_ns: str, checkpoint_id: Optional[str] = None) -> None:
+        """Drop one checkpoint, or every checkpoint of a thread when no id is given."""
+        with self._lock:
+            if checkpoint_id is None:
+                keys = [k for k in self._entries if k[:2] == (thread_id, checkpoint_ns)]
+                self._latest.pop((thread_id, checkpoint_ns), None)
+            else:
+                keys = [(thread_id, checkpoint_ns, checkpoint_id)]
+            for key in keys:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._bytes -= entry["size"]
+
+    def record_hit(self) -> None:
+        """Count a lookup that passed the Redis version check."""
+        with self._lock:
+            self.hits += 1
+
+    def record_stale(self, thread_id: str, checkpoint_ns: str, checkpoint_id: Optional[str]) -> None:
+        """Count a lookup that failed the version check and drop the stale entry."""
+        with self._lock:
+            self.misses += 1
+        if checkpoint_id is None:
+            self.invalidate(thread_id, checkpoint_ns)
+        else:
+            self.invalidate(thread_id, checkpoint_ns, checkpoint_id)
+
+    @staticmethod
+    def copy_tuple(checkpoint_tuple: CheckpointTuple) -> CheckpointTuple:
+        """Copy a cached tuple so callers can't mutate the cached checkpoint."""
+        return checkpoint_tuple._replace(
+            checkpoint=copy_checkpoint(checkpoint_tuple.checkpoint),
+            pending_writes=list(checkpoint_tuple.pending_writes or [])
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
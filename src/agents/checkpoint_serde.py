@@ -0,0 +1,129 @@
+"""Versioned, optionally compressed encoding for checkpoint blobs stored in Redis."""
+
+import pickle
+import warnings
+from typing import Any, Optional
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+# Optional compression backends
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+class CheckpointSerializer:
+    """Encodes checkpoint records as self-describing binary blobs.
+
+    Every blob starts with a small header::
+
+        b"WRN" | version (1 byte) | compression (1 byte) | type length (1 byte) | serde type
+
+    followed by the payload produced by the wrapped serde (LangGraph's
+    ``JsonPlusSerializer`` by default, which emits msgpack). Payloads larger
+    than ``compress_threshold`` bytes are compressed with zstd or lz4.
+
+    Blobs without the header are treated as legacy pickles written by earlier
+    versions of ``RedisCheckpointSaver``, so existing sessions stay readable.
+    """
+
+    MAGIC = b"WRN"
+    VERSION = 1
+    COMPRESSION_IDS = {None: 0, "zstd": 1, "lz4": 2}
+
+    def __init__(
+        self,
+        serde: Optional[SerializerProtocol] = None,
+        compression: Optional[str] = "zstd",
+        compress_threshold: int = 1024
+    ):
+        """Initialize the serializer.
+
+        Args:
+            serde: LangGraph serializer providing dumps_typed/loads_typed
+            compression: "zstd", "lz4" or None
+            compress_threshold: Minimum payload size in bytes before compressing
+        """
+        if compression not in self.COMPRESSION_IDS:
+            raise ValueError(f"Unsupported checkpoint compression: {compression}")
+        if (compression == "zstd" and zstandard is None) or (compression == "lz4" and lz4_frame is None):
+            warnings.warn(f"{compression} not installed, storing checkpoints uncompressed", RuntimeWarning, stacklevel=2)
+            compression = None
+
+        self.serde = serde or JsonPlusSerializer()
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize an object into a headered blob.
+
+        Args:
+            obj: Checkpoint record or message
+
+        Returns:
+            Encoded blob
+        """
+        type_, payload = self.serde.dumps_typed(obj)
+
+        compression = None
+        if self.compression and len(payload) >= self.compress_threshold:
+            compression = self.compression
+            payload = self._compress(payload, compression)
+
+        type_bytes = type_.encode()
+        header = self.MAGIC + bytes([self.VERSION, self.COMPRESSION_IDS[compression], len(type_bytes)])
+        return header + type_bytes + payload
+
+    def loads(self, blob: bytes) -> Any:
+        """Deserialize a blob written by ``dumps`` or a legacy pickle.
+
+        Args:
+            blob: Encoded blob
+
+        Returns:
+            Decoded object
+        """
+        if not self.is_current(blob):
+            return pickle.loads(blob)
+
+        version, compression_id, type_len = blob[3], blob[4], blob[5]
+        if version > self.VERSION:
+            raise ValueError(f"Checkpoint blob version {version} is newer than supported ({self.VERSION})")
+
+        type_ = blob[6:6 + type_len].decode()
+        payload = blob[6 + type_len:]
+        if compression_id:
+            payload = self._decompress(payload, compression_id)
+        return self.serde.loads_typed((type_, payload))
+
+    @classmethod
+    def is_current(cls, blob: bytes) -> bool:
+        """Whether a blob uses the headered format (as opposed to a legacy pickle)."""
+        return blob[:3] == cls.MAGIC
+
+    @staticmethod
+    def _compress(payload: bytes, compression: str) -> bytes:
+        """Compress a payload with the named codec."""
+        if compression == "zstd":
+            return zstandard.ZstdCompressor().compress(payload)
+        return lz4_frame.compress(payload)
+
+    @staticmethod
+    def _decompress(payload: bytes, compression_id: int) -> bytes:
+        """Decompress a payload given the codec id stored in its header."""
+        if compression_id == 1:
+            if zstandard is None:
+                raise ValueError("Checkpoint blob is zstd-compressed but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        if compression_id == 2:
+            if lz4_frame is None:
+                raise ValueError("Checkpoint blob is lz4-compressed but lz4 is not installed")
+            return lz4_frame.decompress(payload)
+        raise ValueError(f"Unknown checkpoint compression id: {compression_id}")
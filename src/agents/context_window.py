@@ -0,0 +1,162 @@
+"""Token-budgeted conversation context for question generation."""
+
+import re
+from typing import List, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage, HumanMessage
+
+# CJK characters are roughly one token each; other text about four characters per token
+_CJK_CHARS = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]")
+
+# Token caps for one message once it is folded into the running summary
+SUMMARY_ANSWER_TOKENS = 60
+SUMMARY_QUESTION_TOKENS = 30
+
+# Marker left at the top of a summary whose oldest lines were dropped
+SUMMARY_TRIMMED = "(earlier turns omitted)"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text without calling a tokenizer.
+
+    Args:
+        text: Any text
+
+    Returns:
+        Approximate number of tokens
+    """
+    cjk = len(_CJK_CHARS.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def clip_to_tokens(text: str, max_tokens: int) -> str:
+    """Shorten a text to about ``max_tokens`` tokens, marking the cut.
+
+    Args:
+        text: Text to shorten
+        max_tokens: Token budget for the result
+
+    Returns:
+        The text itself if it fits, otherwise its head followed by "…"
+    """
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+    return text[:max(0, len(text) * max_tokens // tokens - 1)].rstrip() + "…"
+
+
+def recent_window_start(messages: Sequence[BaseMessage], recent_turns: int) -> int:
+    """Index of the first message of the last ``recent_turns`` user turns.
+
+    Args:
+        messages: Conversation history
+        recent_turns: Number of user turns to keep verbatim (<= 0 keeps everything)
+
+    Returns:
+        Index into ``messages``; everything before it can be summarized
+    """
+    if recent_turns <= 0:
+        return 0
+    seen = 0
+    for index in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[index], HumanMessage):
+            seen += 1
+            if seen == recent_turns:
+                return index
+    return 0
+
+
+def fold_into_summary(summary: str, messages: Sequence[BaseMessage], max_tokens: int) -> str:
+    """Append condensed lines for newly folded messages to a running summary.
+
+    Each user answer and interviewer question is clipped to a short line, and
+    the oldest lines are dropped once the summary exceeds ``max_tokens``, so
+    the summary stays bounded however long the interview runs.
+
+    Args:
+        summary: Summary so far ("" for none)
+        messages: Messages leaving the verbatim window, oldest first
+        max_tokens: Token cap for the whole summary
+
+    Returns:
+        Updated summary
+    """
+    lines = summary.split("\n") if summary else []
+    for message in messages:
+        content = str(message.content).strip()
+        if not content:
+            continue
+        if isinstance(message, HumanMessage):
+            lines.append(f"Reader: {clip_to_tokens(content, SUMMARY_ANSWER_TOKENS)}")
+        else:
+            lines.append(f"Interviewer: {clip_to_tokens(content, SUMMARY_QUESTION_TOKENS)}")
+
+    lines = [line for line in lines if line != SUMMARY_TRIMMED]
+    trimmed = False
+    while lines and estimate_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+        trimmed = True
+    if trimmed:
+        lines.insert(0, SUMMARY_TRIMMED)
+    return "\n".join(lines)
+
+
+def fit_messages(messages: List[BaseMessage], max_tokens: int) -> List[BaseMessage]:
+    """Clip the oldest messages of the verbatim window until it fits a budget.
+
+    The newest message is clipped last, so the answer being replied to keeps
+    as much of its text as the budget allows.
+
+    Args:
+        messages: Verbatim window, oldest first
+        max_tokens: Token budget for all of them
+
+    Returns:
+        Messages (copies where clipped) whose estimated total fits the budget
+        as far as clipping allows
+    """
+    sizes = [estimate_tokens(str(message.content)) for message in messages]
+    excess = sum(sizes) - max_tokens
+    if excess <= 0:
+        return messages
+
+    fitted = list(messages)
+    for index, size in enumerate(sizes):
+        if excess <= 0:
+            break
+        keep = max(SUMMARY_QUESTION_TOKENS, size - excess)
+        if keep < size:
+            fitted[index] = messages[index].model_copy(
+                update={"content": clip_to_tokens(str(messages[index].content), keep)}
+            )
+            excess -= size - keep
+    return fitted
+
+
+def split_context(
+    messages: Sequence[BaseMessage], summarized: int, recent_turns: int, fold_turns: int = 1
+) -> Tuple[List[BaseMessage], List[BaseMessage]]:
+    """Split history into messages to fold now and the verbatim window.
+
+    Turns are folded in blocks: nothing is folded until at least
+    ``fold_turns`` user turns have left the last ``recent_turns``, and then
+    all of them are. Between folds the summary stays the same and the window
+    only grows at its end, so consecutive prompts share their prefix.
+
+    Args:
+        messages: Full conversation history
+        summarized: How many leading messages are already in the summary
+        recent_turns: User turns kept verbatim
+        fold_turns: User turns folded at once (<= 1 folds every turn)
+
+    Returns:
+        (messages to fold into the summary, verbatim window)
+    """
+    start = recent_window_start(messages, recent_turns)
+    if summarized > start:
+        # The window only grows backwards if settings changed; never unfold
+        start = summarized
+    pending = messages[summarized:start]
+    if sum(isinstance(message, HumanMessage) for message in pending) < fold_turns:
+        start = summarized
+    return list(messages[summarized:start]), list(messages[start:])
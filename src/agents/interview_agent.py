@@ -1,19 +1,31 @@
+import hashlib
 import json
 import os
+import threading
 import redis
-from typing import TypedDict, Annotated, List, Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypedDict, Annotated, List, Dict, Any, AsyncIterator, Iterator, Optional, Tuple
 from operator import add
-from src.utils.llm_factory import get_llm
+from src.utils.llm_factory import get_llm, warm_up_llm
+from src.utils.token_usage import TokenUsage
 
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, BaseMessage
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.graph import StateGraph, END
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 
 from src.config import settings
 from src.prompts import InterviewPrompts
 from src.tools import ProfileAnalyzerTool, ConversationAnalyzerTool
-from src.agents.redis_checkpointer import RedisCheckpointSaver
+from src.agents.async_redis_checkpointer import AsyncRedisCheckpointSaver, create_async_redis_client
+from src.agents.checkpoint_cache import CheckpointCache
+from src.agents.checkpoint_serde import CheckpointSerializer
+from src.agents.context_window import estimate_tokens, fit_messages, fold_into_summary, split_context
+from src.agents.profile_facets import format_exchange, merge_facets, parse_json_object
+from src.agents.redis_checkpointer import create_redis_client
+from src.agents.redis_health import CircuitBreaker
+from src.agents.sqlite_checkpointer import SQLiteCheckpointSaver
 
 
 class InterviewState(TypedDict):
@@ -22,23 +34,44 @@ class InterviewState(TypedDict):
     messages: Annotated[List[BaseMessage], add]
     turn_count: int
     profile_data: Dict[str, Any]
+    profile_hash: str
     is_complete: bool
     current_analysis: Dict[str, Any]
+    coverage_hits: Dict[str, int]
+    analyzed_messages: int
+    transcript_summary: str
+    summarized_messages: int
+    profile_facets: Dict[str, List[str]]
+    facet_messages: int
 
 
 class InterviewAgent:
     """Literary interview agent using LangGraph and Multi-Model support."""
 
-    def __init__(self, use_redis: bool = True):
+    def __init__(self, use_redis: bool = True, checkpointer: Optional[BaseCheckpointSaver] = None):
         """Initialize the interview agent with dynamic LLM provider.
         
         Args:
-            use_redis: If True, use Redis for persistent checkpointing. 
-                      If False, use in-memory checkpointing (development only).
+            use_redis: If False, use in-memory checkpointing instead of Redis
+                      (development only). CHECKPOINT_BACKEND=sqlite or memory
+                      selects that backend either way.
+            checkpointer: Checkpointer to use instead of building one from settings
+                (e.g. a store injected by the hosting runtime); ``use_redis`` is then ignored
         """
         settings.validate()
 
         self.llm = get_llm(mode="interview")
+        if settings.llm_warmup:
+            # Open the API connections while the user reads the first question
+            warm_up_llm()
+
+        # Prompt/cached token counters of this agent's LLM calls
+        self.token_usage = TokenUsage()
+
+        # Background facet extractions (PROFILE_FACETS), one in flight per thread
+        self._facet_jobs: Dict[str, Future] = {}
+        self._facet_jobs_lock = threading.Lock()
+        self._facet_executor: Optional[ThreadPoolExecutor] = None
 
         # Initialize tools
         self.profile_analyzer = ProfileAnalyzerTool()
@@ -47,41 +80,93 @@ class InterviewAgent:
         # Build the graph
         self.graph = self._build_graph()
         
-        # Initialize checkpointer (Redis or in-memory)
-        self.checkpointer = self._init_checkpointer(use_redis)
+        # Initialize checkpointer (injected, Redis/SQLite or in-memory)
+        self.checkpointer = checkpointer if checkpointer is not None else self._init_checkpointer(use_redis)
         self.app = self.graph.compile(checkpointer=self.checkpointer)
 
     def _init_checkpointer(self, use_redis: bool):
         """Initialize the appropriate checkpointer based on configuration.
         
         Args:
-            use_redis: Whether to use Redis or in-memory checkpointing
+            use_redis: Whether the redis backend uses Redis or falls back to memory;
+                CHECKPOINT_BACKEND=sqlite and memory do not depend on it
             
         Returns:
-            Checkpointer instance (RedisSaver or MemorySaver)
+            Checkpointer instance (AsyncRedisCheckpointSaver, SQLiteCheckpointSaver or MemorySaver)
         """
+        serializer = CheckpointSerializer(
+            compression=settings.checkpoint_compression,
+            compress_threshold=settings.checkpoint_compress_threshold
+        )
+        
+        if settings.checkpoint_backend == "sqlite":
+            print(f"✓ Using SQLite checkpointing ({settings.sqlite_checkpoint_path})")
+            return SQLiteCheckpointSaver(
+                settings.sqlite_checkpoint_path,
+                serializer=serializer,
+                turn_ends_only=settings.checkpoint_turn_ends_only,
+                keep_last=settings.checkpoint_keep_last or None,
+                ttl=settings.sqlite_ttl or None,
+                completed_ttl=settings.sqlite_completed_ttl,
+                sliding_ttl=settings.sqlite_sliding_ttl,
+                batch_writes=settings.sqlite_batch_writes
+            )
+        
+        if settings.checkpoint_backend == "memory":
+            print("ℹ Using in-memory checkpointing (CHECKPOINT_BACKEND=memory)")
+            return MemorySaver()
+        
         if use_redis and settings.redis_host:
             try:
-                # Create Redis client
-                redis_client = redis.Redis(
+                # Pooled clients with health checks and retries; they reconnect on
+                # their own, so a Redis outage never demotes the agent to memory
+                client_args = dict(
                     host=settings.redis_host,
                     port=settings.redis_port,
                     password=settings.redis_password if settings.redis_password else None,
-                    decode_responses=False,  # LangGraph needs bytes mode
-                    socket_connect_timeout=5,
-                    socket_timeout=5
+                    max_connections=settings.redis_max_connections,
+                    health_check_interval=settings.redis_health_check_interval,
+                    retries=settings.redis_retries,
+                    cluster=settings.redis_cluster
                 )
+                redis_client = create_redis_client(**client_args)
                 
-                # Test connection
-                redis_client.ping()
+                # Async client shares the key layout, so invoke/ainvoke see the same sessions
+                async_client = create_async_redis_client(**client_args)
                 
-                print("✓ Connected to Redis")
-                return RedisCheckpointSaver(redis_client)
+                cache = None
+                if settings.checkpoint_cache_size > 0:
+                    cache = CheckpointCache(
+                        max_entries=settings.checkpoint_cache_size,
+                        max_bytes=settings.checkpoint_cache_max_bytes
+                    )
+                
+                checkpointer = AsyncRedisCheckpointSaver(
+                    async_client,
+                    redis_client,
+                    ttl=settings.redis_ttl,
+                    delta_messages=settings.redis_delta_storage,
+                    serializer=serializer,
+                    cache=cache,
+                    keep_last=settings.checkpoint_keep_last or None,
+                    turn_ends_only=settings.checkpoint_turn_ends_only,
+                    sliding_ttl=settings.redis_sliding_ttl,
+                    completed_ttl=settings.redis_completed_ttl,
+                    breaker=CircuitBreaker(
+                        failure_threshold=settings.redis_circuit_failures,
+                        reset_timeout=settings.redis_circuit_reset
+                    )
+                )
+                
+                # Test connection (startup is not blocked if Redis is briefly down)
+                try:
+                    redis_client.ping()
+                    print("✓ Connected to Redis")
+                except redis.exceptions.ConnectionError as e:
+                    print(f"⚠ Redis not reachable yet: {e}")
+                    print("⚠ Sessions will be saved once Redis is back")
+                return checkpointer
                 
-            except redis.exceptions.ConnectionError as e:
-                print(f"⚠ Redis connection failed: {e}")
-                print("⚠ Falling back to in-memory checkpointing")
-                return MemorySaver()
             except Exception as e:
                 print(f"⚠ Redis initialization failed: {e}")
                 print("⚠ Falling back to in-memory checkpointing")
@@ -99,8 +184,16 @@ class InterviewAgent:
 
         # Add nodes
         workflow.add_node("analyze", self._analyze_node)
-        workflow.add_node("generate_question", self._generate_question_node)
-        workflow.add_node("generate_profile", self._generate_profile_node)
+        # LLM nodes carry an async twin so ainvoke/astream await the model
+        # instead of blocking a worker thread per call
+        workflow.add_node(
+            "generate_question",
+            RunnableLambda(self._generate_question_node, afunc=self._agenerate_question_node)
+        )
+        workflow.add_node(
+            "generate_profile",
+            RunnableLambda(self._generate_profile_node, afunc=self._agenerate_profile_node)
+        )
 
         # Define edges
         workflow.set_entry_point("analyze")
@@ -117,54 +210,86 @@ class InterviewAgent:
 
         return workflow
 
-    def _analyze_node(self, state: InterviewState) -> InterviewState:
-        """Analyze current conversation state."""
-        
-        def normalize_role(msg_type):
-            if msg_type == "human": return "user"
-            if msg_type == "ai": return "assistant"
-            return msg_type
-
-        conversation = [
-            {"role": normalize_role(msg.type), "content": msg.content} 
-            for msg in state["messages"]
-        ]
+    def _analyze_node(self, state: InterviewState, config: RunnableConfig) -> InterviewState:
+        """Analyze the messages added since the previous turn.
 
-        # Analyze conversation progress
-        conv_analysis = self.conversation_analyzer._run(conversation)
+        Coverage counters and the turn count are carried in the state, so only
+        the newest messages are scanned; ``analyzed_messages`` marks how far the
+        history has been analyzed. With PROFILE_FACETS, this is also where facet
+        extraction is collected and started (see ``_collect_facets``).
+        """
+        messages = state["messages"]
+        analyzed = state.get("analyzed_messages", 0)
+        coverage_hits = state.get("coverage_hits") or {}
+        turn_count = state.get("turn_count", 0)
+        if analyzed == 0 or analyzed > len(messages):
+            # New session, history predating the counters, or a replaced history
+            analyzed, coverage_hits, turn_count = 0, {}, 0
 
-        # Analyze conversation progress
-        conv_analysis = self.conversation_analyzer._run(conversation)
+        new_user_messages = [msg.content for msg in messages[analyzed:] if isinstance(msg, HumanMessage)]
+        conv_analysis = self.conversation_analyzer.update(coverage_hits, turn_count, new_user_messages)
+        coverage_hits = conv_analysis.pop("coverage_hits")
 
         # Analyze last user response if exists
-        user_messages = [msg for msg in state["messages"] if isinstance(msg, HumanMessage)]
-        if user_messages:
-            last_response = user_messages[-1].content
-            response_analysis = self.profile_analyzer._run(last_response, conversation)
-            conv_analysis["response_analysis"] = response_analysis
+        if new_user_messages:
+            conv_analysis["response_analysis"] = self.profile_analyzer._run(new_user_messages[-1])
+        elif "response_analysis" in state.get("current_analysis", {}):
+            conv_analysis["response_analysis"] = state["current_analysis"]["response_analysis"]
 
-        return {
-            **state,
+        # Return only the changed channels: echoing "messages" back would append them again
+        update = {
             "turn_count": conv_analysis["turn_count"],
             "current_analysis": conv_analysis,
+            "coverage_hits": coverage_hits,
+            "analyzed_messages": len(messages),
         }
+        if settings.profile_facets:
+            continuing = self._should_continue({**state, **update}) == "continue"
+            thread_id = config.get("configurable", {}).get("thread_id", "default")
+            update.update(self._collect_facets(state, thread_id, continuing))
+        return update
+
+    def _question_messages(self, state: InterviewState) -> Tuple[List[BaseMessage], Dict[str, Any]]:
+        """Build the LLM input for the next interview question.
+
+        The last ``context_recent_turns`` user turns are sent verbatim; older
+        turns are folded (``context_fold_turns`` at a time) into the running
+        ``transcript_summary`` so the prompt stays within ``context_token_budget``.
+
+        The messages are laid out so consecutive turns share the longest
+        possible prefix, which providers with prompt caching (OpenAI, Moonshot,
+        Gemini) bill and prefill at a discount: the static system prompt first,
+        then the summary, which only changes on a fold, the transcript, which
+        only grows between folds, and the turn-specific notes (turn count,
+        analysis) last.
 
-    def _generate_question_node(self, state: InterviewState) -> InterviewState:
-        """Generate next interview question."""
-        # Build system prompt with context
-        system_prompt = InterviewPrompts.get_system_prompt(state["turn_count"])
-
-        # Add analysis context if available
-        if state.get("current_analysis"):
-            analysis = state["current_analysis"]
-            system_prompt += f"\n\nCURRENT ANALYSIS:\n"
-            system_prompt += f"- Turn count: {analysis.get('turn_count', 0)}\n"
-            system_prompt += f"- Coverage: {analysis.get('coverage_score', 0)}\n"
-            if "response_analysis" in analysis:
-                system_prompt += f"- Response style: {analysis['response_analysis'].get('analysis', '')}\n"
-
-        # Filter out empty messages
-        valid_messages = [msg for msg in state["messages"] if msg.content.strip()]
+        Returns:
+            (messages for the LLM, state update for the summary fields)
+        """
+        system_prompt = InterviewPrompts.get_system_prompt()
+        turn_notes = InterviewPrompts.get_turn_notes(state["turn_count"], state.get("current_analysis"))
+
+        # Fold turns that left the verbatim window into the running summary
+        messages = state["messages"]
+        summary = state.get("transcript_summary", "")
+        summarized = state.get("summarized_messages", 0)
+        if summarized > len(messages):
+            summary, summarized = "", 0
+        folded, window = split_context(
+            messages, summarized, settings.context_recent_turns, settings.context_fold_turns
+        )
+        if folded:
+            summary = fold_into_summary(summary, folded, settings.context_summary_tokens)
+            summarized += len(folded)
+        context_update = {"transcript_summary": summary, "summarized_messages": summarized}
+
+        if summary:
+            system_prompt += f"\n\nEARLIER IN THIS INTERVIEW (condensed):\n{summary}\n"
+
+        # Filter out empty messages, then clip the window to what the budget leaves
+        valid_messages = [msg for msg in window if msg.content.strip()]
+        available = settings.context_token_budget - estimate_tokens(system_prompt) - estimate_tokens(turn_notes)
+        valid_messages = fit_messages(valid_messages, max(available, 0))
         
         # [FIX] Merge System Prompt into the first HumanMessage
         # This prevents the "Consecutive User Messages" error in Gemini/VertexAI
@@ -185,29 +310,126 @@ class InterviewAgent:
             # Fallback: Prepend SystemMessage if history is empty or starts with AI
             final_messages = [SystemMessage(content=system_prompt)] + valid_messages
 
+        # Turn notes go after the user's latest answer (in the same message, for the same
+        # Gemini reason). Unless this turn folds into the summary or clips the window, the
+        # prompt then starts with the last turn's prompt up to the end of its answer
+        if isinstance(final_messages[-1], HumanMessage):
+            final_messages[-1] = HumanMessage(content=f"{final_messages[-1].content}\n\n---\n\n{turn_notes}")
+        else:
+            final_messages.append(HumanMessage(content=turn_notes))
+
         # DEBUG: Log conversation length
         if os.getenv("DEBUG_MODE", "false").lower() == "true":
             print(f"DEBUG: Sending {len(final_messages)} messages to LLM")
 
-        # Generate next question
-        response = self.llm.invoke(final_messages)
-        
+        return final_messages, context_update
+
+    def _record_usage(self, purpose: str, response: BaseMessage) -> None:
+        """Count a reply's prompt tokens, and how many the provider served from its prompt cache."""
+        prompt_tokens, cached_tokens = self.token_usage.record(purpose, response)
+        if os.getenv("DEBUG_MODE", "false").lower() == "true":
+            print(f"DEBUG: {purpose} prompt tokens: {prompt_tokens} ({cached_tokens} cached)")
+
+    @staticmethod
+    def _question_update(state: InterviewState, response: BaseMessage, context_update: Dict[str, Any]) -> InterviewState:
+        """Turn the LLM's reply into the question node's state update."""
         # Extract reasoning content if available
         reasoning_content = None
         if hasattr(response, 'additional_kwargs'):
             reasoning_content = response.additional_kwargs.get('reasoning_content', None)
         
-        ai_message = AIMessage(content=response.content)
+        # Keep the model's message id: message streaming then recognizes this as the
+        # message it already streamed instead of stamping a fresh id on it
+        ai_message = AIMessage(content=response.content, id=response.id)
         if reasoning_content:
             ai_message.additional_kwargs = {'reasoning_content': reasoning_content}
 
+        # Only the changed channels
         return {
-            **state,
+            **context_update,
             "messages": [ai_message],
         }
 
-    def _generate_profile_node(self, state: InterviewState) -> InterviewState:
-        """Generate final profile from conversation."""
+    def _generate_question_node(self, state: InterviewState) -> InterviewState:
+        """Generate next interview question."""
+        messages, context_update = self._question_messages(state)
+        response = self.llm.invoke(messages)
+        self._record_usage("question", response)
+        return self._question_update(state, response, context_update)
+
+    async def _agenerate_question_node(self, state: InterviewState) -> InterviewState:
+        """Async counterpart of ``_generate_question_node`` (used by ``ainvoke``/``astream``)."""
+        messages, context_update = self._question_messages(state)
+        response = await self.llm.ainvoke(messages)
+        self._record_usage("question", response)
+        return self._question_update(state, response, context_update)
+
+    @staticmethod
+    def _transcript_hash(messages: List[BaseMessage], completion_status: str = "complete") -> str:
+        """Hash of the reader's answers and how the interview ended; the profile only changes when they do."""
+        digest = hashlib.sha256(completion_status.encode("utf-8") + b"\0")
+        for msg in messages:
+            if isinstance(msg, HumanMessage):
+                digest.update(str(msg.content).encode("utf-8"))
+                digest.update(b"\0")
+        return digest.hexdigest()
+
+    @staticmethod
+    def _profile_metadata(state: InterviewState, completion_status: str) -> Dict[str, Any]:
+        """Interview metadata given to the profile prompt and stored with the profile."""
+        return {
+            "turn_count": state.get("turn_count", 0),
+            "completion_status": completion_status,
+            "early_termination": completion_status != "complete",
+        }
+
+    @staticmethod
+    def _stored_metadata(state: InterviewState, completion_status: str) -> Dict[str, Any]:
+        """``_metadata`` entry stored with a profile."""
+        metadata = InterviewAgent._profile_metadata(state, completion_status)
+        return {
+            "interview_turns": metadata["turn_count"],
+            "completion_status": metadata["completion_status"],
+            "early_termination": metadata["early_termination"],
+        }
+
+    @staticmethod
+    def _insufficient_profile(state: Dict[str, Any], completion_status: str) -> Optional[Dict[str, Any]]:
+        """Profile returned without an LLM call when the reader has not answered anything yet.
+
+        Covers unknown or empty threads too (e.g. quitting before the first turn).
+        """
+        if any(isinstance(msg, HumanMessage) for msg in state.get("messages", [])):
+            return None
+        return {
+            "error": "Insufficient data: the interview has no answers yet",
+            "_metadata": InterviewAgent._stored_metadata(state, completion_status),
+        }
+
+    def _cached_profile(self, state: InterviewState, completion_status: str = "complete") -> Optional[Dict[str, Any]]:
+        """State update reusing the stored profile if neither the answers nor the completion status changed since."""
+        profile_data = state.get("profile_data") or {}
+        if profile_data and not profile_data.get("error") and \
+                state.get("profile_hash") == self._transcript_hash(state.get("messages", []), completion_status):
+            return {"is_complete": completion_status == "complete"}
+        return None
+
+    @staticmethod
+    def _profile_messages(state: InterviewState, completion_status: str = "complete") -> List[BaseMessage]:
+        """Build the LLM input for the final profile."""
+        metadata_note = InterviewPrompts.get_metadata_note(
+            InterviewAgent._profile_metadata(state, completion_status)
+        )
+        # With facets gathered during the interview, only reconcile them with the
+        # turns they do not cover yet instead of re-reading the whole transcript
+        facets = state.get("profile_facets")
+        if facets:
+            pending = state["messages"][state.get("facet_messages", 0):]
+            reconcile_prompt = InterviewPrompts.get_reconcile_prompt(
+                json.dumps(facets, ensure_ascii=False), format_exchange(pending)
+            )
+            return [SystemMessage(content=reconcile_prompt + metadata_note)]
+
         # Build conversation transcript
         conversation = "\n".join(
             [
@@ -219,18 +441,16 @@ class InterviewAgent:
 
         # Generate profile with higher token limit for JSON output
         summary_prompt = InterviewPrompts.get_summary_prompt(conversation)
-        
-        # [FIX] Use factory instead of manual instantiation to avoid attribute errors
-        # 原本的寫法會因為 ChatOpenAI 沒有 .api_key 屬性而崩潰
-        profile_llm = get_llm(mode="profile")
-        
-        messages = [SystemMessage(content=summary_prompt)]
-        response = profile_llm.invoke(messages)
+        return [SystemMessage(content=summary_prompt + metadata_note)]
 
-        # Parse JSON profile
-        try:
-            profile_data = json.loads(response.content)
-        except json.JSONDecodeError:
+    @staticmethod
+    def _profile_update(
+        state: InterviewState, response: BaseMessage, completion_status: str = "complete"
+    ) -> Dict[str, Any]:
+        """Turn the profile LLM's reply into the profile node's state update."""
+        # Parse JSON profile (also from a ```json block)
+        profile_data = parse_json_object(str(response.content))
+        if profile_data is None:
             # Fallback if JSON parsing fails
             profile_data = {"error": "Failed to parse profile", "raw": response.content}
         
@@ -240,13 +460,101 @@ class InterviewAgent:
             if reasoning:
                 profile_data["_reasoning"] = reasoning
 
+        profile_data["_metadata"] = InterviewAgent._stored_metadata(state, completion_status)
+
         return {
-            **state,
             "profile_data": profile_data,
-            "is_complete": True,
-            "messages": [AIMessage(content=f"Profile generated: {json.dumps(profile_data, indent=2)}")],
+            "profile_hash": InterviewAgent._transcript_hash(state["messages"], completion_status),
+            # An early exit or interrupt keeps the regular TTL and shows as unfinished;
+            # its status stays in the profile's _metadata
+            "is_complete": completion_status == "complete",
+            "messages": [AIMessage(content=f"Profile generated: {json.dumps(profile_data, indent=2)}", id=response.id)],
         }
 
+    def _generate_profile_node(self, state: InterviewState) -> Dict[str, Any]:
+        """Generate final profile from conversation (unless it is already stored)."""
+        cached = self._cached_profile(state)
+        if cached is not None:
+            return cached
+        # [FIX] Use factory instead of manual instantiation to avoid attribute errors
+        # 原本的寫法會因為 ChatOpenAI 沒有 .api_key 屬性而崩潰
+        profile_llm = get_llm(mode="profile")
+        response = profile_llm.invoke(self._profile_messages(state))
+        self._record_usage("profile", response)
+        return self._profile_update(state, response)
+
+    async def _agenerate_profile_node(self, state: InterviewState) -> Dict[str, Any]:
+        """Async counterpart of ``_generate_profile_node``."""
+        cached = self._cached_profile(state)
+        if cached is not None:
+            return cached
+        profile_llm = get_llm(mode="profile")
+        response = await profile_llm.ainvoke(self._profile_messages(state))
+        self._record_usage("profile", response)
+        return self._profile_update(state, response)
+
+    @staticmethod
+    def _facet_messages(facets: Dict[str, List[str]], pending: List[BaseMessage]) -> Optional[List[BaseMessage]]:
+        """Build the facet extraction input for the exchange(s) not yet extracted."""
+        if not any(isinstance(msg, HumanMessage) for msg in pending):
+            return None
+        facet_prompt = InterviewPrompts.get_facet_prompt(
+            json.dumps(facets, ensure_ascii=False), format_exchange(pending)
+        )
+        return [SystemMessage(content=facet_prompt)]
+
+    def _extract_facets(self, messages: List[BaseMessage], start: int, end: int) -> Optional[Tuple[int, int, Dict[str, Any]]]:
+        """Run one facet extraction (in the background pool).
+
+        Returns:
+            ``(start, end, additions)`` for the message range it covers, or None
+            if the call failed or its reply was unreadable
+        """
+        try:
+            response = self.llm.invoke(messages)
+        except Exception as e:
+            print(f"⚠ Facet extraction failed: {e}")
+            return None
+        self._record_usage("facets", response)
+        additions = parse_json_object(str(response.content))
+        if additions is None:
+            print("⚠ Facet extraction returned no JSON; retrying next turn")
+            return None
+        return start, end, additions
+
+    def _collect_facets(self, state: InterviewState, thread_id: str, continuing: bool) -> Dict[str, Any]:
+        """Merge a finished background facet extraction and start the next one.
+
+        Extraction runs in the agent's thread pool while the reader answers the
+        next question, so no turn waits for it. A finished result is merged at
+        the start of a later turn; one still running is left alone, and the
+        answers after it are sent with the next extraction. A failed or lost
+        result (e.g. the next turn ran in another process) leaves
+        ``facet_messages`` in place, so those answers are extracted again.
+        """
+        messages = state["messages"]
+        facets = state.get("profile_facets") or {}
+        covered = state.get("facet_messages", 0)
+        update: Dict[str, Any] = {}
+        with self._facet_jobs_lock:
+            job = self._facet_jobs.get(thread_id)
+            if job is not None and job.done():
+                del self._facet_jobs[thread_id]
+                job, result = None, job.result()
+                # Ignore results for a range the state has moved past (or a replaced history)
+                if result is not None and result[0] == covered and result[1] <= len(messages):
+                    covered, facets = result[1], merge_facets(facets, result[2])
+                    update = {"profile_facets": facets, "facet_messages": covered}
+            if job is None and continuing:
+                facet_messages = self._facet_messages(facets, messages[covered:])
+                if facet_messages is not None:
+                    if self._facet_executor is None:
+                        self._facet_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="facets")
+                    self._facet_jobs[thread_id] = self._facet_executor.submit(
+                        self._extract_facets, facet_messages, covered, len(messages)
+                    )
+        return update
+
     def _should_continue(self, state: InterviewState) -> str:
         """Determine if interview should continue or complete."""
         analysis = state.get("current_analysis", {})
@@ -261,54 +569,67 @@ class InterviewAgent:
 
         return "continue"
 
-    def start_interview(self, thread_id: str = "default") -> Dict[str, Any]:
-        """Start a new interview session."""
-        # Return initial question directly without processing through graph
-        # The graph will start processing when user sends first response
-        config = {"configurable": {"thread_id": thread_id}}
-        
-        # Initialize empty state in checkpointer for this thread
-        initial_state: InterviewState = {
+    @staticmethod
+    def _initial_state() -> InterviewState:
+        """Empty state stored when an interview starts."""
+        return {
             "messages": [],
             "turn_count": 0,
             "profile_data": {},
+            "profile_hash": "",
             "is_complete": False,
             "current_analysis": {},
+            "coverage_hits": {},
+            "analyzed_messages": 0,
+            "transcript_summary": "",
+            "summarized_messages": 0,
+            "profile_facets": {},
+            "facet_messages": 0,
         }
-        
-        # Store initial state
-        self.app.update_state(config, initial_state)
 
+    @staticmethod
+    def _start_result() -> Dict[str, Any]:
+        """Response returned when an interview starts."""
         return {
             "message": InterviewPrompts.INITIAL_QUESTION,
             "turn_count": 0,
             "is_complete": False,
         }
 
-    def send_message(
-        self, user_message: str, thread_id: str = "default"
-    ) -> Dict[str, Any]:
-        """Send a user message and get agent response."""
+    def start_interview(self, thread_id: str = "default") -> Dict[str, Any]:
+        """Start a new interview session."""
+        # Return initial question directly without processing through graph
+        # The graph will start processing when user sends first response
         config = {"configurable": {"thread_id": thread_id}}
+        
+        # Initialize empty state in checkpointer for this thread
+        self.app.update_state(config, self._initial_state())
 
-        # Get current state
-        current_state = self.app.get_state(config)
+        return self._start_result()
+
+    async def astart_interview(self, thread_id: str = "default") -> Dict[str, Any]:
+        """Async counterpart of ``start_interview``."""
+        config = {"configurable": {"thread_id": thread_id}}
+        await self.app.aupdate_state(config, self._initial_state())
+        return self._start_result()
 
-        # Get existing messages and add new user message
-        existing_messages = current_state.values.get("messages", []) if current_state.values else []
+    @staticmethod
+    def _turn_input(user_message: str, values: Optional[Dict[str, Any]]) -> InterviewState:
+        """Build the graph input for one user turn from the session's current values."""
+        values = values or {}
         
         # Add user message to state (append to existing messages)
-        new_state: InterviewState = {
+        return {
             "messages": [HumanMessage(content=user_message)],  # LangGraph will append with Annotated[List, add]
-            "turn_count": current_state.values.get("turn_count", 0) if current_state.values else 0,
-            "profile_data": current_state.values.get("profile_data", {}) if current_state.values else {},
-            "is_complete": current_state.values.get("is_complete", False) if current_state.values else False,
-            "current_analysis": current_state.values.get("current_analysis", {}) if current_state.values else {},
+            "turn_count": values.get("turn_count", 0),
+            "profile_data": values.get("profile_data", {}),
+            "is_complete": values.get("is_complete", False),
+            "current_analysis": values.get("current_analysis", {}),
         }
 
-        # Run graph
-        result = self.app.invoke(new_state, config)
-
+    @staticmethod
+    def _turn_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape the final graph state of a turn into the public response."""
         return {
             "message": result["messages"][-1].content if result.get("messages") else "",
             "turn_count": result.get("turn_count", 0),
@@ -316,20 +637,229 @@ class InterviewAgent:
             "profile_data": result.get("profile_data", {}),
         }
 
-    def get_profile(self, thread_id: str = "default") -> Dict[str, Any]:
-        """Get current profile data for a session."""
+    @staticmethod
+    def _stream_events(chunk: BaseMessage, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Turn one streamed LLM message (chunk) into reasoning/token events."""
+        # Only the interview question is streamed; the profile node produces JSON
+        if metadata.get("langgraph_node") != "generate_question" or not isinstance(chunk, AIMessage):
+            return []
+        events = []
+        reasoning = chunk.additional_kwargs.get("reasoning_content")
+        if reasoning:
+            events.append({"type": "reasoning", "text": reasoning})
+        if isinstance(chunk.content, str) and chunk.content:
+            events.append({"type": "token", "text": chunk.content})
+        return events
+
+    def send_message(
+        self, user_message: str, thread_id: str = "default"
+    ) -> Dict[str, Any]:
+        """Send a user message and get agent response."""
         config = {"configurable": {"thread_id": thread_id}}
+
+        # Get current state
         current_state = self.app.get_state(config)
 
+        # Run graph
+        result = self.app.invoke(self._turn_input(user_message, current_state.values), config)
+
+        return self._turn_result(result)
+
+    async def asend_message(
+        self, user_message: str, thread_id: str = "default"
+    ) -> Dict[str, Any]:
+        """Async counterpart of ``send_message``.
+
+        The LLM nodes await the async model clients, so one event loop can
+        serve many interviews at once without a thread per in-flight call.
+        """
+        config = {"configurable": {"thread_id": thread_id}}
+        current_state = await self.app.aget_state(config)
+        result = await self.app.ainvoke(self._turn_input(user_message, current_state.values), config)
+        return self._turn_result(result)
+
+    def stream_message(
+        self, user_message: str, thread_id: str = "default"
+    ) -> Iterator[Dict[str, Any]]:
+        """Send a user message and stream the agent's reply as it is generated.
+
+        Runs the same graph as ``send_message`` (so the checkpointed state is the
+        same), but yields events while the question is being generated.
+
+        Args:
+            user_message: The user's response
+            thread_id: Session/thread identifier
+
+        Yields:
+            ``{"type": "reasoning", "text": ...}`` and ``{"type": "token", "text": ...}``
+            events as the model produces them, then one ``{"type": "done", ...}``
+            event carrying the same fields ``send_message`` returns
+        """
+        config = {"configurable": {"thread_id": thread_id}}
+        turn_input = self._turn_input(user_message, self.app.get_state(config).values)
+        result: Dict[str, Any] = {}
+        for mode, payload in self.app.stream(turn_input, config, stream_mode=["messages", "values"]):
+            if mode == "values":
+                result = payload
+            else:
+                yield from self._stream_events(*payload)
+        yield {"type": "done", **self._turn_result(result)}
+
+    async def astream_message(
+        self, user_message: str, thread_id: str = "default"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async counterpart of ``stream_message``."""
+        config = {"configurable": {"thread_id": thread_id}}
+        turn_input = self._turn_input(user_message, (await self.app.aget_state(config)).values)
+        result: Dict[str, Any] = {}
+        async for mode, payload in self.app.astream(turn_input, config, stream_mode=["messages", "values"]):
+            if mode == "values":
+                result = payload
+            else:
+                for event in self._stream_events(*payload):
+                    yield event
+        yield {"type": "done", **self._turn_result(result)}
+
+    @staticmethod
+    def _profile_result(summary: Optional[Dict[str, Any]], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Shape a stored summary (preferred) or full state values into ``get_profile``'s response."""
+        if summary is not None:
+            return {
+                "profile_data": summary["profile_data"],
+                "turn_count": summary["turn_count"],
+                "is_complete": summary["is_complete"],
+            }
+        values = values or {}
         return {
-            "profile_data": current_state.values.get("profile_data", {}),
-            "turn_count": current_state.values.get("turn_count", 0),
-            "is_complete": current_state.values.get("is_complete", False),
+            "profile_data": values.get("profile_data", {}),
+            "turn_count": values.get("turn_count", 0),
+            "is_complete": values.get("is_complete", False),
         }
 
-try:
-    _agent_instance = InterviewAgent(use_redis=True)
-    graph_app = _agent_instance.app
-except Exception as e:
-    print(f"Warning: Could not initialize graph_app for export: {e}")
-    graph_app = None
+    def get_profile(self, thread_id: str = "default") -> Dict[str, Any]:
+        """Get current profile data for a session."""
+        # Persistent checkpointers keep a small summary, so no checkpoint has to be decoded
+        if hasattr(self.checkpointer, "get_summary"):
+            summary = self.checkpointer.get_summary(thread_id)
+            if summary is not None:
+                return self._profile_result(summary)
+
+        config = {"configurable": {"thread_id": thread_id}}
+        current_state = self.app.get_state(config)
+
+        return self._profile_result(None, current_state.values)
+
+    def generate_profile(self, thread_id: str = "default", completion_status: str = "complete") -> Dict[str, Any]:
+        """Get the session's profile, generating it only if the answers changed since it was stored.
+
+        When the interview completes inside the graph, ``generate_profile`` has
+        already stored the profile and this only reads it back. Otherwise (early
+        exit, interrupt) the profile is generated once and saved to the session,
+        so ``get_profile`` returns the same result.
+
+        Args:
+            thread_id: Session ID
+            completion_status: "complete", "early_exit" or "interrupted" (anything
+                but "complete" tells the model the interview ended early)
+
+        Returns:
+            Profile data (with an "error" key if the reply could not be parsed, or
+            if the session has no answers yet; nothing is generated or stored then)
+        """
+        config = {"configurable": {"thread_id": thread_id}}
+        values = self.app.get_state(config).values
+        insufficient = self._insufficient_profile(values, completion_status)
+        if insufficient is not None:
+            return insufficient
+        if self._cached_profile(values, completion_status) is not None:
+            return values["profile_data"]
+
+        profile_llm = get_llm(mode="profile")
+        response = profile_llm.invoke(self._profile_messages(values, completion_status))
+        self._record_usage("profile", response)
+        update = self._profile_update(values, response, completion_status)
+        self.app.update_state(config, update, as_node="generate_profile")
+        return update["profile_data"]
+
+    async def agenerate_profile(self, thread_id: str = "default", completion_status: str = "complete") -> Dict[str, Any]:
+        """Async counterpart of ``generate_profile``."""
+        config = {"configurable": {"thread_id": thread_id}}
+        values = (await self.app.aget_state(config)).values
+        insufficient = self._insufficient_profile(values, completion_status)
+        if insufficient is not None:
+            return insufficient
+        if self._cached_profile(values, completion_status) is not None:
+            return values["profile_data"]
+
+        profile_llm = get_llm(mode="profile")
+        response = await profile_llm.ainvoke(self._profile_messages(values, completion_status))
+        self._record_usage("profile", response)
+        update = self._profile_update(values, response, completion_status)
+        await self.app.aupdate_state(config, update, as_node="generate_profile")
+        return update["profile_data"]
+
+    def get_token_usage(self) -> Dict[str, Any]:
+        """Get prompt and cached prompt token counts per call purpose (question, facets, profile).
+
+        ``cache_rate`` is the fraction of prompt tokens the provider read from its
+        prompt cache; it stays 0 for providers that do not report cached tokens.
+        """
+        return self.token_usage.stats()
+
+    def get_facets(self, thread_id: str = "default") -> Dict[str, List[str]]:
+        """Get the profile facets accumulated so far (empty unless PROFILE_FACETS is on)."""
+        config = {"configurable": {"thread_id": thread_id}}
+        return self.app.get_state(config).values.get("profile_facets") or {}
+
+    async def aget_profile(self, thread_id: str = "default") -> Dict[str, Any]:
+        """Async counterpart of ``get_profile``."""
+        if hasattr(self.checkpointer, "aget_summary"):
+            summary = await self.checkpointer.aget_summary(thread_id)
+            if summary is not None:
+                return self._profile_result(summary)
+
+        config = {"configurable": {"thread_id": thread_id}}
+        current_state = await self.app.aget_state(config)
+
+        return self._profile_result(None, current_state.values)
+
+def create_graph_app(checkpointer: Optional[BaseCheckpointSaver] = None):
+    """Build a compiled interview graph for a hosting runtime.
+
+    Args:
+        checkpointer: Checkpointer supplied by the host; if None, the one
+            configured in settings (Redis, SQLite or in-memory) is used
+
+    Returns:
+        Compiled LangGraph app
+    """
+    return InterviewAgent(use_redis=True, checkpointer=checkpointer).app
+
+
+_graph_app = None
+_graph_app_lock = threading.Lock()
+
+
+def get_graph_app():
+    """Compiled graph behind the ``graph_app`` export, built on first use.
+
+    Returns:
+        Compiled LangGraph app, or None if it could not be initialized (retried on next access)
+    """
+    global _graph_app
+    if _graph_app is None:
+        with _graph_app_lock:
+            if _graph_app is None:
+                try:
+                    _graph_app = create_graph_app()
+                except Exception as e:
+                    print(f"Warning: Could not initialize graph_app for export: {e}")
+    return _graph_app
+
+
+def __getattr__(name: str):
+    # ``graph_app`` (the charm entry point) is resolved lazily, so importing this
+    # module does not validate settings, build LLM clients or connect to Redis
+    if name == "graph_app":
+        return get_graph_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
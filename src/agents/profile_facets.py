@@ -0,0 +1,79 @@
+"""Partial profile facets accumulated turn by turn during an interview."""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+# Facet lists kept in state; each extraction returns additions to some of them
+FACET_FIELDS = (
+    "loves",
+    "hates",
+    "genres",
+    "style_hints",
+    "narrative_desires",
+    "themes",
+    "consumption_hints",
+)
+
+# Upper bound on entries per facet list, so the state and reconcile prompt stay small
+MAX_FACET_ENTRIES = 20
+
+
+def parse_json_object(content: str) -> Optional[Dict[str, Any]]:
+    """Parse a JSON object from an LLM reply, also inside a ```json block.
+
+    Args:
+        content: Raw reply text
+
+    Returns:
+        Parsed dict, or None if no JSON object could be read
+    """
+    if "```json" in content:
+        start = content.find("```json") + 7
+        content = content[start:content.find("```", start)]
+    try:
+        parsed = json.loads(content.strip())
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def merge_facets(facets: Dict[str, List[str]], additions: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Merge newly extracted facet entries into the accumulated ones.
+
+    Entries are de-duplicated case-insensitively, keep their first-seen order
+    and each list is capped at ``MAX_FACET_ENTRIES``.
+
+    Args:
+        facets: Facets accumulated so far
+        additions: Extraction result (unknown keys and non-string entries are ignored)
+
+    Returns:
+        New merged facets dict
+    """
+    merged = {field: list(facets.get(field, [])) for field in FACET_FIELDS}
+    for field in FACET_FIELDS:
+        values = additions.get(field) or []
+        if isinstance(values, str):
+            values = [values]
+        seen = {entry.lower() for entry in merged[field]}
+        for value in values:
+            if not isinstance(value, str) or not value.strip() or value.strip().lower() in seen:
+                continue
+            if len(merged[field]) >= MAX_FACET_ENTRIES:
+                break
+            merged[field].append(value.strip())
+            seen.add(value.strip().lower())
+    return merged
+
+
+def format_exchange(messages: Sequence[BaseMessage]) -> str:
+    """Format interview messages as an INTERVIEWER/USER transcript."""
+    lines = []
+    for message in messages:
+        if isinstance(message, SystemMessage) or not str(message.content).strip():
+            continue
+        role = "USER" if isinstance(message, HumanMessage) else "INTERVIEWER"
+        lines.append(f"{role}: {message.content}")
+    return "\n\n".join(lines)
@@ -2,7 +2,6 @@
 
 import json
 from typing import Dict, Any, List
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 from src.utils.llm_factory import get_llm
 
@@ -43,11 +42,7 @@ class ProfileGeneratorAgent:
         
         # Add metadata context if available
         if metadata:
-            system_prompt += f"\n\nINTERVIEW METADATA:\n"
-            system_prompt += f"- Total turns: {metadata.get('turn_count', 'unknown')}\n"
-            system_prompt += f"- Completion status: {metadata.get('completion_status', 'unknown')}\n"
-            if metadata.get('early_termination'):
-                system_prompt += "- Note: Interview ended early, extrapolate carefully from available data\n"
+            system_prompt += InterviewPrompts.get_metadata_note(metadata)
         
         # Generate profile
         messages = [SystemMessage(content=system_prompt)]
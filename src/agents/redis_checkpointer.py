@@ -1,49 +1,347 @@
 """Custom Redis checkpointer for LangGraph state persistence."""
 
-import pickle
-from typing import Optional, Any, Dict, Sequence, Tuple
+import hashlib
+from datetime import datetime
+from typing import Optional, Any, Dict, List, Sequence, Tuple, Union
 import redis
-from langgraph.checkpoint.base import BaseCheckpointSaver, Checkpoint, CheckpointTuple
+from redis.backoff import ExponentialBackoff
+from redis.cluster import RedisCluster
+from redis.retry import Retry
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    Checkpoint,
+    CheckpointTuple,
+    copy_checkpoint,
+    writes_sort_key,
+)
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
+from src.agents.checkpoint_cache import CheckpointCache
+from src.agents.checkpoint_serde import CheckpointSerializer
+from src.agents.redis_health import CircuitBreaker, RedisMetrics, guarded, pool_stats
+from src.agents.session_summary import build_summary, parse_summary
+
+
+# Channel stored in the per-thread append-only log when delta storage is enabled
+MESSAGES_CHANNEL = "messages"
+
+# Channel whose truthy value marks a session as finished (selects completed_ttl)
+COMPLETED_CHANNEL = "is_complete"
+
+# Append to the message log only if it still ends where the parent checkpoint
+# left it; returns -1 when another writer or a forked history got there first.
+# Used on cluster clients, whose pipelines cannot WATCH the log (see _execute_put).
+APPEND_MESSAGES_SCRIPT = """
+if redis.call('LLEN', KEYS[1]) ~= tonumber(ARGV[1]) then
+    return -1
+end
+local length = redis.call('RPUSH', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return length
+"""
+
+# Resolve a checkpoint and everything needed to rebuild it in one round-trip.
+# KEYS: latest pointer, index, message log, summary. ARGV: key prefix, checkpoint id
+# ('' for latest), sliding-TTL flag. Returns {blob, writes, log} with only the
+# part of the log the checkpoint covers (its offset is kept in the latest pointer),
+# {blob, writes} for an older checkpoint whose offset is only in its blob, just
+# {blob} for a legacy "latest" key that still holds a full blob, or nil if missing.
+# Same-slot assumption: the checkpoint and writes keys are built from ARGV[1]
+# because the latest id is only known server-side, so they are not in KEYS. This
+# is only valid because every key of a thread shares its {thread_id} hash tag in
+# cluster mode. Servers or proxies that reject undeclared keys need a client-side
+# pointer lookup instead.
+READ_CHECKPOINT_SCRIPT = """
+local id = ARGV[2]
+local ttl = false
+local offset = false
+local kind = redis.call('TYPE', KEYS[1]).ok
+if kind == 'hash' then
+    local pointer = redis.call('HMGET', KEYS[1], 'id', 'ttl', 'offset')
+    if id == '' then
+        id = pointer[1]
+    end
+    ttl = pointer[2]
+    if id == pointer[1] then
+        offset = tonumber(pointer[3])
+    end
+elseif id == '' then
+    if kind ~= 'string' then
+        return nil
+    end
+    return {redis.call('GET', KEYS[1])}
+end
+if not id then
+    return nil
+end
+local blob = redis.call('GET', ARGV[1] .. id)
+if not blob then
+    return nil
+end
+local writes = redis.call('HGETALL', ARGV[1] .. id .. ':writes')
+if ARGV[3] == '1' and ttl then
+    for _, key in ipairs({KEYS[1], KEYS[2], KEYS[3], KEYS[4], ARGV[1] .. id, ARGV[1] .. id .. ':writes'}) do
+        redis.call('EXPIRE', key, ttl)
+    end
+end
+if not offset then
+    return {blob, writes}
+end
+local log = {}
+if offset > 0 then
+    log = redis.call('LRANGE', KEYS[3], 0, offset - 1)
+end
+return {blob, writes, log}
+"""
+
+# Give KEYS[2] the remaining TTL of KEYS[1], or ARGV[1] seconds if KEYS[1] is
+# missing or persistent. Keeps a pending-writes hash expiring with its checkpoint,
+# whatever sliding or completed-session TTL that checkpoint currently has.
+# Writes that arrive after their checkpoint was pruned (the thread's index KEYS[3]
+# already holds a newer id than ARGV[2]) are dropped instead of outliving it.
+MATCH_TTL_SCRIPT = """
+local ttl = redis.call('TTL', KEYS[1])
+if ttl == -2 then
+    local newest = redis.call('ZREVRANGE', KEYS[3], 0, 0)[1]
+    if newest and newest > ARGV[2] then
+        redis.call('DEL', KEYS[2])
+        return 0
+    end
+end
+if ttl <= 0 then
+    ttl = tonumber(ARGV[1])
+end
+redis.call('EXPIRE', KEYS[2], ttl)
+return ttl
+"""
+
+# Number of index entries fetched per round-trip when list() has to filter
+LIST_PAGE_SIZE = 100
+
+# Delete checkpoints superseded by the one just indexed. ARGV[2] is the parent,
+# dropped only if it was the thread's newest checkpoint before this write (so a
+# fork never deletes history); ARGV[3] > 0 trims the index to that many entries.
+# Each dropped checkpoint takes its pending-writes hash with it.
+# Same-slot assumption: the dropped ids come from the index, so their checkpoint and
+# writes keys are built from ARGV[1] instead of being declared in KEYS. This relies
+# on the thread's {thread_id} hash tag, as in READ_CHECKPOINT_SCRIPT.
+PRUNE_CHECKPOINTS_SCRIPT = """
+local removed = 0
+local function drop(id)
+    redis.call('DEL', ARGV[1] .. id, ARGV[1] .. id .. ':writes')
+    redis.call('ZREM', KEYS[1], id)
+    removed = removed + 1
+end
+if ARGV[2] ~= '' then
+    local previous = redis.call('ZREVRANGE', KEYS[1], 1, 1)
+    if previous[1] == ARGV[2] then
+        drop(ARGV[2])
+    end
+end
+local keep = tonumber(ARGV[3])
+if keep > 0 then
+    for _, id in ipairs(redis.call('ZREVRANGE', KEYS[1], keep, -1)) do
+        drop(id)
+    end
+end
+return removed
+"""
+
+
+def create_redis_client(
+    host: str,
+    port: int,
+    password: Optional[str] = None,
+    max_connections: int = 50,
+    timeout: int = 5,
+    health_check_interval: int = 30,
+    retries: int = 3,
+    cluster: bool = False
+) -> Union[redis.Redis, RedisCluster]:
+    """Create a blocking Redis client that survives Redis restarts.
+
+    Connections come from one bounded pool; a connection idle for longer than
+    ``health_check_interval`` seconds is PINGed before reuse, and commands that
+    fail with a connection or timeout error are retried on a fresh connection
+    with exponential backoff. Nothing is contacted until the first command.
+
+    Args:
+        host: Redis host
+        port: Redis port
+        password: Optional Redis password
+        max_connections: Upper bound on open connections for this process
+            (per cluster node in cluster mode)
+        timeout: Seconds to wait for a free connection (also used for socket timeouts)
+        health_check_interval: Idle seconds after which a connection is checked
+            (single instance only; cluster nodes are rediscovered on error instead)
+        retries: Retries per command on connection/timeout errors
+        cluster: Connect to a Redis Cluster through ``host``:``port`` as seed node
+
+    Returns:
+        Redis client
+    """
+    retry = Retry(ExponentialBackoff(cap=1.0, base=0.05), retries)
+    if cluster:
+        return RedisCluster(
+            host=host,
+            port=port,
+            password=password,
+            max_connections=max_connections,
+            socket_connect_timeout=timeout,
+            socket_timeout=timeout,
+            retry=retry
+        )
+    pool = redis.BlockingConnectionPool(
+        host=host,
+        port=port,
+        password=password,
+        max_connections=max_connections,
+        timeout=timeout,
+        socket_connect_timeout=timeout,
+        socket_timeout=timeout,
+        health_check_interval=health_check_interval,
+        retry=retry
+    )
+    return redis.Redis(connection_pool=pool)
+
 
 class RedisCheckpointSaver(BaseCheckpointSaver):
     """Redis-based checkpoint saver for LangGraph.
-    
-    Stores conversation state in Redis with automatic serialization/deserialization.
+
+    Stores conversation state in Redis as versioned, compressed blobs (see
+    ``CheckpointSerializer``); legacy pickled checkpoints are still readable.
     Supports TTL for automatic session cleanup.
+
+    Each checkpoint is written once, in a single MULTI/EXEC together with the
+    thread's index and a small ``latest`` pointer hash holding its id, so the
+    two can never disagree. Reads resolve the pointer server-side.
+
+    Every write also refreshes a small per-thread ``summary`` hash (turn count,
+    completion, coverage, last activity, message count, profile) so status
+    readers like ``get_summary`` never have to decode a checkpoint.
+
+    In cluster mode (enabled automatically for ``RedisCluster`` clients) the
+    thread id inside every key is wrapped in a ``{...}`` hash tag, so all keys
+    of a thread share one slot and the pipelines and Lua scripts above keep
+    working on a sharded deployment (checkpoint writes use a plain pipeline
+    instead of MULTI on cluster clients, see ``_write_pipeline``).
+
+    With ``delta_messages`` enabled, messages are written once to a per-thread
+    Redis list and each checkpoint only records how many of them it contains,
+    so the cost of a write no longer grows with the length of the interview.
+
+    Retention is configurable per saver: ``keep_last`` bounds how many
+    checkpoints a thread keeps, and ``turn_ends_only`` deletes each
+    intermediate checkpoint of a run as soon as its successor is written, so
+    only the state at the end of every turn survives. Superseded checkpoints
+    are removed in the same pipeline as the write.
+
+    An optional ``CheckpointCache`` keeps recently written or read checkpoints
+    in process memory (write-through); reads are served from it after a
+    one-round-trip version check against Redis.
+
+    Every public operation is timed, and an optional ``CircuitBreaker`` makes
+    calls fail fast with ``CircuitOpenError`` while Redis is down instead of
+    each one waiting out its socket timeouts and retries; ``health()`` reports
+    breaker state, latency and pool usage.
     """
 
     def __init__(
         self,
-        redis_client: redis.Redis,
+        redis_client: Optional[redis.Redis],
         namespace: str = "langgraph:checkpoint",
-        ttl: int = 86400  # 24 hours default
+        ttl: int = 86400,  # 24 hours default
+        delta_messages: bool = False,
+        serializer: Optional[CheckpointSerializer] = None,
+        cache: Optional[CheckpointCache] = None,
+        keep_last: Optional[int] = None,
+        turn_ends_only: bool = False,
+        sliding_ttl: bool = False,
+        completed_ttl: Optional[int] = None,
+        cluster_mode: Optional[bool] = None,
+        breaker: Optional[CircuitBreaker] = None
     ):
         """Initialize Redis checkpointer.
-        
+
         Args:
             redis_client: Redis client instance
             namespace: Key prefix for all checkpoints
             ttl: Time-to-live for checkpoints in seconds (default 24h)
+            delta_messages: Store messages in an append-only list instead of
+                inside every checkpoint blob
+            serializer: Blob encoder (defaults to zstd-compressed serde output)
+            cache: Optional in-process LRU for decoded checkpoints
+            keep_last: Maximum checkpoints kept per thread (None keeps all until TTL)
+            turn_ends_only: Delete checkpoints superseded within a run, keeping
+                only the last checkpoint of each turn
+            sliding_ttl: Refresh a session's TTL whenever it is read
+            completed_ttl: TTL for sessions whose ``is_complete`` channel is set
+                (defaults to ``ttl``)
+            cluster_mode: Hash-tag keys by thread id (defaults to True for
+                ``RedisCluster`` clients)
+            breaker: Optional circuit breaker failing calls fast while Redis is down
         """
         super().__init__(serde=JsonPlusSerializer())
+        self.serializer = serializer or CheckpointSerializer(self.serde)
+        self.cache = cache
         self.redis = redis_client
         self.namespace = namespace
         self.ttl = ttl
+        self.delta_messages = delta_messages
+        self.keep_last = keep_last
+        self.turn_ends_only = turn_ends_only
+        self.sliding_ttl = sliding_ttl
+        self.completed_ttl = completed_ttl
+        self.cluster_mode = isinstance(redis_client, RedisCluster) if cluster_mode is None else cluster_mode
+        self.breaker = breaker
+        self.metrics = RedisMetrics()
+        self._append_messages = self._prune_checkpoints = self._read_checkpoint = self._match_ttl = None
+        if redis_client is not None:
+            self._append_messages = redis_client.register_script(APPEND_MESSAGES_SCRIPT)
+            self._prune_checkpoints = redis_client.register_script(PRUNE_CHECKPOINTS_SCRIPT)
+            self._read_checkpoint = redis_client.register_script(READ_CHECKPOINT_SCRIPT)
+            self._match_ttl = redis_client.register_script(MATCH_TTL_SCRIPT)
+
+    @staticmethod
+    def _parse_config(config: Dict[str, Any]) -> Tuple[str, str, Optional[str]]:
+        """Extract (thread_id, checkpoint_ns, checkpoint_id) from a config."""
+        configurable = config.get("configurable", {})
+        return (
+            configurable.get("thread_id", "default"),
+            configurable.get("checkpoint_ns", ""),
+            configurable.get("checkpoint_id")
+        )
+
+    @staticmethod
+    def _checkpoint_config(thread_id: str, checkpoint_ns: str, checkpoint_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Build the config that addresses one stored checkpoint (None if no id)."""
+        if not checkpoint_id:
+            return None
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id
+            }
+        }
+
+    def _thread_part(self, thread_id: str) -> str:
+        """Thread id as it appears in keys: hash-tagged in cluster mode."""
+        return f"{{{thread_id}}}" if self.cluster_mode else thread_id
 
     def _make_key(self, thread_id: str, checkpoint_ns: str = "", checkpoint_id: Optional[str] = None) -> str:
         """Generate Redis key for a checkpoint.
-        
+
         Args:
             thread_id: Session/thread identifier
             checkpoint_ns: Checkpoint namespace
             checkpoint_id: Optional specific checkpoint ID
-            
+
         Returns:
             Redis key string
         """
-        parts = [self.namespace, thread_id]
+        parts = [self.namespace, self._thread_part(thread_id)]
         if checkpoint_ns:
             parts.append(checkpoint_ns)
         if checkpoint_id:
@@ -52,6 +350,676 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
             parts.append("latest")
         return ":".join(parts)
 
+    def _make_thread_key(self, thread_id: str, checkpoint_ns: str, suffix: str) -> str:
+        """Generate Redis key for a per-thread structure (message log, index).
+
+        Args:
+            thread_id: Session/thread identifier
+            checkpoint_ns: Checkpoint namespace
+            suffix: Structure name appended to the key
+
+        Returns:
+            Redis key string
+        """
+        parts = [self.namespace, self._thread_part(thread_id)]
+        if checkpoint_ns:
+            parts.append(checkpoint_ns)
+        parts.append(suffix)
+        return ":".join(parts)
+
+    def _make_messages_key(self, thread_id: str, checkpoint_ns: str = "") -> str:
+        """Generate Redis key for a thread's append-only message log."""
+        return self._make_thread_key(thread_id, checkpoint_ns, "messages")
+
+    def _make_index_key(self, thread_id: str, checkpoint_ns: str = "") -> str:
+        """Generate Redis key for a thread's sorted-set checkpoint index."""
+        return self._make_thread_key(thread_id, checkpoint_ns, "index")
+
+    def _make_summary_key(self, thread_id: str, checkpoint_ns: str = "") -> str:
+        """Generate Redis key for a thread's status summary hash."""
+        return self._make_thread_key(thread_id, checkpoint_ns, "summary")
+
+    def _make_writes_key(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
+        """Generate Redis key for the hash of pending writes attached to a checkpoint."""
+        return self._make_thread_key(thread_id, checkpoint_ns, f"{checkpoint_id}:writes")
+
+    def _ttl_for(self, checkpoint: Checkpoint) -> int:
+        """TTL for a checkpoint, depending on whether its session has completed."""
+        if self.completed_ttl is not None and checkpoint.get("channel_values", {}).get(COMPLETED_CHANNEL):
+            return self.completed_ttl
+        return self.ttl
+
+    def _superseded_parent(self, config: Dict[str, Any], metadata: Dict[str, Any]) -> str:
+        """Parent checkpoint made obsolete by a new one under ``turn_ends_only``.
+
+        Only steps inside a run (``source == "loop"``) supersede their parent;
+        a new input keeps the parent, since that is where the previous turn ended.
+
+        Returns:
+            Parent checkpoint ID, or "" if nothing should be deleted
+        """
+        _, _, parent_id = self._parse_config(config)
+        if self.turn_ends_only and parent_id and metadata.get("source") == "loop":
+            return parent_id
+        return ""
+
+    @staticmethod
+    def _checkpoint_score(checkpoint: Checkpoint) -> float:
+        """Index score for a checkpoint: its creation time as a Unix timestamp."""
+        try:
+            return datetime.fromisoformat(checkpoint["ts"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return datetime.now().timestamp()
+
+    def _offset_from_blob(
+        self, checkpoint_id: Optional[str], serialized: Optional[bytes]
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """Message offset and log digest recorded by a parent checkpoint blob.
+
+        Args:
+            checkpoint_id: Parent checkpoint ID, or None for a thread's first checkpoint
+            serialized: Stored parent blob (None if missing)
+
+        Returns:
+            (message offset, or None if the parent is missing or stored inline;
+            digest of the logged messages, or None if unknown)
+        """
+        if checkpoint_id is None:
+            return 0, None
+        if serialized is None:
+            return None, None
+        data = self.serializer.loads(serialized)
+        return self._logged_offset(data.get("message_offset"), data["checkpoint"]), data.get("message_digest")
+
+    @staticmethod
+    def _message_digest(messages: Sequence[Any], digest: Any = None) -> Any:
+        """Running SHA-256 over the type, id and content of each message.
+
+        Recorded with every delta-stored checkpoint, so a child can tell whether
+        its history still starts with the messages already in the log.
+
+        Args:
+            messages: Messages to hash, oldest first
+            digest: Digest to continue (updated in place), or None to start one
+
+        Returns:
+            The hashlib digest object
+        """
+        digest = digest or hashlib.sha256()
+        for message in messages:
+            digest.update(repr((
+                getattr(message, "type", type(message).__name__),
+                getattr(message, "id", None),
+                getattr(message, "content", message)
+            )).encode("utf-8"))
+            digest.update(b"\0")
+        return digest
+
+    def _cached_log_state(self, parent_entry: Dict[str, Any]) -> Tuple[Optional[int], Optional[str]]:
+        """Message offset and log digest of a cached parent checkpoint."""
+        checkpoint = parent_entry["tuple"].checkpoint
+        offset = self._logged_offset(parent_entry["message_offset"], checkpoint)
+        if not offset:
+            return offset, None
+        messages = checkpoint.get("channel_values", {}).get(MESSAGES_CHANNEL) or []
+        return offset, self._message_digest(messages[:offset]).hexdigest()
+
+    @staticmethod
+    def _logged_offset(message_offset: Optional[int], checkpoint: Checkpoint) -> Optional[int]:
+        """Message offset a child of a checkpoint can extend the log from.
+
+        A checkpoint without a messages channel at all (e.g. a thread's input
+        checkpoint) is stored inline but has logged nothing, so its children
+        start the log at 0.
+
+        Args:
+            message_offset: Offset recorded for the checkpoint, None if stored inline
+            checkpoint: The checkpoint as saved
+
+        Returns:
+            Message offset, or None if children have to be stored inline
+        """
+        if message_offset is None and MESSAGES_CHANNEL not in checkpoint.get("channel_values", {}):
+            return 0
+        return message_offset
+
+    @staticmethod
+    def _strip_messages(
+        checkpoint: Checkpoint,
+        parent_offset: Optional[int],
+        parent_digest: Optional[str] = None
+    ) -> Tuple[Checkpoint, Optional[int], List[Any], Optional[str]]:
+        """Work out which messages a delta-stored checkpoint needs to append.
+
+        The log is append-only, so the checkpoint's messages must start with the
+        ones already logged. If they do not (a ``RemoveMessage``, or a message
+        replaced by id), the digest of that prefix differs from the parent's and
+        the checkpoint is stored inline instead of writing a wrong log.
+
+        Args:
+            checkpoint: Checkpoint about to be saved
+            parent_offset: Message offset of the parent checkpoint
+            parent_digest: Digest of the parent's logged messages (None skips the
+                check, for parents written before digests were recorded)
+
+        Returns:
+            Tuple of (checkpoint without messages, message offset, messages to
+            append, digest of all logged messages). The offset is None when the
+            checkpoint has to be stored inline.
+        """
+        messages = checkpoint.get("channel_values", {}).get(MESSAGES_CHANNEL)
+        if not isinstance(messages, list) or parent_offset is None or parent_offset > len(messages):
+            return checkpoint, None, [], None
+
+        digest = RedisCheckpointSaver._message_digest(messages[:parent_offset])
+        if parent_digest is not None and parent_offset and digest.hexdigest() != parent_digest:
+            return checkpoint, None, [], None
+        RedisCheckpointSaver._message_digest(messages[parent_offset:], digest)
+
+        channel_values = {
+            k: v for k, v in checkpoint["channel_values"].items() if k != MESSAGES_CHANNEL
+        }
+        return (
+            {**checkpoint, "channel_values": channel_values},
+            len(messages),
+            messages[parent_offset:],
+            digest.hexdigest()
+        )
+
+    def _split_messages(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint
+    ) -> Tuple[Checkpoint, Optional[int], int, Optional[str], Optional[Tuple[int, List[bytes]]]]:
+        """Strip the messages from a checkpoint and encode the new ones for the thread's log.
+
+        Nothing is written here: the append is queued with the checkpoint
+        itself (see ``_execute_put``), so a failed write leaves no orphaned log
+        entries. The checkpoint is kept unchanged (inline) whenever the log
+        cannot be extended consistently, e.g. after forking from an older
+        checkpoint or when earlier messages were removed or replaced.
+
+        Args:
+            config: Configuration of the parent checkpoint
+            checkpoint: Checkpoint about to be saved
+
+        Returns:
+            Tuple of (checkpoint to store, message offset or None if inline,
+            approximate encoded size of the logged messages, log digest or None,
+            (parent offset, encoded messages) to append or None)
+        """
+        thread_id, checkpoint_ns, parent_id = self._parse_config(config)
+        parent_entry = self.cache.peek(thread_id, checkpoint_ns, parent_id) if self.cache and parent_id else None
+        if parent_entry is not None:
+            parent_offset, parent_digest = self._cached_log_state(parent_entry)
+            parent_bytes = parent_entry["message_bytes"]
+        else:
+            parent_blob = self.redis.get(self._make_key(thread_id, checkpoint_ns, parent_id)) if parent_id else None
+            (parent_offset, parent_digest), parent_bytes = self._offset_from_blob(parent_id, parent_blob), 0
+
+        return self._encode_split(checkpoint, parent_offset, parent_digest, parent_bytes)
+
+    def _encode_split(
+        self,
+        checkpoint: Checkpoint,
+        parent_offset: Optional[int],
+        parent_digest: Optional[str],
+        parent_bytes: int
+    ) -> Tuple[Checkpoint, Optional[int], int, Optional[str], Optional[Tuple[int, List[bytes]]]]:
+        """Second half of ``_split_messages``, once the parent's log state is known."""
+        stripped, offset, new_messages, digest = self._strip_messages(checkpoint, parent_offset, parent_digest)
+        blobs = [self.serializer.dumps(msg) for msg in new_messages]
+        append = (parent_offset, blobs) if blobs else None
+        return stripped, offset, parent_bytes + sum(len(blob) for blob in blobs), digest, append
+
+    def _serialize_record(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint,
+        metadata: Dict[str, Any],
+        message_offset: Optional[int],
+        message_digest: Optional[str] = None
+    ) -> bytes:
+        """Serialize the stored record for a checkpoint.
+
+        Args:
+            config: Configuration of the parent checkpoint
+            checkpoint: Checkpoint data to save (messages already stripped if delta-stored)
+            metadata: Checkpoint metadata
+            message_offset: Number of logged messages, or None if stored inline
+            message_digest: Digest of the logged messages (see ``_message_digest``)
+
+        Returns:
+            Serialized record
+        """
+        thread_id, checkpoint_ns, parent_id = self._parse_config(config)
+
+        data = {
+            "checkpoint": checkpoint,
+            "metadata": metadata,
+            # Only store serializable config data
+            "config": self._checkpoint_config(thread_id, checkpoint_ns, checkpoint.get("id")),
+            "parent_checkpoint_id": parent_id,
+            "message_offset": message_offset,
+            "message_digest": message_digest
+        }
+        return self.serializer.dumps(data)
+
+    def _write_pipeline(self) -> Any:
+        """Pipeline for one checkpoint write: MULTI/EXEC, or plain on a cluster client.
+
+        ``RedisCluster`` pipelines only support MULTI in recent redis-py
+        releases. A thread's keys share one slot, so without MULTI the
+        commands still run on one node in order, but concurrent readers can
+        see a partially applied write.
+        """
+        return self.redis.pipeline(transaction=not isinstance(self.redis, RedisCluster))
+
+    def _queue_checkpoint_writes(
+        self,
+        pipe: Any,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint: Checkpoint,
+        serialized: bytes,
+        message_offset: Optional[int],
+        superseded_id: str = "",
+        prune_script: Any = None,
+        summary: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Queue every write belonging to one checkpoint on a (sync or async) pipeline.
+
+        Args:
+            pipe: Redis pipeline
+            thread_id: Session/thread identifier
+            checkpoint_ns: Checkpoint namespace
+            checkpoint: Checkpoint being saved
+            serialized: Serialized checkpoint record
+            message_offset: Number of logged messages, or None if stored inline
+            superseded_id: Parent checkpoint to delete (see ``_superseded_parent``)
+            prune_script: Registered PRUNE_CHECKPOINTS_SCRIPT for the pipeline's client
+            summary: Session summary fields (see ``build_summary``)
+        """
+        ttl = self._ttl_for(checkpoint)
+
+        # Store the blob once; latest only points at it
+        pipe.set(self._make_key(thread_id, checkpoint_ns, checkpoint.get("id")), serialized, ex=ttl)
+        latest_key = self._make_key(thread_id, checkpoint_ns)
+        pipe.delete(latest_key)
+        # The pointer also carries the log offset, so reading the latest checkpoint fetches only its messages
+        pipe.hset(latest_key, mapping={"id": checkpoint.get("id"), "ttl": ttl, "offset": message_offset or 0})
+        pipe.expire(latest_key, ttl)
+
+        # Index the checkpoint by time and drop entries whose blobs have expired
+        index_key = self._make_index_key(thread_id, checkpoint_ns)
+        score = self._checkpoint_score(checkpoint)
+        pipe.zadd(index_key, {checkpoint.get("id"): score})
+        pipe.zremrangebyscore(index_key, "-inf", f"({score - max(ttl, self.ttl)}")
+        pipe.expire(index_key, ttl)
+
+        # Apply the retention policy to the checkpoints this one supersedes
+        if prune_script is not None and (superseded_id or self.keep_last):
+            self._queue_script(
+                pipe,
+                prune_script,
+                keys=[index_key],
+                args=[self._make_thread_key(thread_id, checkpoint_ns, ""), superseded_id, self.keep_last or 0]
+            )
+
+        # Keep the log alive as long as the checkpoints that point into it
+        if message_offset is not None:
+            pipe.expire(self._make_messages_key(thread_id, checkpoint_ns), ttl)
+
+        if summary is not None:
+            summary_key = self._make_summary_key(thread_id, checkpoint_ns)
+            pipe.hset(summary_key, mapping=summary)
+            pipe.expire(summary_key, ttl)
+
+    def _read_args(self, thread_id: str, checkpoint_ns: str, checkpoint_id: Optional[str]) -> Dict[str, Any]:
+        """Keys and arguments for READ_CHECKPOINT_SCRIPT."""
+        return {
+            "keys": [
+                self._make_key(thread_id, checkpoint_ns),
+                self._make_index_key(thread_id, checkpoint_ns),
+                self._make_messages_key(thread_id, checkpoint_ns),
+                self._make_summary_key(thread_id, checkpoint_ns)
+            ],
+            "args": [self._make_thread_key(thread_id, checkpoint_ns, ""), checkpoint_id or "", int(self.sliding_ttl)]
+        }
+
+    @staticmethod
+    def _unpack_read(read: List[Any]) -> Tuple[bytes, Optional[List[bytes]], Optional[Dict[bytes, bytes]]]:
+        """Split a READ_CHECKPOINT_SCRIPT reply into (blob, message log, raw writes).
+
+        The log and writes are None for a legacy ``latest`` blob, which has to be
+        completed with ``_queue_tuple_reads``. The log alone is None when the
+        script could not tell the checkpoint's offset (see ``_log_range``).
+        """
+        if len(read) == 1:
+            return read[0], None, None
+        blob, flat_writes, message_log = read if len(read) == 3 else (*read, None)
+        return blob, message_log, dict(zip(flat_writes[::2], flat_writes[1::2], strict=True))
+
+    def _log_range(self, thread_id: str, checkpoint_ns: str, data: Dict[str, Any]) -> Optional[Tuple[str, int, int]]:
+        """(key, start, end) LRANGE arguments for a record's messages, or None if it has none logged."""
+        offset = data.get("message_offset")
+        if not offset:
+            return None
+        return self._make_messages_key(thread_id, checkpoint_ns), 0, offset - 1
+
+    def _queue_script(self, pipe: Any, script: Any, keys: List[str], args: List[Any]) -> None:
+        """Queue a registered Lua script on a (sync or async) pipeline.
+
+        Cluster pipelines can't preload scripts on whichever node owns the
+        slot, so they send the script source instead of its SHA.
+        """
+        if self.cluster_mode:
+            pipe.eval(script.script, len(keys), *keys, *args)
+        else:
+            pipe.scripts.add(script)
+            pipe.evalsha(script.sha, len(keys), *keys, *args)
+
+    def _queue_touch(
+        self,
+        pipe: Any,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        checkpoint: Checkpoint
+    ) -> None:
+        """Queue sliding-TTL refreshes for a checkpoint that was just read and its thread's keys."""
+        ttl = self._ttl_for(checkpoint)
+        for key in (
+            self._make_key(thread_id, checkpoint_ns, checkpoint_id),
+            self._make_key(thread_id, checkpoint_ns),
+            self._make_index_key(thread_id, checkpoint_ns),
+            self._make_messages_key(thread_id, checkpoint_ns),
+            self._make_summary_key(thread_id, checkpoint_ns),
+            self._make_writes_key(thread_id, checkpoint_ns, checkpoint_id)
+        ):
+            pipe.expire(key, ttl)
+
+    def _restore_messages(self, data: Dict[str, Any], message_log: Optional[List[bytes]]) -> Checkpoint:
+        """Rebuild the messages channel of a delta-stored checkpoint from the log.
+
+        Args:
+            data: Deserialized checkpoint record
+            message_log: Prefix of the thread's message log covering the checkpoint
+
+        Returns:
+            Checkpoint with its full message list
+        """
+        checkpoint = data["checkpoint"]
+        offset = data.get("message_offset")
+        if offset is None:
+            return checkpoint
+
+        messages = [self.serializer.loads(item) for item in (message_log or [])[:offset]]
+        channel_values = {**checkpoint.get("channel_values", {}), MESSAGES_CHANNEL: messages}
+        return {**checkpoint, "channel_values": channel_values}
+
+    def _to_tuple(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        data: Dict[str, Any],
+        message_log: Optional[List[bytes]] = None,
+        raw_writes: Optional[Dict[bytes, bytes]] = None
+    ) -> CheckpointTuple:
+        """Build a CheckpointTuple from a deserialized checkpoint record.
+
+        Args:
+            thread_id: Session/thread identifier
+            checkpoint_ns: Checkpoint namespace
+            data: Deserialized checkpoint record
+            message_log: Prefix of the message log, for delta-stored records
+            raw_writes: Contents of the checkpoint's pending-writes hash
+
+        Returns:
+            CheckpointTuple
+        """
+        return CheckpointTuple(
+            config=data["config"],
+            checkpoint=self._restore_messages(data, message_log),
+            metadata=data.get("metadata", {}),
+            parent_config=self._checkpoint_config(thread_id, checkpoint_ns, data.get("parent_checkpoint_id")),
+            pending_writes=self._decode_writes(raw_writes)
+        )
+
+    def _queue_writes(
+        self,
+        pipe: Any,
+        config: Dict[str, Any],
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str,
+        ttl_script: Any = None
+    ) -> None:
+        """Queue a task's pending writes on a (sync or async) pipeline.
+
+        Writes are keyed by task id and write index, so a retried task
+        overwrites nothing it already stored, while special channels
+        (errors, interrupts) always reflect the latest attempt.
+
+        Args:
+            pipe: Redis pipeline
+            config: Configuration of the checkpoint the writes belong to
+            writes: (channel, value) pairs produced by the task
+            task_id: Task identifier
+            task_path: Path of the task that produced the writes
+            ttl_script: Registered MATCH_TTL_SCRIPT for the pipeline's client
+        """
+        thread_id, checkpoint_ns, checkpoint_id = self._parse_config(config)
+        writes_key = self._make_writes_key(thread_id, checkpoint_ns, checkpoint_id)
+
+        for idx, (channel, value) in enumerate(writes):
+            write_idx = WRITES_IDX_MAP.get(channel, idx)
+            field = f"{task_id}:{write_idx}"
+            blob = self.serializer.dumps([task_id, channel, value, task_path, write_idx])
+            if write_idx >= 0:
+                pipe.hsetnx(writes_key, field, blob)
+            else:
+                pipe.hset(writes_key, field, blob)
+        if ttl_script is None:
+            pipe.expire(writes_key, self.ttl)
+            return
+        # Expire with the checkpoint, which may be on a sliding or completed-session TTL.
+        # LangGraph saves task writes in the background, so they can land after a
+        # newer checkpoint already pruned this one under turn_ends_only or keep_last.
+        self._queue_script(
+            pipe,
+            ttl_script,
+            keys=[
+                self._make_key(thread_id, checkpoint_ns, checkpoint_id),
+                writes_key,
+                self._make_index_key(thread_id, checkpoint_ns)
+            ],
+            args=[self.ttl, checkpoint_id]
+        )
+
+    def _decode_writes(self, raw_writes: Optional[Dict[bytes, bytes]]) -> List[Tuple[str, str, Any]]:
+        """Decode a pending-writes hash into LangGraph's (task_id, channel, value) list.
+
+        Args:
+            raw_writes: Contents of the pending-writes hash
+
+        Returns:
+            Pending writes in the order LangGraph applies them
+        """
+        entries = [self.serializer.loads(blob) for blob in (raw_writes or {}).values()]
+        entries.sort(key=lambda e: writes_sort_key(e[3], e[0], e[4]))
+        return [(task_id, channel, value) for task_id, channel, value, _, _ in entries]
+
+    def _decode_page(self, blobs: Sequence[Optional[bytes]], filter: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Deserialize a page of checkpoint blobs, skipping expired ones and applying the filter."""
+        records = [self.serializer.loads(blob) for blob in blobs if blob is not None]
+        if filter:
+            records = [
+                data for data in records
+                if all(data.get("metadata", {}).get(k) == v for k, v in filter.items())
+            ]
+        return records
+
+    @staticmethod
+    def _max_offset(records: Sequence[Dict[str, Any]]) -> int:
+        """Longest message log prefix needed by a set of records."""
+        return max((data.get("message_offset") or 0 for data in records), default=0)
+
+    def _queue_tuple_reads(
+        self,
+        pipe: Any,
+        thread_id: str,
+        checkpoint_ns: str,
+        records: Sequence[Dict[str, Any]]
+    ) -> None:
+        """Queue the reads needed to turn records into tuples: one LRANGE plus one HGETALL per record."""
+        max_offset = self._max_offset(records)
+        if max_offset:
+            pipe.lrange(self._make_messages_key(thread_id, checkpoint_ns), 0, max_offset - 1)
+        for data in records:
+            checkpoint_id = data["config"]["configurable"]["checkpoint_id"]
+            pipe.hgetall(self._make_writes_key(thread_id, checkpoint_ns, checkpoint_id))
+
+    def _split_tuple_reads(
+        self,
+        results: Sequence[Any],
+        records: Sequence[Dict[str, Any]]
+    ) -> List[Tuple[Optional[List[bytes]], Dict[bytes, bytes]]]:
+        """Pair pipeline results from ``_queue_tuple_reads`` with their records."""
+        results = list(results)
+        message_log = results.pop(0) if self._max_offset(records) else None
+        return [(message_log, raw_writes) for raw_writes in results[:len(records)]]
+
+    def _queue_cache_check(
+        self,
+        pipe: Any,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: Optional[str],
+        entry: Dict[str, Any]
+    ) -> None:
+        """Queue the reads that prove a cached checkpoint is still current.
+
+        A request for the latest checkpoint also needs the thread's newest
+        indexed id to match; in both cases the checkpoint must still exist and
+        its pending-writes count must be unchanged.
+        """
+        cached_id = entry["tuple"].config["configurable"]["checkpoint_id"]
+        if checkpoint_id is None:
+            pipe.zrevrange(self._make_index_key(thread_id, checkpoint_ns), 0, 0)
+        pipe.exists(self._make_key(thread_id, checkpoint_ns, cached_id))
+        pipe.hlen(self._make_writes_key(thread_id, checkpoint_ns, cached_id))
+
+    @staticmethod
+    def _cache_check_passes(results: Sequence[Any], checkpoint_id: Optional[str], entry: Dict[str, Any]) -> bool:
+        """Evaluate the pipeline results queued by ``_queue_cache_check``."""
+        results = list(results)
+        cached_tuple = entry["tuple"]
+        if checkpoint_id is None:
+            newest = results.pop(0)
+            newest_id = newest[0].decode() if newest and isinstance(newest[0], bytes) else (newest or [None])[0]
+            if newest_id != cached_tuple.config["configurable"]["checkpoint_id"]:
+                return False
+        exists, writes_count = results[:2]
+        return bool(exists) and writes_count == len(cached_tuple.pending_writes or [])
+
+    def _cache_read(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_tuple: CheckpointTuple,
+        data: Dict[str, Any],
+        serialized: bytes,
+        message_log: Optional[List[bytes]],
+        is_latest: bool
+    ) -> CheckpointTuple:
+        """Cache a checkpoint loaded from Redis and return a caller-owned copy."""
+        message_bytes = sum(len(item) for item in message_log or [])
+        self.cache.put(
+            thread_id,
+            checkpoint_ns,
+            checkpoint_tuple,
+            size=len(serialized) + message_bytes,
+            message_bytes=message_bytes,
+            message_offset=data.get("message_offset"),
+            is_latest=is_latest
+        )
+        return self.cache.copy_tuple(checkpoint_tuple)
+
+    def _cache_write(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint,
+        metadata: Dict[str, Any],
+        serialized: bytes,
+        message_offset: Optional[int],
+        message_bytes: int
+    ) -> None:
+        """Write-through: cache a checkpoint that was just saved as the thread's latest."""
+        thread_id, checkpoint_ns, parent_id = self._parse_config(config)
+        self.cache.put(
+            thread_id,
+            checkpoint_ns,
+            CheckpointTuple(
+                config=self._checkpoint_config(thread_id, checkpoint_ns, checkpoint["id"]),
+                checkpoint=copy_checkpoint(checkpoint),
+                metadata=metadata,
+                parent_config=self._checkpoint_config(thread_id, checkpoint_ns, parent_id),
+                pending_writes=[]
+            ),
+            size=len(serialized) + message_bytes,
+            message_bytes=message_bytes,
+            message_offset=message_offset,
+            is_latest=True
+        )
+
+    def _execute_put(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint: Checkpoint,
+        serialized: bytes,
+        message_offset: Optional[int],
+        append: Optional[Tuple[int, List[bytes]]],
+        superseded_id: str,
+        summary: Dict[str, str]
+    ) -> bool:
+        """Write a checkpoint, and append its new messages to the log, in one pipeline.
+
+        With MULTI/EXEC the log is WATCHed, so the append and the checkpoint are
+        applied together only if the log still ends at the parent's offset.
+        Cluster pipelines cannot WATCH: they queue APPEND_MESSAGES_SCRIPT first
+        in the same pipeline, and the caller overwrites the checkpoint inline if
+        the append was refused.
+
+        Returns:
+            False if the log no longer ends at the parent's offset
+        """
+        messages_key = self._make_messages_key(thread_id, checkpoint_ns)
+        with self._write_pipeline() as pipe:
+            transaction = getattr(pipe, "transaction", False)
+            if append is not None and transaction:
+                pipe.watch(messages_key)
+                if pipe.llen(messages_key) != append[0]:
+                    return False
+                pipe.multi()
+                pipe.rpush(messages_key, *append[1])
+            elif append is not None:
+                self._queue_script(
+                    pipe, self._append_messages, keys=[messages_key],
+                    args=[append[0], self._ttl_for(checkpoint)] + append[1]
+                )
+            self._queue_checkpoint_writes(
+                pipe, thread_id, checkpoint_ns, checkpoint, serialized, message_offset,
+                superseded_id=superseded_id, prune_script=self._prune_checkpoints, summary=summary
+            )
+            try:
+                results = pipe.execute()
+            except redis.exceptions.WatchError:
+                return False
+        return append is None or transaction or results[0] >= 0
+
+    @guarded
     def put(
         self,
         config: Dict[str, Any],
@@ -60,125 +1028,203 @@ class RedisCheckpointSaver(BaseCheckpointSaver):
         new_versions: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Save a checkpoint to Redis.
-        
+
         Args:
             config: Configuration with thread_id
             checkpoint: Checkpoint data to save
             metadata: Checkpoint metadata
             new_versions: Version information
-            
+
         Returns:
-            Updated configuration
+            Config addressing the saved checkpoint
         """
-        thread_id = config.get("configurable", {}).get("thread_id", "default")
-        checkpoint_ns = config.get("configurable", {}).get("checkpoint_ns", "")
-        
-        # Only store serializable config data
-        safe_config = {
-            "configurable": {
-                "thread_id": thread_id,
-                "checkpoint_ns": checkpoint_ns,
-                "checkpoint_id": checkpoint.get("id")
-            }
-        }
-        
-        # Serialize checkpoint tuple
-        data = {
-            "checkpoint": checkpoint,
-            "metadata": metadata,
-            "config": safe_config
-        }
-        serialized = pickle.dumps(data)
-        
-        # Store in Redis with TTL
-        key = self._make_key(thread_id, checkpoint_ns, checkpoint.get("id"))
-        self.redis.setex(key, self.ttl, serialized)
-        
-        # Also store as latest
-        latest_key = self._make_key(thread_id, checkpoint_ns)
-        self.redis.setex(latest_key, self.ttl, serialized)
-        
-        return config
+        thread_id, checkpoint_ns, _ = self._parse_config(config)
+        superseded_id = self._superseded_parent(config, metadata)
+        summary = build_summary(checkpoint)
+
+        # Messages go to the append-only log; the blob keeps scalar channels only
+        stored, message_offset, message_bytes, message_digest, append = checkpoint, None, 0, None, None
+        if self.delta_messages:
+            stored, message_offset, message_bytes, message_digest, append = self._split_messages(config, checkpoint)
 
+        serialized = self._serialize_record(config, stored, metadata, message_offset, message_digest)
+        if not self._execute_put(
+            thread_id, checkpoint_ns, stored, serialized, message_offset, append, superseded_id, summary
+        ):
+            # Another writer or a forked history extended the log first: store inline
+            message_offset, message_bytes = None, 0
+            serialized = self._serialize_record(config, checkpoint, metadata, None)
+            self._execute_put(thread_id, checkpoint_ns, checkpoint, serialized, None, None, superseded_id, summary)
+
+        if self.cache is not None:
+            if superseded_id:
+                self.cache.invalidate(thread_id, checkpoint_ns, superseded_id)
+            self._cache_write(config, checkpoint, metadata, serialized, message_offset, message_bytes)
+
+        return self._checkpoint_config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    @guarded
     def get_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
         """Retrieve checkpoint tuple from Redis.
-        
+
         Args:
             config: Configuration with thread_id
-            
+
         Returns:
             CheckpointTuple or None if not found
         """
-        thread_id = config.get("configurable", {}).get("thread_id", "default")
-        checkpoint_ns = config.get("configurable", {}).get("checkpoint_ns", "")
-        checkpoint_id = config.get("configurable", {}).get("checkpoint_id")
-        
-        # Retrieve from Redis
-        key = self._make_key(thread_id, checkpoint_ns, checkpoint_id)
-        serialized = self.redis.get(key)
-        
-        if serialized is None:
+        thread_id, checkpoint_ns, checkpoint_id = self._parse_config(config)
+
+        # Serve from the in-process cache if Redis confirms it is still current
+        entry = self.cache.get(thread_id, checkpoint_ns, checkpoint_id) if self.cache is not None else None
+        if entry is not None:
+            cached = entry["tuple"]
+            pipe = self.redis.pipeline(transaction=False)
+            self._queue_cache_check(pipe, thread_id, checkpoint_ns, checkpoint_id, entry)
+            if self.sliding_ttl:
+                self._queue_touch(
+                    pipe, thread_id, checkpoint_ns, cached.config["configurable"]["checkpoint_id"], cached.checkpoint
+                )
+            if self._cache_check_passes(pipe.execute(), checkpoint_id, entry):
+                self.cache.record_hit()
+                return self.cache.copy_tuple(entry["tuple"])
+            self.cache.record_stale(thread_id, checkpoint_ns, checkpoint_id)
+
+        # Resolve latest, then fetch the blob, message log and pending writes in one script call
+        read = self._read_checkpoint(**self._read_args(thread_id, checkpoint_ns, checkpoint_id))
+        if not read:
             return None
-        
-        # Deserialize
-        data = pickle.loads(serialized)
-        
-        return CheckpointTuple(
-            config=data.get("config", config),
-            checkpoint=data["checkpoint"],
-            metadata=data.get("metadata", {}),
-            parent_config=data.get("config", {}).get("configurable")
-        )
 
+        serialized, message_log, raw_writes = self._unpack_read(read)
+        data = self.serializer.loads(serialized)
+        if raw_writes is None:
+            pipe = self.redis.pipeline(transaction=False)
+            self._queue_tuple_reads(pipe, thread_id, checkpoint_ns, [data])
+            message_log, raw_writes = self._split_tuple_reads(pipe.execute(), [data])[0]
+        elif message_log is None:
+            # An older checkpoint: only its blob records how much of the log it covers
+            log_range = self._log_range(thread_id, checkpoint_ns, data)
+            message_log = self.redis.lrange(*log_range) if log_range else []
+        checkpoint_tuple = self._to_tuple(thread_id, checkpoint_ns, data, message_log, raw_writes)
+
+        if self.cache is not None:
+            return self._cache_read(
+                thread_id, checkpoint_ns, checkpoint_tuple, data, serialized, message_log, checkpoint_id is None
+            )
+        return checkpoint_tuple
+
+    @guarded
     def list(self, config: Dict[str, Any], *, filter: Optional[Dict[str, Any]] = None, before: Optional[Dict[str, Any]] = None, limit: Optional[int] = None) -> Sequence[CheckpointTuple]:
-        """List checkpoints for a thread.
-        
+        """List checkpoints for a thread, newest first.
+
+        Pages through the thread's sorted-set index, so the cost is proportional
+        to the number of checkpoints returned rather than the size of the database.
+
         Args:
-            config: Configuration with thread_id
-            filter: Optional filter criteria
-            before: Optional cursor for pagination
+            config: Configuration with thread_id (and optionally checkpoint_id)
+            filter: Optional metadata key/value pairs that must all match
+            before: Optional config; only checkpoints older than its checkpoint_id are listed
             limit: Maximum number of results
-            
+
         Returns:
             Sequence of CheckpointTuples
         """
-        thread_id = config.get("configurable", {}).get("thread_id", "default")
-        checkpoint_ns = config.get("configurable", {}).get("checkpoint_ns", "")
-        
-        # Find all keys for this thread
-        pattern = f"{self.namespace}:{thread_id}:{checkpoint_ns}:*" if checkpoint_ns else f"{self.namespace}:{thread_id}:*"
-        keys = self.redis.keys(pattern)
-        
+        thread_id, checkpoint_ns, checkpoint_id = self._parse_config(config)
+        index_key = self._make_index_key(thread_id, checkpoint_ns)
+
+        # Resolve the rank window (index is read newest first)
+        start, stop = 0, -1
+        if checkpoint_id:
+            rank = self.redis.zrevrank(index_key, checkpoint_id)
+            if rank is None:
+                return []
+            start, stop = rank, rank
+        before_id = (before or {}).get("configurable", {}).get("checkpoint_id")
+        if before_id:
+            before_rank = self.redis.zrevrank(index_key, before_id)
+            if before_rank is None:
+                return []
+            start = max(start, before_rank + 1)
+
+        page_size = limit if limit and not filter else LIST_PAGE_SIZE
         tuples = []
-        for key in keys:
-            # Skip 'latest' keys
-            if key.decode().endswith(":latest"):
-                continue
-                
-            serialized = self.redis.get(key)
-            if serialized:
-                data = pickle.loads(serialized)
-                tuples.append(CheckpointTuple(
-                    config=data.get("config", config),
-                    checkpoint=data["checkpoint"],
-                    metadata=data.get("metadata", {}),
-                    parent_config=data.get("config", {}).get("configurable")
-                ))
-        
-        # Apply limit if specified
-        if limit:
-            tuples = tuples[:limit]
-        
+        while limit is None or len(tuples) < limit:
+            if stop >= 0 and start > stop:
+                break
+            page_stop = start + page_size - 1
+            if stop >= 0:
+                page_stop = min(page_stop, stop)
+
+            ids = [cid.decode() if isinstance(cid, bytes) else cid
+                   for cid in self.redis.zrevrange(index_key, start, page_stop)]
+            if not ids:
+                break
+            start += len(ids)
+
+            # Fetch only the requested blobs in a single round-trip
+            blobs = self.redis.mget([self._make_key(thread_id, checkpoint_ns, cid) for cid in ids])
+            records = self._decode_page(blobs, filter)
+
+            # One pipelined round-trip for the message log and every checkpoint's writes
+            pipe = self.redis.pipeline(transaction=False)
+            self._queue_tuple_reads(pipe, thread_id, checkpoint_ns, records)
+            reads = self._split_tuple_reads(pipe.execute(), records)
+
+            for data, (message_log, raw_writes) in zip(records, reads, strict=True):
+                tuples.append(self._to_tuple(thread_id, checkpoint_ns, data, message_log, raw_writes))
+                if limit is not None and len(tuples) >= limit:
+                    break
+
         return tuples
 
-    def put_writes(self, config: Dict[str, Any], writes: Sequence[Tuple[str, Any]], task_id: str) -> None:
-        """Store pending writes (not implemented for simple use case).
-        
+    @guarded
+    def put_writes(
+        self,
+        config: Dict[str, Any],
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        """Persist writes from a completed task so a resumed run can skip it.
+
         Args:
-            config: Configuration
-            writes: Pending writes
+            config: Configuration of the checkpoint the writes belong to
+            writes: Pending writes as (channel, value) pairs
             task_id: Task identifier
+            task_path: Path of the task that produced the writes
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        self._queue_writes(pipe, config, writes, task_id, task_path, ttl_script=self._match_ttl)
+        pipe.execute()
+
+        if self.cache is not None:
+            self.cache.invalidate(*self._parse_config(config))
+
+    @guarded
+    def get_summary(self, thread_id: str, checkpoint_ns: str = "") -> Optional[Dict[str, Any]]:
+        """Read a session's status without loading any checkpoint.
+
+        Args:
+            thread_id: Session/thread identifier
+            checkpoint_ns: Checkpoint namespace
+
+        Returns:
+            Summary dict (see ``parse_summary``), or None for unknown/expired
+            sessions and sessions last written before summaries existed
         """
-        # For simple use case, we don't need to implement this
-        pass
+        return parse_summary(self.redis.hgetall(self._make_summary_key(thread_id, checkpoint_ns)))
 
+    def health(self) -> Dict[str, Any]:
+        """Connection health and performance counters for monitoring.
+
+        Returns:
+            Dict with ``circuit`` (breaker state, or None without a breaker),
+            ``latency`` (call counts and p50/p95/max in ms), ``pool``
+            (connection usage) and ``cache`` (hit/miss counters, if enabled)
+        """
+        return {
+            "circuit": self.breaker.stats() if self.breaker is not None else None,
+            "latency": self.metrics.stats(),
+            "pool": pool_stats(self.redis),
+            "cache": self.cache.stats() if self.cache is not None else None
+        }
@@ -0,0 +1,228 @@
+"""Connection health tracking for the Redis checkpointers."""
+
+import functools
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import redis
+
+# Errors that mean Redis itself is unreachable (as opposed to a bad command)
+TRANSIENT_ERRORS = (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)
+
+# Number of recent call durations kept for latency percentiles
+LATENCY_WINDOW = 1024
+
+
+class CircuitOpenError(redis.exceptions.ConnectionError):
+    """Raised instead of calling Redis while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Fail-fast guard around Redis calls.
+
+    After ``failure_threshold`` consecutive calls fail with a connection or
+    timeout error (each already retried by the client), the circuit opens and
+    calls raise ``CircuitOpenError`` immediately instead of waiting on socket
+    timeouts. Once ``reset_timeout`` seconds have passed, a single probe call
+    is let through (half-open); its success closes the circuit again, its
+    failure re-opens it for another ``reset_timeout``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to wait before probing Redis again
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.times_opened = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Check whether a call may go to Redis.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a probe is already running)
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return
+            self.rejected += 1
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(f"Redis circuit is open; retrying in {retry_in:.1f}s")
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state and counters."""
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected
+            }
+
+
+class RedisMetrics:
+    """Call counters and latency percentiles for checkpointer operations."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        """Initialize the metrics.
+
+        Args:
+            window: Number of recent call durations kept for percentiles
+        """
+        self.calls = 0
+        self.errors = 0
+        self._durations: "deque[float]" = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, ok: bool = True) -> None:
+        """Record one call.
+
+        Args:
+            seconds: Wall-clock duration of the call
+            ok: Whether the call succeeded
+        """
+        with self._lock:
+            self.calls += 1
+            if not ok:
+                self.errors += 1
+            self._durations.append(seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Call counters and p50/p95/max latency (milliseconds) over the window."""
+        with self._lock:
+            durations = sorted(self._durations)
+            calls, errors = self.calls, self.errors
+        result: Dict[str, Any] = {"calls": calls, "errors": errors}
+        if durations:
+            result.update({
+                "p50_ms": round(durations[len(durations) // 2] * 1000, 2),
+                "p95_ms": round(durations[min(len(durations) - 1, int(len(durations) * 0.95))] * 1000, 2),
+                "max_ms": round(durations[-1] * 1000, 2)
+            })
+        return result
+
+
+def pool_stats(client: Optional[Any]) -> Dict[str, Any]:
+    """Best-effort connection counts of a redis-py client's pool.
+
+    Args:
+        client: Sync or asyncio Redis client (cluster clients report nothing,
+            their pools are per node)
+
+    Returns:
+        Dict with ``max_connections``, ``in_use`` and ``idle`` where known
+    """
+    pool = getattr(client, "connection_pool", None)
+    if pool is None:
+        return {}
+    stats: Dict[str, Any] = {"max_connections": getattr(pool, "max_connections", None)}
+    if hasattr(pool, "_in_use_connections"):
+        stats["in_use"] = len(pool._in_use_connections)
+        stats["idle"] = len(pool._available_connections)
+    elif hasattr(pool, "_connections"):
+        # Sync BlockingConnectionPool: a queue of idle connections (None = never opened)
+        idle = sum(1 for connection in list(pool.pool.queue) if connection is not None)
+        stats["in_use"] = len(pool._connections) - idle
+        stats["idle"] = idle
+    return stats
+
+
+def _finish_call(saver: Any, started: float, error: Optional[BaseException] = None) -> None:
+    """Feed one call's outcome into a saver's metrics and breaker.
+
+    Only connection/timeout errors count against the breaker; any other error
+    still means Redis answered, so it closes a half-open circuit like a success.
+    """
+    saver.metrics.observe(time.perf_counter() - started, ok=error is None)
+    if saver.breaker is not None:
+        if isinstance(error, TRANSIENT_ERRORS):
+            saver.breaker.record_failure()
+        else:
+            saver.breaker.record_success()
+
+
+def guarded(method: Callable) -> Callable:
+    """Route a sync saver method through the saver's breaker and metrics."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.breaker is not None:
+            self.breaker.before_call()
+        started = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        except Exception as e:
+            _finish_call(self, started, e)
+            raise
+        _finish_call(self, started)
+        return result
+    return wrapper
+
+
+def aguarded(method: Callable) -> Callable:
+    """Async counterpart of ``guarded`` for coroutine methods."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if self.breaker is not None:
+            self.breaker.before_call()
+        started = time.perf_counter()
+        try:
+            result = await method(self, *args, **kwargs)
+        except Exception as e:
+            _finish_call(self, started, e)
+            raise
+        _finish_call(self, started)
+        return result
+    return wrapper
+
+
+def aguarded_iter(method: Callable) -> Callable:
+    """Async counterpart of ``guarded`` for async-generator methods."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs) -> AsyncIterator[Any]:
+        if self.breaker is not None:
+            self.breaker.before_call()
+        started = time.perf_counter()
+        error = None
+        try:
+            async for item in method(self, *args, **kwargs):
+                yield item
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            # Also runs when the consumer stops iterating early
+            _finish_call(self, started, error)
+    return wrapper
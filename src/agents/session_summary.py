@@ -0,0 +1,66 @@
+"""Small per-session status record kept next to the checkpoints."""
+
+import json
+from typing import Any, Dict, Mapping, Optional
+
+from langgraph.checkpoint.base import Checkpoint
+
+# Characters of the newest message kept for previews in admin tools
+PREVIEW_CHARS = 200
+
+
+def build_summary(checkpoint: Checkpoint) -> Dict[str, str]:
+    """Extract the status fields of an interview checkpoint as flat strings.
+
+    Args:
+        checkpoint: Full checkpoint (with its messages)
+
+    Returns:
+        Mapping ready to be stored as a Redis hash or table row
+    """
+    values = checkpoint.get("channel_values", {})
+    messages = values.get("messages") or []
+    analysis = values.get("current_analysis") or {}
+    profile_data = values.get("profile_data") or {}
+
+    last_message = ""
+    if messages:
+        last_message = str(getattr(messages[-1], "content", messages[-1]))[:PREVIEW_CHARS]
+
+    return {
+        "checkpoint_id": checkpoint.get("id", ""),
+        "turn_count": str(values.get("turn_count", 0)),
+        "is_complete": "1" if values.get("is_complete") else "0",
+        "coverage_score": str(analysis.get("coverage_score", 0)),
+        "last_activity": checkpoint.get("ts", ""),
+        "message_count": str(len(messages)),
+        "last_message": last_message,
+        "profile_data": json.dumps(profile_data, default=str),
+    }
+
+
+def parse_summary(raw: Mapping[Any, Any]) -> Optional[Dict[str, Any]]:
+    """Decode a stored summary back into typed values.
+
+    Args:
+        raw: Stored mapping (bytes or str keys/values)
+
+    Returns:
+        Summary dict, or None if nothing was stored
+    """
+    if not raw:
+        return None
+    fields = {
+        (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+        for k, v in raw.items()
+    }
+    return {
+        "checkpoint_id": fields.get("checkpoint_id", ""),
+        "turn_count": int(fields.get("turn_count", 0)),
+        "is_complete": fields.get("is_complete") == "1",
+        "coverage_score": float(fields.get("coverage_score", 0)),
+        "last_activity": fields.get("last_activity", ""),
+        "message_count": int(fields.get("message_count", 0)),
+        "last_message": fields.get("last_message", ""),
+        "profile_data": json.loads(fields.get("profile_data") or "{}"),
+    }
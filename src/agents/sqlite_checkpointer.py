@@ -0,0 +1,550 @@
+"""SQLite checkpointer for single-node deployments without Redis."""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional, Any, AsyncIterator, Dict, Iterator, List, Sequence, Tuple
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    Checkpoint,
+    CheckpointTuple,
+    writes_sort_key,
+)
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from src.agents.checkpoint_serde import CheckpointSerializer
+from src.agents.redis_checkpointer import COMPLETED_CHANNEL
+from src.agents.session_summary import build_summary, parse_summary
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    checkpoint BLOB NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    task_path TEXT NOT NULL DEFAULT '',
+    value BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS summaries (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    summary TEXT NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS expiry (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    expires_at REAL NOT NULL,
+    ttl INTEGER NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS expiry_by_time ON expiry (expires_at);
+"""
+
+# Seconds between sweeps that delete expired sessions (run from put)
+PURGE_INTERVAL = 60
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver):
+    """File-backed checkpoint saver for LangGraph using SQLite in WAL mode.
+
+    Same interface and blob format as ``RedisCheckpointSaver``, for small
+    deployments that want durable sessions without running Redis. Both tables
+    are clustered on (thread_id, checkpoint_ns, checkpoint_id), and checkpoint
+    ids sort by creation time, so the latest checkpoint is a single index seek.
+
+    Checkpoints and pending writes are each committed as they are written, so
+    a crash mid-step keeps every completed task's output for the resumed run.
+    With WAL and ``synchronous=NORMAL`` a commit does not wait for an fsync,
+    so a write stays well under a millisecond on local disk. ``batch_writes``
+    instead commits pending writes with the next checkpoint, one commit per
+    step, at the cost of re-running a step's finished tasks after a crash.
+
+    Retention follows the Redis saver: ``turn_ends_only``, ``keep_last``, and
+    a per-session TTL (``ttl``, ``completed_ttl``, ``sliding_ttl``). Expired
+    sessions read as missing and are deleted by a sweep that runs with a
+    checkpoint write at most every ``PURGE_INTERVAL`` seconds.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        serializer: Optional[CheckpointSerializer] = None,
+        turn_ends_only: bool = False,
+        keep_last: Optional[int] = None,
+        ttl: Optional[int] = None,
+        completed_ttl: Optional[int] = None,
+        sliding_ttl: bool = False,
+        batch_writes: bool = False
+    ):
+        """Initialize SQLite checkpointer.
+
+        Args:
+            path: Database file (created with its directory if missing)
+            serializer: Blob encoder (defaults to zstd-compressed serde output)
+            turn_ends_only: Delete checkpoints superseded within a run, keeping
+                only the last checkpoint of each turn
+            keep_last: Maximum checkpoints kept per thread (None keeps all)
+            ttl: Seconds a session is kept after its last write (None keeps it forever)
+            completed_ttl: TTL for sessions whose ``is_complete`` channel is set
+                (defaults to ``ttl``)
+            sliding_ttl: Restart a session's TTL whenever its checkpoint is read
+            batch_writes: Commit pending writes with the next checkpoint instead
+                of on every ``put_writes``
+        """
+        super().__init__(serde=JsonPlusSerializer())
+        self.serializer = serializer or CheckpointSerializer(self.serde)
+        self.turn_ends_only = turn_ends_only
+        self.keep_last = keep_last
+        self.ttl = ttl
+        self.completed_ttl = completed_ttl
+        self.sliding_ttl = sliding_ttl
+        self.batch_writes = batch_writes
+        self._last_purge = 0.0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # LangGraph saves from background threads; one connection guarded by a lock
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _parse_config(config: Dict[str, Any]) -> Tuple[str, str, Optional[str]]:
+        """Extract (thread_id, checkpoint_ns, checkpoint_id) from a config."""
+        configurable = config.get("configurable", {})
+        return (
+            configurable.get("thread_id", "default"),
+            configurable.get("checkpoint_ns", ""),
+            configurable.get("checkpoint_id")
+        )
+
+    @staticmethod
+    def _checkpoint_config(thread_id: str, checkpoint_ns: str, checkpoint_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Build the config that addresses one stored checkpoint (None if no id)."""
+        if not checkpoint_id:
+            return None
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id
+            }
+        }
+
+    def _begin(self) -> None:
+        """Open a transaction unless one is already open."""
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+
+    def _commit(self) -> None:
+        """Commit the open transaction, if any."""
+        if self.conn.in_transaction:
+            self.conn.execute("COMMIT")
+
+    @contextmanager
+    def _transaction(self, commit: bool = True) -> Iterator[None]:
+        """Run a block in a transaction, undoing the block if it raises.
+
+        Otherwise a failed statement would leave its partial changes in the
+        transaction on the shared connection, and the next commit would apply
+        them. The block runs in a savepoint, so a failure only undoes the
+        block itself and keeps batched writes that are waiting for a commit.
+
+        Args:
+            commit: Commit when the block succeeds; False leaves the
+                transaction open for the next checkpoint (``batch_writes``)
+        """
+        self._begin()
+        self.conn.execute("SAVEPOINT block")
+        try:
+            yield
+        except BaseException:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK TO block")
+                self.conn.execute("RELEASE block")
+                if commit:
+                    self._commit()
+            raise
+        self.conn.execute("RELEASE block")
+        if commit:
+            self._commit()
+
+    def flush(self) -> None:
+        """Commit pending writes that are still waiting for the next checkpoint."""
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        """Commit and close the database."""
+        with self._lock:
+            self._commit()
+            self.conn.close()
+
+    def _load_writes(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_ids: Sequence[str]
+    ) -> Dict[str, List[Tuple[str, str, Any]]]:
+        """Pending writes of several checkpoints in one query, in LangGraph's apply order.
+
+        Args:
+            thread_id: Session/thread identifier
+            checkpoint_ns: Checkpoint namespace
+            checkpoint_ids: Checkpoints to load writes for
+
+        Returns:
+            Mapping of checkpoint ID to (task_id, channel, value) list
+        """
+        if not checkpoint_ids:
+            return {}
+        placeholders = ",".join("?" * len(checkpoint_ids))
+        rows = self.conn.execute(
+            f"SELECT checkpoint_id, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? "
+            f"AND checkpoint_id IN ({placeholders})",
+            (thread_id, checkpoint_ns, *checkpoint_ids)
+        ).fetchall()
+
+        entries: Dict[str, List[Any]] = {}
+        for checkpoint_id, value in rows:
+            entries.setdefault(checkpoint_id, []).append(self.serializer.loads(value))
+        writes = {}
+        for checkpoint_id, items in entries.items():
+            items.sort(key=lambda e: writes_sort_key(e[3], e[0], e[4]))
+            writes[checkpoint_id] = [(task_id, channel, value) for task_id, channel, value, _, _ in items]
+        return writes
+
+    def _to_tuple(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        row: Tuple[str, Optional[str], bytes, bytes],
+        pending_writes: List[Tuple[str, str, Any]]
+    ) -> CheckpointTuple:
+        """Build a CheckpointTuple from a (checkpoint_id, parent_id, checkpoint, metadata) row."""
+        checkpoint_id, parent_id, checkpoint, metadata = row
+        return CheckpointTuple(
+            config=self._checkpoint_config(thread_id, checkpoint_ns, checkpoint_id),
+            checkpoint=self.serializer.loads(checkpoint),
+            metadata=self.serializer.loads(metadata),
+            parent_config=self._checkpoint_config(thread_id, checkpoint_ns, parent_id),
+            pending_writes=pending_writes
+        )
+
+    def _ttl_for(self, checkpoint: Checkpoint) -> Optional[int]:
+        """TTL for a checkpoint's session, depending on whether it has completed (None = no expiry)."""
+        if self.completed_ttl is not None and checkpoint.get("channel_values", {}).get(COMPLETED_CHANNEL):
+            return self.completed_ttl
+        return self.ttl
+
+    def _session_live(self, thread_id: str, checkpoint_ns: str, touch: bool = False) -> bool:
+        """Whether a session has not expired; with ``touch`` and ``sliding_ttl``, restart its TTL."""
+        if not self.ttl and self.completed_ttl is None:
+            return True
+        row = self.conn.execute(
+            "SELECT expires_at, ttl FROM expiry WHERE thread_id = ? AND checkpoint_ns = ?",
+            (thread_id, checkpoint_ns)
+        ).fetchone()
+        if row is None:
+            return True
+        now = time.time()
+        if row[0] < now:
+            return False
+        if touch and self.sliding_ttl:
+            self.conn.execute(
+                "UPDATE expiry SET expires_at = ? WHERE thread_id = ? AND checkpoint_ns = ?",
+                (now + row[1], thread_id, checkpoint_ns)
+            )
+        return True
+
+    def _apply_retention(self, thread_id: str, checkpoint_ns: str, checkpoint: Checkpoint) -> None:
+        """Inside put's transaction: set the session's expiry, apply ``keep_last`` and sweep expired sessions."""
+        now = time.time()
+        ttl = self._ttl_for(checkpoint)
+        if ttl:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO expiry VALUES (?, ?, ?, ?)",
+                (thread_id, checkpoint_ns, now + ttl, ttl)
+            )
+        else:
+            self.conn.execute(
+                "DELETE FROM expiry WHERE thread_id = ? AND checkpoint_ns = ?", (thread_id, checkpoint_ns)
+            )
+
+        if self.keep_last:
+            oldest_kept = self.conn.execute(
+                "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                "ORDER BY checkpoint_id DESC LIMIT 1 OFFSET ?",
+                (thread_id, checkpoint_ns, self.keep_last - 1)
+            ).fetchone()
+            if oldest_kept is not None:
+                for table in ("checkpoints", "writes"):
+                    self.conn.execute(
+                        f"DELETE FROM {table} WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id < ?",
+                        (thread_id, checkpoint_ns, oldest_kept[0])
+                    )
+
+        if now - self._last_purge >= PURGE_INTERVAL:
+            self._last_purge = now
+            for table in ("checkpoints", "writes", "summaries"):
+                self.conn.execute(
+                    f"DELETE FROM {table} WHERE (thread_id, checkpoint_ns) IN "
+                    "(SELECT thread_id, checkpoint_ns FROM expiry WHERE expires_at < ?)",
+                    (now,)
+                )
+            self.conn.execute("DELETE FROM expiry WHERE expires_at < ?", (now,))
+
+    def put(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint,
+        metadata: Dict[str, Any],
+        new_versions: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Save a checkpoint in one transaction (with any batched pending writes).
+
+        Args:
+            config: Configuration with thread_id
+            checkpoint: Checkpoint data to save
+            metadata: Checkpoint metadata
+            new_versions: Version information
+
+        Returns:
+            Config addressing the saved checkpoint
+        """
+        thread_id, checkpoint_ns, parent_id = self._parse_config(config)
+        checkpoint_blob = self.serializer.dumps(checkpoint)
+        metadata_blob = self.serializer.dumps(metadata)
+
+        with self._lock, self._transaction():
+            # Only steps inside a run supersede their parent (see RedisCheckpointSaver)
+            if self.turn_ends_only and parent_id and metadata.get("source") == "loop":
+                latest = self.conn.execute(
+                    "SELECT MAX(checkpoint_id) FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?",
+                    (thread_id, checkpoint_ns)
+                ).fetchone()[0]
+                if latest == parent_id:
+                    self.conn.execute(
+                        "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                        (thread_id, checkpoint_ns, parent_id)
+                    )
+                    # Also drops writes that landed after their checkpoint was superseded
+                    self.conn.execute(
+                        "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id <= ? "
+                        "AND checkpoint_id NOT IN (SELECT checkpoint_id FROM checkpoints "
+                        "WHERE thread_id = ? AND checkpoint_ns = ?)",
+                        (thread_id, checkpoint_ns, parent_id, thread_id, checkpoint_ns)
+                    )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?)",
+                (thread_id, checkpoint_ns, checkpoint["id"], parent_id, checkpoint_blob, metadata_blob)
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?)",
+                (thread_id, checkpoint_ns, json.dumps(build_summary(checkpoint)))
+            )
+            self._apply_retention(thread_id, checkpoint_ns, checkpoint)
+
+        return self._checkpoint_config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    def get_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
+        """Retrieve a checkpoint tuple, the thread's latest if no checkpoint_id is given.
+
+        Args:
+            config: Configuration with thread_id
+
+        Returns:
+            CheckpointTuple or None if not found
+        """
+        thread_id, checkpoint_ns, checkpoint_id = self._parse_config(config)
+
+        with self._lock:
+            if not self._session_live(thread_id, checkpoint_ns, touch=True):
+                return None
+            if checkpoint_id:
+                row = self.conn.execute(
+                    "SELECT checkpoint_id, parent_checkpoint_id, checkpoint, metadata FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id)
+                ).fetchone()
+            else:
+                row = self.conn.execute(
+                    "SELECT checkpoint_id, parent_checkpoint_id, checkpoint, metadata FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns)
+                ).fetchone()
+            if row is None:
+                return None
+            writes = self._load_writes(thread_id, checkpoint_ns, [row[0]])
+
+        return self._to_tuple(thread_id, checkpoint_ns, row, writes.get(row[0], []))
+
+    def list(self, config: Dict[str, Any], *, filter: Optional[Dict[str, Any]] = None, before: Optional[Dict[str, Any]] = None, limit: Optional[int] = None) -> Sequence[CheckpointTuple]:
+        """List checkpoints for a thread, newest first.
+
+        Args:
+            config: Configuration with thread_id (and optionally checkpoint_id)
+            filter: Optional metadata key/value pairs that must all match
+            before: Optional config; only checkpoints older than its checkpoint_id are listed
+            limit: Maximum number of results
+
+        Returns:
+            Sequence of CheckpointTuples
+        """
+        thread_id, checkpoint_ns, checkpoint_id = self._parse_config(config)
+
+        query = (
+            "SELECT checkpoint_id, parent_checkpoint_id, checkpoint, metadata FROM checkpoints "
+            "WHERE thread_id = ? AND checkpoint_ns = ?"
+        )
+        params: List[Any] = [thread_id, checkpoint_ns]
+        if checkpoint_id:
+            query += " AND checkpoint_id = ?"
+            params.append(checkpoint_id)
+        before_id = (before or {}).get("configurable", {}).get("checkpoint_id")
+        if before_id:
+            query += " AND checkpoint_id < ?"
+            params.append(before_id)
+        query += " ORDER BY checkpoint_id DESC"
+        # Metadata is encoded, so filtering happens after decoding
+        if limit and not filter:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            if not self._session_live(thread_id, checkpoint_ns):
+                return []
+            rows = self.conn.execute(query, params).fetchall()
+            if filter:
+                rows = [
+                    row for row in rows
+                    if all(self.serializer.loads(row[3]).get(k) == v for k, v in filter.items())
+                ][:limit]
+            writes = self._load_writes(thread_id, checkpoint_ns, [row[0] for row in rows])
+
+        return [self._to_tuple(thread_id, checkpoint_ns, row, writes.get(row[0], [])) for row in rows]
+
+    def put_writes(
+        self,
+        config: Dict[str, Any],
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        """Persist writes from a completed task so a resumed run can skip it.
+
+        Committed before returning, so they survive a crash before the next
+        checkpoint; with ``batch_writes`` they are committed with that checkpoint.
+
+        Args:
+            config: Configuration of the checkpoint the writes belong to
+            writes: Pending writes as (channel, value) pairs
+            task_id: Task identifier
+            task_path: Path of the task that produced the writes
+        """
+        thread_id, checkpoint_ns, checkpoint_id = self._parse_config(config)
+
+        with self._lock, self._transaction(commit=not self.batch_writes):
+            for idx, (channel, value) in enumerate(writes):
+                write_idx = WRITES_IDX_MAP.get(channel, idx)
+                # Retried tasks keep their first result; special channels reflect the latest attempt
+                verb = "INSERT OR IGNORE" if write_idx >= 0 else "INSERT OR REPLACE"
+                self.conn.execute(
+                    f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx, task_path,
+                        self.serializer.dumps([task_id, channel, value, task_path, write_idx])
+                    )
+                )
+
+    def get_summary(self, thread_id: str, checkpoint_ns: str = "") -> Optional[Dict[str, Any]]:
+        """Read a session's status without loading any checkpoint.
+
+        Args:
+            thread_id: Session/thread identifier
+            checkpoint_ns: Checkpoint namespace
+
+        Returns:
+            Summary dict (see ``parse_summary``), or None for unknown sessions
+        """
+        with self._lock:
+            if not self._session_live(thread_id, checkpoint_ns):
+                return None
+            row = self.conn.execute(
+                "SELECT summary FROM summaries WHERE thread_id = ? AND checkpoint_ns = ?",
+                (thread_id, checkpoint_ns)
+            ).fetchone()
+        return parse_summary(json.loads(row[0])) if row else None
+
+    async def aput(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint,
+        metadata: Dict[str, Any],
+        new_versions: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Async wrapper around ``put`` (runs in the default executor)."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aget_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
+        """Async wrapper around ``get_tuple`` (runs in the default executor)."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Dict[str, Any],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Async wrapper around ``list`` (runs in the default executor)."""
+        tuples = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self.list(config, filter=filter, before=before, limit=limit)
+        )
+        for checkpoint_tuple in tuples:
+            yield checkpoint_tuple
+
+    async def aput_writes(
+        self,
+        config: Dict[str, Any],
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        """Async wrapper around ``put_writes`` (runs in the default executor)."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.put_writes, config, writes, task_id, task_path
+        )
+
+    async def aget_summary(self, thread_id: str, checkpoint_ns: str = "") -> Optional[Dict[str, Any]]:
+        """Async wrapper around ``get_summary`` (runs in the default executor)."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_summary, thread_id, checkpoint_ns)
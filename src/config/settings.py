@@ -12,10 +12,60 @@ class Settings:
         self.openai_model = os.getenv("OPENAI_MODEL", "gpt-4o")
         self.google_api_key = os.getenv("GOOGLE_API_KEY")
         self.google_model = os.getenv("GOOGLE_MODEL", "gemini-2.0-flash-exp")
+        self.checkpoint_backend = os.getenv("CHECKPOINT_BACKEND", "redis").lower()
+        self.sqlite_checkpoint_path = os.getenv("SQLITE_CHECKPOINT_PATH", "data/checkpoints.sqlite")
+        self.sqlite_ttl = int(os.getenv("SQLITE_TTL", "0"))
+        sqlite_completed_ttl = os.getenv("SQLITE_COMPLETED_TTL")
+        self.sqlite_completed_ttl: Optional[int] = int(sqlite_completed_ttl) if sqlite_completed_ttl else None
+        self.sqlite_sliding_ttl = os.getenv("SQLITE_SLIDING_TTL", "true").lower() == "true"
+        self.sqlite_batch_writes = os.getenv("SQLITE_BATCH_WRITES", "false").lower() == "true"
         self.redis_host = os.getenv("REDIS_HOST", "localhost")
         self.redis_port = int(os.getenv("REDIS_PORT", "6379"))
         self.redis_password = os.getenv("REDIS_PASSWORD")
+        self.redis_cluster = os.getenv("REDIS_CLUSTER", "false").lower() == "true"
+        self.redis_ttl = int(os.getenv("REDIS_TTL", "86400"))
+        completed_ttl = os.getenv("REDIS_COMPLETED_TTL")
+        self.redis_completed_ttl: Optional[int] = int(completed_ttl) if completed_ttl else None
+        self.redis_sliding_ttl = os.getenv("REDIS_SLIDING_TTL", "true").lower() == "true"
+        self.checkpoint_keep_last = int(os.getenv("CHECKPOINT_KEEP_LAST", "0"))
+        self.checkpoint_turn_ends_only = os.getenv("CHECKPOINT_TURN_ENDS_ONLY", "true").lower() == "true"
+        self.redis_max_connections = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+        self.redis_health_check_interval = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+        self.redis_retries = int(os.getenv("REDIS_RETRIES", "3"))
+        self.redis_circuit_failures = int(os.getenv("REDIS_CIRCUIT_FAILURES", "5"))
+        self.redis_circuit_reset = float(os.getenv("REDIS_CIRCUIT_RESET", "10"))
+        self.redis_delta_storage = os.getenv("REDIS_DELTA_STORAGE", "false").lower() == "true"
+        self.checkpoint_compression = os.getenv("CHECKPOINT_COMPRESSION", "zstd").lower()
+        if self.checkpoint_compression == "none":
+            self.checkpoint_compression = None
+        self.checkpoint_compress_threshold = int(os.getenv("CHECKPOINT_COMPRESS_THRESHOLD", "1024"))
+        self.checkpoint_cache_size = int(os.getenv("CHECKPOINT_CACHE_SIZE", "0"))
+        self.checkpoint_cache_max_bytes = int(os.getenv("CHECKPOINT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
         self.llm_provider = os.getenv("LLM_PROVIDER", "auto").lower()
+        self.llm_router = os.getenv("LLM_ROUTER", "false").lower() == "true"
+        self.llm_router_providers = [p.strip() for p in os.getenv("LLM_ROUTER_PROVIDERS", "moonshot,openai,gemini").lower().split(",") if p.strip()]
+        self.llm_hedge = os.getenv("LLM_HEDGE", "false").lower() == "true"
+        self.llm_hedge_percentile = float(os.getenv("LLM_HEDGE_PERCENTILE", "0.95"))
+        self.llm_hedge_min_samples = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+        self.llm_hedge_min_delay = float(os.getenv("LLM_HEDGE_MIN_DELAY", "1.0"))
+        self.llm_http_max_connections = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "20"))
+        self.llm_http_keepalive = float(os.getenv("LLM_HTTP_KEEPALIVE", "120"))
+        self.llm_warmup = os.getenv("LLM_WARMUP", "false").lower() == "true"
+        self.llm_interview_temperature = float(os.getenv("LLM_INTERVIEW_TEMPERATURE", "0.7"))
+        self.llm_profile_temperature = float(os.getenv("LLM_PROFILE_TEMPERATURE", "0"))
+        self.llm_cache = os.getenv("LLM_CACHE", "none").lower()
+        self.llm_cache_modes = [m.strip() for m in os.getenv("LLM_CACHE_MODES", "interview,profile").lower().split(",") if m.strip()]
+        self.llm_cache_ttl = int(os.getenv("LLM_CACHE_TTL", "86400"))
+        self.llm_cache_size = int(os.getenv("LLM_CACHE_SIZE", "256"))
+        self.llm_cache_dir = os.getenv("LLM_CACHE_DIR", ".cache/llm")
+        max_temperature = os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0").lower()
+        self.llm_cache_max_temperature: Optional[float] = None if max_temperature == "none" else float(max_temperature)
+        self.signal_keywords_path = os.getenv("SIGNAL_KEYWORDS_PATH")
+        self.context_recent_turns = int(os.getenv("CONTEXT_RECENT_TURNS", "4"))
+        self.context_fold_turns = int(os.getenv("CONTEXT_FOLD_TURNS", "4"))
+        self.context_token_budget = int(os.getenv("CONTEXT_TOKEN_BUDGET", "6000"))
+        self.context_summary_tokens = int(os.getenv("CONTEXT_SUMMARY_TOKENS", "1200"))
+        self.profile_facets = os.getenv("PROFILE_FACETS", "false").lower() == "true"
 
     def validate(self) -> None:
         has_moonshot = self.moonshot_api_key is not None and len(self.moonshot_api_key) > 1
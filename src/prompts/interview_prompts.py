@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Any, Dict, Optional
 
 class InterviewPrompts:
     """Prompts for the literary interview agent."""
@@ -30,11 +31,16 @@ RESPONSE STYLE:
 - Match their energy: brief answers get concise follow-ups, rich answers get deeper dives
 
 STRICT RULES:
-- CURRENT TURN: {turn_count} of 12
+- The current turn number is given in the TURN NOTES after the user's latest message
 - If turn < 12: Ask another interview question (do NOT mention completion)
 - If turn = 12: Only then offer to generate their profile
 - Never say "we've reached" or "final question" before turn 12"""
 
+    # Per-turn context, sent after the transcript so the prompt before it stays unchanged
+    TURN_NOTES = """TURN NOTES (for you, not written by the user):
+- CURRENT TURN: {turn_count} of 12
+"""
+
     INITIAL_QUESTION = """Let's start simple. Name 3 books or stories you've loved, and 1 you couldn't finish or actively disliked.
 
 Don't overthink it—first ones that come to mind."""
@@ -94,10 +100,55 @@ Conversation:
 
 Return ONLY valid JSON, no explanations."""
 
+    FACET_EXTRACTION_PROMPT = """You are helping a literary profiler take notes during an interview.
+
+Read the latest exchange and list only NEW information about the reader that is not already in the notes.
+
+NOTES SO FAR (JSON):
+{facets}
+
+LATEST EXCHANGE:
+{exchange}
+
+Return ONLY a JSON object using any of these keys, each a list of short strings (omit keys with nothing new):
+{{
+  "loves": [books/authors they loved],
+  "hates": [books/authors they disliked],
+  "genres": [genre preferences, stated or clearly implied],
+  "style_hints": [prose density, pacing, tone, worldbuilding or character-focus preferences],
+  "narrative_desires": [stories they wish existed],
+  "themes": [thematic interests],
+  "consumption_hints": [reading time, frequency, formats]
+}}"""
+
+    RECONCILE_CONVERSATION = """NOTES TAKEN DURING THE INTERVIEW (JSON, one entry per observation):
+{facets}
+
+MOST RECENT EXCHANGE (not yet in the notes):
+{exchange}"""
+
+    @staticmethod
+    def get_system_prompt() -> str:
+        """Get the static system prompt (identical every turn, so providers can cache it)."""
+        return InterviewPrompts.SYSTEM_PROMPT
+
     @staticmethod
-    def get_system_prompt(turn_count: int) -> str:
-        """Get system prompt with current turn count."""
-        return InterviewPrompts.SYSTEM_PROMPT.format(turn_count=turn_count)
+    def get_turn_notes(turn_count: int, analysis: Optional[Dict[str, Any]] = None) -> str:
+        """Get the per-turn notes appended after the conversation.
+        
+        Args:
+            turn_count: Current turn number
+            analysis: Current conversation analysis (coverage, response style), if any
+        
+        Returns:
+            Turn notes section
+        """
+        notes = InterviewPrompts.TURN_NOTES.format(turn_count=turn_count)
+        if analysis:
+            notes += f"- Coverage: {analysis.get('coverage_score', 0)}\n"
+            if "response_analysis" in analysis:
+                notes += f"- Response style: {analysis['response_analysis'].get('analysis', '')}\n"
+        return notes
     
     @staticmethod
     def _load_rubric_section() -> str:
@@ -158,3 +209,50 @@ SCORING GUIDELINES:
             rubric_section=rubric_section
         )
 
+    @staticmethod
+    def get_facet_prompt(facets: str, exchange: str) -> str:
+        """Get the per-turn facet extraction prompt.
+        
+        Args:
+            facets: JSON of the facets accumulated so far
+            exchange: Formatted transcript of the exchange to extract from
+        
+        Returns:
+            Prompt asking for new facet entries only
+        """
+        return InterviewPrompts.FACET_EXTRACTION_PROMPT.format(facets=facets, exchange=exchange)
+
+    @staticmethod
+    def get_reconcile_prompt(facets: str, exchange: str, include_rubric: bool = True) -> str:
+        """Get the profile prompt built from accumulated facets instead of the full transcript.
+        
+        Args:
+            facets: JSON of the facets accumulated during the interview
+            exchange: Formatted transcript of the turns not covered by the facets
+            include_rubric: If True, include scoring guidelines from rubric file
+        
+        Returns:
+            Complete prompt for profile generation
+        """
+        conversation = InterviewPrompts.RECONCILE_CONVERSATION.format(
+            facets=facets,
+            exchange=exchange or "(none)"
+        )
+        return InterviewPrompts.get_summary_prompt(conversation, include_rubric=include_rubric)
+
+    @staticmethod
+    def get_metadata_note(metadata: Dict[str, Any]) -> str:
+        """Get the interview metadata section appended to a profile prompt.
+        
+        Args:
+            metadata: Interview metadata (turn_count, completion_status, early_termination)
+        
+        Returns:
+            Metadata section, starting with a blank line
+        """
+        note = "\n\nINTERVIEW METADATA:\n"
+        note += f"- Total turns: {metadata.get('turn_count', 'unknown')}\n"
+        note += f"- Completion status: {metadata.get('completion_status', 'unknown')}\n"
+        if metadata.get('early_termination'):
+            note += "- Note: Interview ended early, extrapolate carefully from available data\n"
+        return note
@@ -3,6 +3,8 @@ from typing import Dict, Any, List
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from .text_signals import get_text_signals
+
 
 class AnalyzeResponseInput(BaseModel):
     """Input for response analysis."""
@@ -24,33 +26,26 @@ class ProfileAnalyzerTool(BaseTool):
         self, response_text: str, conversation_history: List[Dict[str, str]] = None
     ) -> Dict[str, Any]:
         """Analyze a user response for implicit signals."""
-        words = response_text.split()
-        unique_words = set(word.lower() for word in words)
+        stats = get_text_signals().analyze(response_text)
 
         # Calculate vocabulary richness (unique words / total words)
-        vocab_richness = len(unique_words) / len(words) if words else 0
+        vocab_richness = stats.unique_words / stats.word_count if stats.word_count else 0
 
         # Response brevity (inverse of word count, normalized)
-        brevity = max(0, 1 - (len(words) / 100))
+        brevity = max(0, 1 - (stats.word_count / 100))
 
         # Simple engagement heuristic
-        has_examples = any(
-            indicator in response_text.lower()
-            for indicator in ["like", "such as", "for example", "because"]
-        )
-        has_emotion = any(
-            word in response_text.lower()
-            for word in ["love", "hate", "amazing", "terrible", "boring"]
-        )
+        has_examples = "example_indicators" in stats.groups
+        has_emotion = "emotion_words" in stats.groups
         engagement = 0.5 + (0.25 if has_examples else 0) + (0.25 if has_emotion else 0)
 
         return {
             "vocabulary_richness": round(vocab_richness, 2),
             "response_brevity": round(brevity, 2),
             "engagement_level": round(engagement, 2),
-            "word_count": len(words),
+            "word_count": stats.word_count,
             "analysis": self._generate_analysis(
-                vocab_richness, brevity, engagement, len(words)
+                vocab_richness, brevity, engagement, stats.word_count
             ),
         }
 
@@ -65,7 +60,12 @@ class ProfileAnalyzerTool(BaseTool):
 
 
 class ConversationAnalyzerTool(BaseTool):
-    """Tool to analyze overall conversation patterns."""
+    """Tool to analyze overall conversation patterns.
+
+    Coverage is kept as running per-dimension hit counters, so an ongoing
+    interview only needs ``update`` with the newest user messages instead of
+    a rescan of the whole history each turn.
+    """
 
     name: str = "conversation_analyzer"
     description: str = """Analyzes the full conversation to identify patterns, extract preferences, 
@@ -80,44 +80,50 @@ class ConversationAnalyzerTool(BaseTool):
                 "ready_for_summary": False,
             }
 
-        turn_count = len([msg for msg in conversation_history if msg.get("role") == "user"])
+        user_messages = [
+            msg.get("content", "")
+            for msg in conversation_history
+            if msg.get("role") == "user"
+        ]
+        return self.update({}, 0, user_messages)
+
+    def update(
+        self, coverage_hits: Dict[str, int], turn_count: int, new_user_messages: List[str]
+    ) -> Dict[str, Any]:
+        """Fold new user messages into running coverage state.
+
+        Args:
+            coverage_hits: Per-dimension count of user messages mentioning it so far
+            turn_count: User turns analyzed so far
+            new_user_messages: User messages not yet analyzed
+
+        Returns:
+            Analysis dict, including the updated ``coverage_hits`` to carry forward
+        """
+        dimensions = get_text_signals().dimensions
+        coverage_hits = {dimension: coverage_hits.get(dimension, 0) for dimension in dimensions}
+        for content in new_user_messages:
+            for dimension in self._matched_dimensions(content):
+                coverage_hits[dimension] += 1
+        turn_count += len(new_user_messages)
 
         # Check coverage of key dimensions
-        coverage = {
-            "taste_anchors": self._check_mentions(
-                conversation_history, ["book", "author", "story", "novel"]
-            ),
-            "style_preference": self._check_mentions(
-                conversation_history, ["prose", "writing", "style", "voice"]
-            ),
-            "narrative_desire": self._check_mentions(
-                conversation_history, ["wish", "want", "story", "plot"]
-            ),
-            "consumption_habit": self._check_mentions(
-                conversation_history, ["read", "time", "daily", "pages"]
-            ),
-        }
+        coverage = {dimension: hits > 0 for dimension, hits in coverage_hits.items()}
 
-        coverage_score = sum(1 for v in coverage.values() if v) / len(coverage)
+        coverage_score = sum(1 for v in coverage.values() if v) / len(coverage) if coverage else 0
         ready_for_summary = turn_count >= 8 and coverage_score >= 0.75
 
         return {
             "turn_count": turn_count,
             "coverage": coverage,
+            "coverage_hits": coverage_hits,
             "coverage_score": round(coverage_score, 2),
             "ready_for_summary": ready_for_summary,
             "recommendation": "Consider wrapping up and summarizing profile" if ready_for_summary else "Continue probing for missing dimensions",
         }
 
-    def _check_mentions(
-        self, conversation: List[Dict[str, str]], keywords: List[str]
-    ) -> bool:
-        """Check if any keywords were mentioned in user responses."""
-        user_messages = [
-            msg.get("content", "").lower()
-            for msg in conversation
-            if msg.get("role") == "user"
-        ]
-        full_text = " ".join(user_messages)
-        return any(keyword in full_text for keyword in keywords)
-
+    def _matched_dimensions(self, content: str) -> List[str]:
+        """List the dimensions whose keywords appear in one user message."""
+        signals = get_text_signals()
+        groups = signals.analyze(content).groups
+        return [dimension for dimension in signals.dimensions if dimension in groups]
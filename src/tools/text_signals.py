@@ -0,0 +1,108 @@
+"""Single-pass keyword and word statistics shared by the profile tools."""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Optional
+
+from src.config import settings
+
+# Keyword lists shipped with the package (override with SIGNAL_KEYWORDS_PATH)
+DEFAULT_KEYWORDS_PATH = Path(__file__).with_name("signal_keywords.json")
+
+# Distinct messages whose statistics are kept in memory
+STATS_CACHE_SIZE = 1024
+
+
+class TextStats(NamedTuple):
+    """Statistics of one message (immutable, so it can be cached and shared)."""
+
+    word_count: int
+    unique_words: int
+    groups: FrozenSet[str]
+
+
+class TextSignals:
+    """Matches every keyword group against a message in one regex pass.
+
+    All keywords of all groups are compiled into a single alternation with
+    word boundaries, so "read" no longer matches inside "already". A keyword
+    ending in ``*`` also matches longer words starting with it ("novel*"
+    matches "novels"). Results are cached per message text, so tools looking
+    at the same message share one scan.
+    """
+
+    def __init__(
+        self,
+        groups: Dict[str, List[str]],
+        dimensions: Optional[List[str]] = None,
+        cache_size: int = STATS_CACHE_SIZE
+    ):
+        """Compile the matcher.
+
+        Args:
+            groups: Group label -> keywords (case-insensitive; multi-word phrases allowed)
+            dimensions: Labels of the groups that are profile coverage dimensions
+            cache_size: Number of distinct messages whose statistics are cached
+        """
+        self.groups = groups
+        self.dimensions = dimensions or []
+        labels: Dict[str, List[str]] = {}
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                labels.setdefault(keyword.lower(), []).append(label)
+
+        # One named alternative per keyword; longest first so phrases win over their words
+        self._labels: Dict[str, FrozenSet[str]] = {}
+        alternatives = []
+        for i, keyword in enumerate(sorted(labels, key=len, reverse=True)):
+            name = f"k{i}"
+            self._labels[name] = frozenset(labels[keyword])
+            pattern = r"\s+".join(re.escape(word) for word in keyword.rstrip("*").split())
+            if keyword.endswith("*"):
+                pattern += r"\w*"
+            alternatives.append(f"(?P<{name}>{pattern})")
+        self._pattern = re.compile(r"\b(?:" + "|".join(alternatives) + r")\b") if alternatives else None
+        self.analyze = lru_cache(maxsize=cache_size)(self._analyze)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "TextSignals":
+        """Load keyword groups from a JSON file.
+
+        The file holds ``example_indicators`` and ``emotion_words`` lists plus a
+        ``dimensions`` object mapping each profile dimension to its keywords;
+        any other top-level list becomes a group of the same name.
+
+        Args:
+            path: JSON file path
+
+        Returns:
+            Compiled matcher
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        groups = {label: keywords for label, keywords in data.items() if label != "dimensions"}
+        dimensions = data.get("dimensions", {})
+        groups.update(dimensions)
+        return cls(groups, dimensions=list(dimensions))
+
+    def _analyze(self, text: str) -> TextStats:
+        """Compute word counts and matched groups of one message."""
+        lowered = text.lower()
+        words = lowered.split()
+        groups: FrozenSet[str] = frozenset()
+        if self._pattern is not None:
+            groups = frozenset().union(*(self._labels[m.lastgroup] for m in self._pattern.finditer(lowered)))
+        return TextStats(word_count=len(words), unique_words=len(set(words)), groups=groups)
+
+
+_signals: Optional[TextSignals] = None
+
+
+def get_text_signals() -> TextSignals:
+    """Shared matcher built from ``SIGNAL_KEYWORDS_PATH`` (or the bundled keywords)."""
+    global _signals
+    if _signals is None:
+        _signals = TextSignals.from_file(Path(settings.signal_keywords_path or DEFAULT_KEYWORDS_PATH))
+    return _signals
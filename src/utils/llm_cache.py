@@ -0,0 +1,325 @@
+"""Content-addressed cache of LLM responses, keyed by model configuration and prompt."""
+
+import abc
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from src.config import settings
+
+# Redis key prefix of cached responses
+REDIS_KEY_PREFIX = "wren:llmcache:"
+
+# response_metadata flag set on messages served from the cache (their usage is the original call's)
+CACHE_HIT_METADATA = "wren_cache_hit"
+
+
+class LLMResponseCache(BaseCache):
+    """LangChain response cache with hit/miss counters over a pluggable store.
+
+    LangChain calls ``lookup`` before and ``update`` after every model call with
+    the serialized messages (message IDs already stripped) and a string of the
+    model's class, name and invocation parameters. Both are hashed into one
+    SHA-256 key, so the same prompt sent to the same model with the same
+    settings hits the cache, while any change to either misses it. Store
+    errors are counted and treated as misses, so a broken cache never fails a
+    model call.
+
+    Subclasses implement ``_get``, ``_set`` and ``_clear`` on JSON bytes.
+    """
+
+    backend = "base"
+
+    def __init__(self, ttl: int = 86400):
+        """Initialize the counters.
+
+        Args:
+            ttl: Seconds a cached response stays valid (0 = no expiry)
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.bypassed = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._bypass: Optional["BypassedCache"] = None
+
+    @staticmethod
+    def cache_key(prompt: str, llm_string: str) -> str:
+        """SHA-256 over the model configuration and the serialized messages."""
+        digest = hashlib.sha256(llm_string.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _encode(generations: Sequence[Generation]) -> bytes:
+        """Serialize generations as JSON (messages via LangChain's message dicts)."""
+        entries = []
+        for generation in generations:
+            entry: Dict[str, Any] = {"text": generation.text}
+            if isinstance(generation, ChatGeneration):
+                entry["message"] = message_to_dict(generation.message)
+            entries.append(entry)
+        return json.dumps(entries, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def _decode(raw: bytes) -> list:
+        """Inverse of ``_encode``; messages are flagged with ``CACHE_HIT_METADATA``."""
+        generations = []
+        for entry in json.loads(raw):
+            if "message" in entry:
+                message = messages_from_dict([entry["message"]])[0]
+                message.response_metadata = {**message.response_metadata, CACHE_HIT_METADATA: True}
+                generations.append(ChatGeneration(message=message))
+            else:
+                generations.append(Generation(text=entry["text"]))
+        return generations
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[list]:
+        """Return the cached generations for this prompt and model, if any."""
+        try:
+            raw = self._get(self.cache_key(prompt, llm_string))
+            generations = self._decode(raw) if raw is not None else None
+        except Exception as e:
+            print(f"⚠ LLM cache lookup failed: {e}")
+            self._count("errors")
+            generations = None
+        self._count("hits" if generations is not None else "misses")
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        """Store the generations of a model call."""
+        try:
+            self._set(self.cache_key(prompt, llm_string), self._encode(return_val))
+        except Exception as e:
+            print(f"⚠ LLM cache write failed: {e}")
+            self._count("errors")
+            return
+        self._count("writes")
+
+    def clear(self, **kwargs: Any) -> None:
+        """Drop every cached response."""
+        self._clear()
+
+    def bypass(self) -> "BypassedCache":
+        """View of this cache that never serves or stores responses (counted as bypassed)."""
+        if self._bypass is None:
+            self._bypass = BypassedCache(self)
+        return self._bypass
+
+    def stats(self) -> Dict[str, Any]:
+        """Backend name and hit/miss/write/bypass/error counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.backend,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "writes": self.writes,
+                "bypassed": self.bypassed,
+                "errors": self.errors
+            }
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> Optional[bytes]:
+        """Stored bytes for a key, or None if absent or expired."""
+
+    @abc.abstractmethod
+    def _set(self, key: str, value: bytes) -> None:
+        """Store bytes under a key with the cache TTL."""
+
+    @abc.abstractmethod
+    def _clear(self) -> None:
+        """Remove every stored response."""
+
+
+class BypassedCache(BaseCache):
+    """Cache attached to models whose responses should not be reused.
+
+    Setting a model's cache to ``False`` would work too, but going through this
+    view lets the shared cache count the calls it skipped.
+    """
+
+    def __init__(self, cache: LLMResponseCache):
+        self.cache = cache
+
+    def lookup(self, prompt: str, llm_string: str) -> None:
+        self.cache._count("bypassed")
+        return None
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        return None
+
+    def clear(self, **kwargs: Any) -> None:
+        return None
+
+
+class MemoryLLMCache(LLMResponseCache):
+    """Per-process LRU of responses."""
+
+    backend = "memory"
+
+    def __init__(self, max_entries: int = 256, ttl: int = 86400):
+        """Initialize the LRU.
+
+        Args:
+            max_entries: Responses kept before the least recently used is evicted
+            ttl: Seconds a cached response stays valid (0 = no expiry)
+        """
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] and entry[0] < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl if self.ttl else 0.0, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskLLMCache(LLMResponseCache):
+    """Responses stored as one JSON file each under a local directory.
+
+    Survives restarts and is shared by processes on the same machine, which
+    suits replaying evaluations or re-rendering saved sessions.
+    """
+
+    backend = "disk"
+
+    def __init__(self, directory: str = ".cache/llm", ttl: int = 86400):
+        """Initialize the store (the directory is created on first write).
+
+        Args:
+            directory: Cache directory
+            ttl: Seconds a cached response stays valid, by file age (0 = no expiry)
+        """
+        super().__init__(ttl)
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            if self.ttl and time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink()
+                return None
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _set(self, key: str, value: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent readers never see a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(value)
+        os.replace(tmp_path, path)
+
+    def _clear(self) -> None:
+        for path in self.directory.glob("*/*.json"):
+            path.unlink(missing_ok=True)
+
+
+class RedisLLMCache(LLMResponseCache):
+    """Responses stored in Redis with a TTL, shared by every worker."""
+
+    backend = "redis"
+
+    def __init__(self, client: Any, ttl: int = 86400, prefix: str = REDIS_KEY_PREFIX):
+        """Initialize the store.
+
+        Args:
+            client: Sync Redis client
+            ttl: Seconds a cached response stays valid (0 = no expiry)
+            prefix: Key prefix of cached responses
+        """
+        super().__init__(ttl)
+        self.redis = client
+        self.prefix = prefix
+
+    def _get(self, key: str) -> Optional[bytes]:
+        return self.redis.get(self.prefix + key)
+
+    def _set(self, key: str, value: bytes) -> None:
+        self.redis.set(self.prefix + key, value, ex=self.ttl or None)
+
+    def _clear(self) -> None:
+        for key in self.redis.scan_iter(match=f"{self.prefix}*", count=500):
+            self.redis.delete(key)
+
+
+def create_llm_cache(backend: str) -> Optional[LLMResponseCache]:
+    """Build the response cache selected by ``LLM_CACHE``.
+
+    Args:
+        backend: "none", "memory", "disk" or "redis"
+
+    Returns:
+        Cache, or None if caching is off
+    """
+    if backend in ("", "none", "off"):
+        return None
+    if backend == "memory":
+        return MemoryLLMCache(settings.llm_cache_size, ttl=settings.llm_cache_ttl)
+    if backend == "disk":
+        return DiskLLMCache(settings.llm_cache_dir, ttl=settings.llm_cache_ttl)
+    if backend == "redis":
+        # Imported here: the agents package imports this module through the LLM factory
+        from src.agents.redis_checkpointer import create_redis_client
+        client = create_redis_client(
+            settings.redis_host,
+            settings.redis_port,
+            settings.redis_password,
+            max_connections=settings.redis_max_connections,
+            retries=settings.redis_retries,
+            cluster=settings.redis_cluster
+        )
+        return RedisLLMCache(client, ttl=settings.llm_cache_ttl)
+    raise ValueError(f"Unknown LLM_CACHE backend: {backend} (use none, memory, disk or redis)")
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_ready = False
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Shared response cache configured by ``LLM_CACHE`` (None if caching is off)."""
+    global _llm_cache, _llm_cache_ready
+    if not _llm_cache_ready:
+        _llm_cache = create_llm_cache(settings.llm_cache)
+        _llm_cache_ready = True
+    return _llm_cache
@@ -1,60 +1,235 @@
-from typing import Literal
+import socket
+import threading
+from typing import Callable, Dict, Iterable, Literal, Optional, Tuple
+import httpx
+from langchain_core.caches import BaseCache
 from langchain_core.language_models import BaseChatModel
-from langchain_openai import ChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, HarmCategory
 from src.config import settings
+from src.utils.llm_cache import get_llm_cache
 
-def get_llm(mode: Literal["interview", "profile"] = "interview") -> BaseChatModel:
-    
+def _response_cache(mode: str, temperature: float) -> Optional[BaseCache]:
+    """Response cache for a new model, per LLM_CACHE / LLM_CACHE_MODES / LLM_CACHE_MAX_TEMPERATURE.
+
+    None leaves LangChain's default (no cache unless a global one is set).
+    """
+    cache = get_llm_cache()
+    if cache is None or mode not in settings.llm_cache_modes:
+        return None
+    max_temperature = settings.llm_cache_max_temperature
+    if max_temperature is not None and temperature > max_temperature:
+        # Sampled replies are meant to differ between calls; skip the cache but count the calls
+        return cache.bypass()
+    return cache
+
+# TCP keepalive on pooled connections, so idle ones dropped by a NAT/proxy are noticed
+_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+_http_clients: Optional[Tuple[httpx.Client, httpx.AsyncClient]] = None
+_clients: Dict[Tuple, BaseChatModel] = {}
+_clients_lock = threading.Lock()
+
+def _shared_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """Process-wide keep-alive HTTP clients used by every OpenAI-compatible model."""
+    global _http_clients
+    if _http_clients is None:
+        limits = httpx.Limits(
+            max_connections=settings.llm_http_max_connections,
+            max_keepalive_connections=settings.llm_http_max_connections,
+            keepalive_expiry=settings.llm_http_keepalive
+        )
+        _http_clients = (
+            httpx.Client(limits=limits, transport=httpx.HTTPTransport(limits=limits, socket_options=_SOCKET_OPTIONS)),
+            httpx.AsyncClient(limits=limits, transport=httpx.AsyncHTTPTransport(limits=limits, socket_options=_SOCKET_OPTIONS))
+        )
+    return _http_clients
+
+# Provider SDKs are imported inside their builder, so a process only pays for the one it uses
+
+def _build_gemini(mode: str, temperature: float, cache: Optional[BaseCache]) -> BaseChatModel:
+    from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, HarmCategory
+
+    if not settings.google_api_key:
+        raise ValueError("Provider is Gemini but GOOGLE_API_KEY is missing")
+
+    # [FIX] Explicit Safety Settings to prevent empty responses
+    safety_settings = {
+        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+    }
+
+    return ChatGoogleGenerativeAI(
+        model=settings.google_model,
+        google_api_key=settings.google_api_key,
+        temperature=temperature,
+        cache=cache,
+        # [FIX] Do not force convert system to human, let Gemini handle it naturally
+        # or handle it manually in the agent. Setting this to True often causes
+        # "User, User" consecutive message errors.
+        convert_system_message_to_human=False,
+        safety_settings=safety_settings
+    )
+
+def _build_openai(mode: str, temperature: float, cache: Optional[BaseCache]) -> BaseChatModel:
+    from langchain_openai import ChatOpenAI
+
+    if not settings.openai_api_key:
+        raise ValueError("Provider is OpenAI but OPENAI_API_KEY is missing")
+    http_client, http_async_client = _shared_http_clients()
+    return ChatOpenAI(
+        model=settings.openai_model,
+        api_key=settings.openai_api_key,
+        temperature=temperature,
+        cache=cache,
+        # A custom http_client turns off ChatOpenAI's default usage reporting on streams
+        stream_usage=True,
+        http_client=http_client,
+        http_async_client=http_async_client
+    )
+
+def _build_moonshot(mode: str, temperature: float, cache: Optional[BaseCache]) -> BaseChatModel:
+    from langchain_openai import ChatOpenAI
+
+    model_name = "kimi-k2-thinking-turbo" if mode == "interview" else "kimi-k2-thinking"
+    http_client, http_async_client = _shared_http_clients()
+    return ChatOpenAI(
+        model=model_name,
+        api_key=settings.moonshot_api_key,
+        base_url=settings.moonshot_base_url,
+        temperature=temperature,
+        max_tokens=4000 if mode == "profile" else 1000,
+        cache=cache,
+        stream_usage=True,
+        http_client=http_client,
+        http_async_client=http_async_client,
+    )
+
+# LLM_PROVIDER value -> model builder
+PROVIDERS: Dict[str, Callable[[str, float, Optional[BaseCache]], BaseChatModel]] = {
+    "gemini": _build_gemini,
+    "google": _build_gemini,
+    "openai": _build_openai,
+    "moonshot": _build_moonshot,
+}
+
+def _resolve_provider() -> str:
+    """LLM_PROVIDER, with "auto" resolved from the configured API keys."""
     provider = settings.llm_provider
-    
+
     if provider == "auto":
         if settings.moonshot_api_key: provider = "moonshot"
         elif settings.google_api_key: provider = "gemini"
         elif settings.openai_api_key: provider = "openai"
-    
-    print(f"🔌 LLM Factory initializing: Provider={provider}, Mode={mode}")
-
-    if provider in ["gemini", "google"]:
-        if not settings.google_api_key:
-            raise ValueError("Provider is Gemini but GOOGLE_API_KEY is missing")
-        
-        # [FIX] Explicit Safety Settings to prevent empty responses
-        safety_settings = {
-            HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-        }
-
-        return ChatGoogleGenerativeAI(
-            model=settings.google_model,
-            google_api_key=settings.google_api_key,
-            temperature=0.7,
-            # [FIX] Do not force convert system to human, let Gemini handle it naturally
-            # or handle it manually in the agent. Setting this to True often causes
-            # "User, User" consecutive message errors.
-            convert_system_message_to_human=False,
-            safety_settings=safety_settings
-        )
+    return provider
 
-    if provider == "openai":
-        if not settings.openai_api_key:
-            raise ValueError("Provider is OpenAI but OPENAI_API_KEY is missing")
-        return ChatOpenAI(
-            model=settings.openai_model,
-            api_key=settings.openai_api_key,
-            temperature=0.7
-        )
+def _provider_available(provider: str) -> bool:
+    """Whether the API key a provider needs is configured."""
+    keys = {
+        "gemini": settings.google_api_key,
+        "google": settings.google_api_key,
+        "openai": settings.openai_api_key,
+        "moonshot": settings.moonshot_api_key,
+    }
+    return bool(keys.get(provider))
 
-    if provider == "moonshot" or settings.moonshot_api_key:
-        model_name = "kimi-k2-thinking-turbo" if mode == "interview" else "kimi-k2-thinking"
-        return ChatOpenAI(
-            model=model_name,
-            api_key=settings.moonshot_api_key,
-            base_url=settings.moonshot_base_url,
-            temperature=0.7,
-            max_tokens=4000 if mode == "profile" else 1000,
-        )
+def _build_router(mode: str, temperature: float, cache: Optional[BaseCache]) -> BaseChatModel:
+    """Router over every LLM_ROUTER_PROVIDERS provider with an API key (a plain model if only one has)."""
+    from src.utils.llm_router import LLMRouter
+
+    names = [name for name in settings.llm_router_providers if name in PROVIDERS and _provider_available(name)]
+    if not names:
+        raise ValueError("LLM_ROUTER is on but none of LLM_ROUTER_PROVIDERS has an API key")
+    if len(names) == 1:
+        print(f"ℹ LLM router has a single provider ({names[0]}); routing disabled")
+        return PROVIDERS[names[0]](mode, temperature, cache)
+    return LLMRouter(
+        # The router applies the response cache once for the routed call
+        providers=[(name, PROVIDERS[name](mode, temperature, None)) for name in names],
+        hedge=settings.llm_hedge,
+        hedge_percentile=settings.llm_hedge_percentile,
+        hedge_min_samples=settings.llm_hedge_min_samples,
+        hedge_min_delay=settings.llm_hedge_min_delay,
+        cache=cache
+    )
+
+def get_llm(mode: Literal["interview", "profile"] = "interview") -> BaseChatModel:
+    """Shared chat model for a mode.
+
+    Models are built once per provider, mode and parameters and then reused by
+    every caller in the process (chat models are stateless and thread-safe), so
+    the interview agent, the profile node and ProfileGeneratorAgent share one
+    client and its pooled connections.
+    """
+    provider = "router" if settings.llm_router else _resolve_provider()
+    temperature = settings.llm_profile_temperature if mode == "profile" else settings.llm_interview_temperature
+    cache = _response_cache(mode, temperature)
+    key = (provider, mode, temperature, id(cache) if cache is not None else None)
+
+    llm = _clients.get(key)
+    if llm is not None:
+        return llm
+
+    with _clients_lock:
+        llm = _clients.get(key)
+        if llm is None:
+            print(f"🔌 LLM Factory initializing: Provider={provider}, Mode={mode}")
+
+            build = _build_router if provider == "router" else PROVIDERS.get(provider)
+            if build is None and settings.moonshot_api_key:
+                # Unknown provider name: fall back to Moonshot when its key is set
+                build = _build_moonshot
+            if build is None:
+                raise ValueError("Could not determine LLM provider. Check your API keys.")
+            llm = _clients[key] = build(mode, temperature, cache)
+    return llm
+
+def clear_llm_clients() -> None:
+    """Forget the shared models (e.g. after changing settings); the next get_llm builds new ones."""
+    with _clients_lock:
+        _clients.clear()
+
+def _warm_up(llm: BaseChatModel) -> None:
+    """Open a pooled connection to the model's API with a cheap authenticated request."""
+    try:
+        llm.root_client.models.list()
+        print(f"✓ LLM connection warmed up ({llm.model_name})")
+    except Exception as e:
+        print(f"⚠ LLM warm-up failed: {e}")
+
+def warm_up_llm(modes: Iterable[str] = ("interview", "profile"), background: bool = True) -> Optional[threading.Thread]:
+    """Build the shared models and open their HTTP connections ahead of the first call.
+
+    Moves client construction and the TCP/TLS handshake off the first
+    interview turn. Failures are only logged.
+
+    Args:
+        modes: get_llm modes to prepare
+        background: Run in a daemon thread instead of blocking
+
+    Returns:
+        The warm-up thread if ``background``, else None
+    """
+    def run() -> None:
+        warmed = set()
+        for mode in modes:
+            try:
+                llm = get_llm(mode)
+            except Exception as e:
+                print(f"⚠ LLM warm-up failed: {e}")
+                continue
+            # A router warms every provider it routes to
+            for model in [model for _, model in getattr(llm, "providers", [])] or [llm]:
+                # Gemini has no root_client: the Google SDK manages its own transport
+                root_client = getattr(model, "root_client", None)
+                if root_client is not None and str(root_client.base_url) not in warmed:
+                    # One request per API host is enough: all models share the connection pool
+                    warmed.add(str(root_client.base_url))
+                    _warm_up(model)
 
-    raise ValueError("Could not determine LLM provider. Check your API keys.")
\ No newline at end of file
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name="llm-warm-up", daemon=True)
+    thread.start()
+    return thread
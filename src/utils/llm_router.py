@@ -0,0 +1,385 @@
+"""Chat model that routes each call to the healthiest of several providers."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict, PrivateAttr
+
+# Weight of the newest call in the latency and error-rate averages
+EWMA_ALPHA = 0.2
+
+# Recent call durations kept per provider for the hedge percentile
+LATENCY_WINDOW = 200
+
+# A single call counts as at most this multiple of the current average, so one
+# tail-latency outlier (what hedging is for) doesn't demote a fast provider;
+# a sustained slowdown still raises the average within a few calls
+OUTLIER_CLIP = 3.0
+
+# Providers whose recent error rate is above this are only used when all others fail
+UNHEALTHY_ERROR_RATE = 0.5
+
+# A healthy provider whose last call is this many seconds older than the router's
+# latest call gets the next one (at most one such probe per call), so a provider
+# ranked down by a slow spell is re-measured once it recovers. Measured against
+# the latest call, not the clock, so idle time between turns doesn't trigger probes
+PROBE_INTERVAL = 300.0
+
+# Seconds for an idle provider's error rate to halve, so a provider ranked unhealthy
+# by an outage is tried again once the outage has likely passed
+ERROR_HALF_LIFE = 300.0
+
+# Threads running hedged sync calls (a late loser keeps its thread until it returns)
+_hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-hedge")
+
+
+class ProviderStats:
+    """EWMA latency, EWMA error rate and a latency window for one provider."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        """Initialize the stats.
+
+        Args:
+            window: Number of recent successful call durations kept for percentiles
+        """
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.last_call = time.monotonic()
+        self._durations: "deque[float]" = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, ok: bool) -> None:
+        """Record one call.
+
+        Args:
+            seconds: Wall-clock duration of the call
+            ok: Whether the call succeeded (failed calls don't update the latency)
+        """
+        with self._lock:
+            self.calls += 1
+            self.last_call = time.monotonic()
+            self.error_rate += EWMA_ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+            if not ok:
+                self.errors += 1
+                return
+            self._durations.append(seconds)
+            if self.latency is None:
+                self.latency = seconds
+            else:
+                self.latency += EWMA_ALPHA * (min(seconds, self.latency * OUTLIER_CLIP) - self.latency)
+
+    def count_hedge(self, won: bool = False) -> None:
+        """Record a hedge started for this provider, or (``won``) one the backup won."""
+        with self._lock:
+            if won:
+                self.hedge_wins += 1
+            else:
+                self.hedges += 1
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Latency at ``fraction`` (0-1) of the recent successful calls, None without data."""
+        with self._lock:
+            durations = sorted(self._durations)
+        if not durations:
+            return None
+        return durations[min(len(durations) - 1, int(len(durations) * fraction))]
+
+    def samples(self) -> int:
+        with self._lock:
+            return len(self._durations)
+
+    def score(self, now: float) -> Tuple[bool, float]:
+        """Sort key: healthy providers first, then by error-weighted EWMA latency.
+
+        A provider without calls yet scores 0 so that it gets tried. The error
+        rate decays by half every ``ERROR_HALF_LIFE`` seconds without calls.
+
+        Args:
+            now: ``time.monotonic()`` of the routing decision
+        """
+        with self._lock:
+            error_rate = self.error_rate * 0.5 ** ((now - self.last_call) / ERROR_HALF_LIFE)
+            latency = self.latency or 0.0
+            return error_rate > UNHEALTHY_ERROR_RATE, latency * (1.0 + error_rate)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters, EWMA latency/error rate and p50/p95 latency (milliseconds)."""
+        p50, p95 = self.percentile(0.5), self.percentile(0.95)
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "error_rate": round(self.error_rate, 3),
+                "ewma_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+                "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins
+            }
+
+
+class LLMRouter(BaseChatModel):
+    """Latency-aware router over several provider models.
+
+    Every call goes to the provider with the lowest EWMA latency among those
+    whose recent error rate is acceptable; a failing call is retried on the
+    next provider. With ``hedge`` enabled, a non-streaming call still running
+    after the chosen provider's ``hedge_percentile`` latency (once
+    ``hedge_min_samples`` calls are known, and never before
+    ``hedge_min_delay`` seconds) is duplicated to the runner-up provider, and
+    whichever answers first is returned. A hedge trims tail latency at the
+    cost of paying for both calls.
+
+    Provider models are called through their ``_generate``/``_stream``
+    methods, so callbacks (streaming, tracing) and the response cache apply
+    to the router's own run only, once per call.
+    """
+
+    providers: List[Tuple[str, BaseChatModel]]
+    hedge: bool = False
+    hedge_percentile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_min_delay: float = 1.0
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _stats: Dict[str, ProviderStats] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._stats = {name: ProviderStats() for name, _ in self.providers}
+
+    @property
+    def _llm_type(self) -> str:
+        return "wren-router"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {
+            "providers": [(name, model._llm_type, model._identifying_params) for name, model in self.providers],
+            "hedge": self.hedge
+        }
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider routing stats, in current preference order."""
+        return {name: self._stats[name].stats() for name, _ in self._ranked()}
+
+    def _ranked(self) -> List[Tuple[str, BaseChatModel]]:
+        """Providers ordered from most to least preferred (stable for ties).
+
+        The healthy provider that has gone longest without a call, if that is
+        more than ``PROBE_INTERVAL`` before the latest call, is moved first.
+        """
+        now = time.monotonic()
+        scores = {name: self._stats[name].score(now) for name, _ in self.providers}
+        ranked = sorted(self.providers, key=lambda provider: scores[provider[0]])
+        latest = max(self._stats[name].last_call for name, _ in self.providers)
+        stale = [
+            provider for provider in ranked[1:]
+            if not scores[provider[0]][0] and latest - self._stats[provider[0]].last_call > PROBE_INTERVAL
+        ]
+        if stale:
+            probe = min(stale, key=lambda provider: self._stats[provider[0]].last_call)
+            ranked.remove(probe)
+            ranked.insert(0, probe)
+        return ranked
+
+    def _hedge_delay(self, name: str) -> Optional[float]:
+        """Seconds to wait for ``name`` before hedging, or None if there is no basis yet."""
+        stats = self._stats[name]
+        if stats.samples() < self.hedge_min_samples:
+            return None
+        return max(self.hedge_min_delay, stats.percentile(self.hedge_percentile))
+
+    def _timed_generate(self, name: str, model: BaseChatModel, messages: List[BaseMessage],
+                        stop: Optional[List[str]], **kwargs: Any) -> ChatResult:
+        started = time.perf_counter()
+        try:
+            result = model._generate(messages, stop=stop, **kwargs)
+        except Exception:
+            self._stats[name].observe(time.perf_counter() - started, ok=False)
+            raise
+        self._stats[name].observe(time.perf_counter() - started, ok=True)
+        return result
+
+    async def _atimed_generate(self, name: str, model: BaseChatModel, messages: List[BaseMessage],
+                               stop: Optional[List[str]], **kwargs: Any) -> ChatResult:
+        started = time.perf_counter()
+        try:
+            result = await model._agenerate(messages, stop=stop, **kwargs)
+        except Exception:
+            self._stats[name].observe(time.perf_counter() - started, ok=False)
+            raise
+        self._stats[name].observe(time.perf_counter() - started, ok=True)
+        return result
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        ranked = self._ranked()
+        delay = self._hedge_delay(ranked[0][0]) if self.hedge and len(ranked) > 1 else None
+        if delay is not None:
+            return self._generate_hedged(ranked, delay, messages, stop, **kwargs)
+
+        error: Optional[Exception] = None
+        for name, model in ranked:
+            try:
+                return self._timed_generate(name, model, messages, stop, **kwargs)
+            except Exception as e:
+                print(f"⚠ LLM provider {name} failed: {e}")
+                error = e
+        raise error
+
+    def _generate_hedged(self, ranked: List[Tuple[str, BaseChatModel]], delay: float,
+                         messages: List[BaseMessage], stop: Optional[List[str]], **kwargs: Any) -> ChatResult:
+        """Call the first provider; start the second as well if the first is late or fails."""
+        (name, model), (backup_name, backup) = ranked[0], ranked[1]
+        futures: Dict[Future, str] = {
+            _hedge_executor.submit(self._timed_generate, name, model, messages, stop, **kwargs): name
+        }
+        done, _ = wait(futures, timeout=delay)
+        primary = next(iter(futures))
+        if done and primary.exception() is None:
+            return primary.result()
+        if not done:
+            self._stats[name].count_hedge()
+        futures[_hedge_executor.submit(self._timed_generate, backup_name, backup, messages, stop, **kwargs)] = backup_name
+
+        error: Optional[BaseException] = None
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if futures[future] == backup_name and not primary.done():
+                        self._stats[name].count_hedge(won=True)
+                    # The slower call keeps running in its thread; its result is dropped
+                    return future.result()
+                print(f"⚠ LLM provider {futures[future]} failed: {future.exception()}")
+                error = future.exception()
+        raise error
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        ranked = self._ranked()
+        delay = self._hedge_delay(ranked[0][0]) if self.hedge and len(ranked) > 1 else None
+        if delay is not None:
+            return await self._agenerate_hedged(ranked, delay, messages, stop, **kwargs)
+
+        error: Optional[Exception] = None
+        for name, model in ranked:
+            try:
+                return await self._atimed_generate(name, model, messages, stop, **kwargs)
+            except Exception as e:
+                print(f"⚠ LLM provider {name} failed: {e}")
+                error = e
+        raise error
+
+    async def _agenerate_hedged(self, ranked: List[Tuple[str, BaseChatModel]], delay: float,
+                                messages: List[BaseMessage], stop: Optional[List[str]], **kwargs: Any) -> ChatResult:
+        """Async counterpart of ``_generate_hedged``; the losing call is cancelled."""
+        (name, model), (backup_name, backup) = ranked[0], ranked[1]
+        primary = asyncio.ensure_future(self._atimed_generate(name, model, messages, stop, **kwargs))
+        tasks: Dict[asyncio.Future, str] = {primary: name}
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done and primary.exception() is None:
+            return primary.result()
+        if not done:
+            self._stats[name].count_hedge()
+        tasks[asyncio.ensure_future(self._atimed_generate(backup_name, backup, messages, stop, **kwargs))] = backup_name
+
+        error: Optional[BaseException] = None
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if tasks[task] == backup_name and not primary.done():
+                            self._stats[name].count_hedge(won=True)
+                        return task.result()
+                    print(f"⚠ LLM provider {tasks[task]} failed: {task.exception()}")
+                    error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+        raise error
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        # Streams are not hedged (tokens already shown can't be replaced), but a
+        # provider failing before its first chunk is replaced by the next one
+        error: Optional[Exception] = None
+        for name, model in self._ranked():
+            started = time.perf_counter()
+            streamed = False
+            try:
+                for chunk in model._stream(messages, stop=stop, **kwargs):
+                    streamed = True
+                    if run_manager and isinstance(chunk.message.content, str):
+                        run_manager.on_llm_new_token(chunk.message.content, chunk=chunk)
+                    yield chunk
+            except Exception as e:
+                self._stats[name].observe(time.perf_counter() - started, ok=False)
+                if streamed:
+                    raise
+                print(f"⚠ LLM provider {name} failed: {e}")
+                error = e
+                continue
+            self._stats[name].observe(time.perf_counter() - started, ok=True)
+            return
+        raise error
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        error: Optional[Exception] = None
+        for name, model in self._ranked():
+            started = time.perf_counter()
+            streamed = False
+            try:
+                async for chunk in model._astream(messages, stop=stop, **kwargs):
+                    streamed = True
+                    if run_manager and isinstance(chunk.message.content, str):
+                        await run_manager.on_llm_new_token(chunk.message.content, chunk=chunk)
+                    yield chunk
+            except Exception as e:
+                self._stats[name].observe(time.perf_counter() - started, ok=False)
+                if streamed:
+                    raise
+                print(f"⚠ LLM provider {name} failed: {e}")
+                error = e
+                continue
+            self._stats[name].observe(time.perf_counter() - started, ok=True)
+            return
+        raise error
@@ -0,0 +1,87 @@
+"""Prompt token counters, including the share served from provider-side prompt caches."""
+
+import threading
+from typing import Any, Dict, Tuple
+
+from langchain_core.messages import BaseMessage
+
+from src.utils.llm_cache import CACHE_HIT_METADATA
+
+
+def prompt_token_usage(message: BaseMessage) -> Tuple[int, int]:
+    """Read prompt and cached prompt token counts from a model reply.
+
+    LangChain reports cached input as ``usage_metadata.input_token_details.cache_read``
+    (OpenAI, Gemini). Moonshot's OpenAI-compatible API puts ``cached_tokens`` at
+    the top level of its usage block instead, which only shows up in
+    ``response_metadata["token_usage"]``.
+
+    Args:
+        message: Reply of a chat model
+
+    Returns:
+        (prompt tokens, cached prompt tokens); zeros if the provider sent no usage
+    """
+    usage = getattr(message, "usage_metadata", None) or {}
+    prompt_tokens = usage.get("input_tokens", 0)
+    cached_tokens = (usage.get("input_token_details") or {}).get("cache_read", 0)
+
+    token_usage = (getattr(message, "response_metadata", None) or {}).get("token_usage") or {}
+    if not prompt_tokens:
+        prompt_tokens = token_usage.get("prompt_tokens", 0)
+    if not cached_tokens:
+        cached_tokens = (
+            token_usage.get("cached_tokens")
+            or (token_usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+            or 0
+        )
+    return prompt_tokens or 0, cached_tokens or 0
+
+
+class TokenUsage:
+    """Per-purpose counters of LLM calls, prompt tokens and cached prompt tokens.
+
+    Replies served from the LLM response cache (``LLM_CACHE``) carry the usage
+    of the call that produced them; they are counted as ``response_cache_hits``
+    only, so the token counters reflect what was actually sent to providers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def record(self, purpose: str, message: BaseMessage) -> Tuple[int, int]:
+        """Add a reply's prompt usage to the counters of ``purpose``.
+
+        Args:
+            purpose: What the call was for (e.g. "question", "facets", "profile")
+            message: Reply of a chat model
+
+        Returns:
+            (prompt tokens, cached prompt tokens) of this reply; zeros for a response cache hit
+        """
+        cache_hit = bool((getattr(message, "response_metadata", None) or {}).get(CACHE_HIT_METADATA))
+        prompt_tokens, cached_tokens = (0, 0) if cache_hit else prompt_token_usage(message)
+        with self._lock:
+            counters = self._counters.setdefault(
+                purpose, {"calls": 0, "response_cache_hits": 0, "prompt_tokens": 0, "cached_tokens": 0}
+            )
+            if cache_hit:
+                counters["response_cache_hits"] += 1
+                return 0, 0
+            counters["calls"] += 1
+            counters["prompt_tokens"] += prompt_tokens
+            counters["cached_tokens"] += cached_tokens
+        return prompt_tokens, cached_tokens
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters per purpose with the fraction of prompt tokens read from cache."""
+        with self._lock:
+            return {
+                purpose: {
+                    **counters,
+                    "cache_rate": round(counters["cached_tokens"] / counters["prompt_tokens"], 3)
+                    if counters["prompt_tokens"] else 0.0
+                }
+                for purpose, counters in self._counters.items()
+            }
@@ -0,0 +1,22 @@
+"""Shared fixtures: in-process Redis servers (fakeredis with Lua) for the checkpointer tests."""
+
+import fakeredis
+import pytest
+
+
+@pytest.fixture
+def redis_server():
+    """Fresh in-process Redis server."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis_client(redis_server):
+    """Blocking client on ``redis_server``."""
+    return fakeredis.FakeRedis(server=redis_server)
+
+
+@pytest.fixture
+def async_redis_client(redis_server):
+    """redis.asyncio client on the same server as ``redis_client``."""
+    return fakeredis.FakeAsyncRedis(server=redis_server)
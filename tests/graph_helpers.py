@@ -0,0 +1,250 @@
+"""A small fan-out graph and checks that compare a checkpointer with LangGraph's MemorySaver."""
+
+import asyncio
+from operator import add
+from typing import Annotated, Any, Callable, Dict, List, TypedDict
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.message import add_messages
+
+
+class FanOutState(TypedDict):
+    messages: Annotated[list, add_messages]
+    log: Annotated[List[str], add]
+    count: int
+
+
+class FlakyBranch(Exception):
+    """Raised by the "b" branch while ``fail_b`` is set."""
+
+
+def build_graph(checkpointer: Any, calls: Dict[str, int] = None, fail_b: Dict[str, bool] = None):
+    """Compile START -> start -> (a || b) -> join -> END.
+
+    Args:
+        checkpointer: Saver under test
+        calls: Optional dict counting node executions
+        fail_b: Optional {"fail": bool}; "b" raises once while it is True
+
+    Returns:
+        Compiled graph
+    """
+    calls = calls if calls is not None else {}
+    fail_b = fail_b if fail_b is not None else {"fail": False}
+
+    def node(name: str, update: Callable[[FanOutState], Dict[str, Any]]):
+        def run(state: FanOutState) -> Dict[str, Any]:
+            calls[name] = calls.get(name, 0) + 1
+            if name == "b" and fail_b["fail"]:
+                fail_b["fail"] = False
+                raise FlakyBranch("b failed")
+            return update(state)
+        return run
+
+    workflow = StateGraph(FanOutState)
+    workflow.add_node("start", node("start", lambda state: {"log": ["start"]}))
+    workflow.add_node("a", node("a", lambda state: {"log": ["a"]}))
+    workflow.add_node("b", node("b", lambda state: {"log": ["b"]}))
+    workflow.add_node("join", node("join", lambda state: {
+        "messages": [AIMessage(content=f"reply {state.get('count', 0) + 1}")],
+        "count": state.get("count", 0) + 1,
+    }))
+    workflow.add_edge(START, "start")
+    workflow.add_edge("start", "a")
+    workflow.add_edge("start", "b")
+    workflow.add_edge(["a", "b"], "join")
+    workflow.add_edge("join", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+
+# With the default "async" durability LangGraph saves a checkpoint in the background
+# while the next step runs, and barrier channels hand their live set to the
+# checkpoint; a slower saver can then serialize writes from the following step.
+# The tests save synchronously so histories are deterministic.
+DURABILITY = "sync"
+
+
+def turn_input(turn: int) -> Dict[str, Any]:
+    return {"messages": [HumanMessage(content=f"answer {turn}")]}
+
+
+def normalize_values(values: Dict[str, Any]) -> Dict[str, Any]:
+    """State values without the random message ids."""
+    normalized = dict(values)
+    if "messages" in normalized:
+        normalized["messages"] = [(msg.type, msg.content) for msg in normalized["messages"]]
+    return normalized
+
+
+def history_shape(graph: Any, config: Dict[str, Any]) -> List[tuple]:
+    """Comparable view of a thread's history: values, next nodes, source/step, parent link, writes."""
+    shape = []
+    for snapshot in graph.get_state_history(config):
+        shape.append((
+            normalize_values(snapshot.values),
+            tuple(sorted(snapshot.next)),
+            snapshot.metadata.get("source"),
+            snapshot.metadata.get("step"),
+            snapshot.parent_config is not None,
+        ))
+    return shape
+
+
+async def ahistory_shape(graph: Any, config: Dict[str, Any]) -> List[tuple]:
+    """Async counterpart of ``history_shape``."""
+    shape = []
+    async for snapshot in graph.aget_state_history(config):
+        shape.append((
+            normalize_values(snapshot.values),
+            tuple(sorted(snapshot.next)),
+            snapshot.metadata.get("source"),
+            snapshot.metadata.get("step"),
+            snapshot.parent_config is not None,
+        ))
+    return shape
+
+
+def run_turns(graph: Any, config: Dict[str, Any], turns: int) -> None:
+    for turn in range(turns):
+        graph.invoke(turn_input(turn), config, durability=DURABILITY)
+
+
+async def arun_turns(graph: Any, config: Dict[str, Any], turns: int) -> None:
+    for turn in range(turns):
+        await graph.ainvoke(turn_input(turn), config, durability=DURABILITY)
+
+
+def reference_history(turns: int) -> List[tuple]:
+    """History shape MemorySaver produces for ``turns`` turns."""
+    graph = build_graph(MemorySaver())
+    config = {"configurable": {"thread_id": "reference"}}
+    run_turns(graph, config, turns)
+    return history_shape(graph, config)
+
+
+class SaverCalls:
+    """Calls a saver and its graph through either the sync or the async API."""
+
+    def __init__(self, saver: Any, use_async: bool):
+        self.saver = saver
+        self.use_async = use_async
+
+    async def invoke(self, graph: Any, value: Any, config: Dict[str, Any]) -> Any:
+        if self.use_async:
+            return await graph.ainvoke(value, config, durability=DURABILITY)
+        return graph.invoke(value, config, durability=DURABILITY)
+
+    async def update_state(self, graph: Any, config: Dict[str, Any], values: Dict[str, Any], as_node: str) -> Any:
+        if self.use_async:
+            return await graph.aupdate_state(config, values, as_node=as_node)
+        return graph.update_state(config, values, as_node=as_node)
+
+    async def get_tuple(self, config: Dict[str, Any]) -> Any:
+        if self.use_async:
+            return await self.saver.aget_tuple(config)
+        return self.saver.get_tuple(config)
+
+    async def list(self, config: Dict[str, Any], **kwargs) -> List[Any]:
+        if self.use_async:
+            return [t async for t in self.saver.alist(config, **kwargs)]
+        return list(self.saver.list(config, **kwargs))
+
+    async def put_writes(self, config: Dict[str, Any], writes: List[tuple], task_id: str) -> None:
+        if self.use_async:
+            await self.saver.aput_writes(config, writes, task_id)
+        else:
+            self.saver.put_writes(config, writes, task_id)
+
+
+async def _parity_results(calls: SaverCalls) -> Dict[str, Any]:
+    """Observations of one saver that must match between MemorySaver and the saver under test."""
+    graph = build_graph(calls.saver)
+    config = {"configurable": {"thread_id": "parity"}}
+    for turn in range(2):
+        await calls.invoke(graph, turn_input(turn), config)
+    await calls.invoke(build_graph(calls.saver), turn_input(9), {"configurable": {"thread_id": "other"}})
+
+    tuples = await calls.list(config)
+    ids = [t.config["configurable"]["checkpoint_id"] for t in tuples]
+    latest = await calls.get_tuple(config)
+    middle = await calls.get_tuple(tuples[2].config)
+
+    # A task's writes against the latest checkpoint come back on read
+    await calls.put_writes(latest.config, [("log", "late"), ("count", 5)], "task-1")
+    await calls.put_writes(latest.config, [("log", "retry")], "task-1")  # retried task keeps its first writes
+
+    missing = {"configurable": {"thread_id": "missing"}}
+    results = {
+        "count": len(tuples),
+        "newest_first": ids == sorted(ids, reverse=True),
+        "latest_is_first": latest.config["configurable"]["checkpoint_id"] == ids[0],
+        "latest_values": normalize_values(latest.checkpoint["channel_values"]),
+        "middle_id": middle.config["configurable"]["checkpoint_id"] == ids[2],
+        "middle_parent": middle.parent_config["configurable"]["checkpoint_id"] == ids[3],
+        "metadata": [(t.metadata.get("source"), t.metadata.get("step")) for t in tuples],
+        "limit": [t.config["configurable"]["checkpoint_id"] for t in await calls.list(config, limit=2)] == ids[:2],
+        "before": [
+            t.config["configurable"]["checkpoint_id"]
+            for t in await calls.list(config, before=tuples[1].config, limit=2)
+        ] == ids[2:4],
+        "filter": len(await calls.list(config, filter={"source": "input"})),
+        "pending_writes": (await calls.get_tuple(config)).pending_writes,
+        "listed_writes": (await calls.list(config, limit=1))[0].pending_writes,
+        "missing": await calls.get_tuple(missing),
+        "missing_list": await calls.list(missing),
+    }
+
+    # update_state returns the config put() returns: it must address the new checkpoint
+    updated = await calls.update_state(graph, config, {"count": 10}, as_node="join")
+    after_update = await calls.get_tuple(config)
+    results["update_config"] = updated["configurable"]["checkpoint_id"] == after_update.config["configurable"]["checkpoint_id"]
+    results["update_parent"] = after_update.parent_config["configurable"]["checkpoint_id"] == ids[0]
+    results["update_values"] = after_update.checkpoint["channel_values"]["count"]
+    return results
+
+
+def assert_saver_api_parity(saver: Any, use_async: bool = False) -> None:
+    """Check put/get_tuple/list/put_writes of ``saver`` against MemorySaver on the same graph run.
+
+    Args:
+        saver: Saver under test
+        use_async: Drive both savers through aput/aget_tuple/alist/aput_writes instead
+    """
+    async def compare():
+        reference = await _parity_results(SaverCalls(MemorySaver(), use_async))
+        assert await _parity_results(SaverCalls(saver, use_async)) == reference
+
+    asyncio.run(compare())
+
+
+def assert_pending_writes_resume(saver: Any, use_async: bool = False) -> None:
+    """A crash mid-step keeps finished tasks' writes, and the resumed run does not repeat them."""
+    calls: Dict[str, int] = {}
+    fail_b = {"fail": False}
+    graph = build_graph(saver, calls, fail_b)
+    config = {"configurable": {"thread_id": "resume"}}
+    saver_calls = SaverCalls(saver, use_async)
+
+    def run(value):
+        return asyncio.run(saver_calls.invoke(graph, value, config))
+
+    run(turn_input(0))
+    fail_b["fail"] = True
+    try:
+        run(turn_input(1))
+    except FlakyBranch:
+        pass
+    else:
+        raise AssertionError("branch b should have failed")
+
+    pending = asyncio.run(saver_calls.get_tuple(config)).pending_writes
+    assert ("log", ["a"]) in [(channel, value) for _, channel, value in pending]
+    assert calls["a"] == 2
+
+    result = run(None)
+    assert calls["a"] == 2, "the finished branch must not run again on resume"
+    assert calls["b"] == 3
+    assert result["log"] == ["start", "a", "b", "start", "a", "b"]
+    assert result["count"] == 2
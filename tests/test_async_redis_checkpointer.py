@@ -0,0 +1,76 @@
+"""AsyncRedisCheckpointSaver: async MemorySaver parity and key compatibility with the sync saver."""
+
+import asyncio
+
+import pytest
+
+from src.agents.async_redis_checkpointer import AsyncRedisCheckpointSaver
+from src.agents.checkpoint_cache import CheckpointCache
+from src.agents.redis_checkpointer import RedisCheckpointSaver
+from tests.graph_helpers import (
+    ahistory_shape,
+    arun_turns,
+    assert_pending_writes_resume,
+    assert_saver_api_parity,
+    build_graph,
+    history_shape,
+    normalize_values,
+    reference_history,
+    run_turns,
+)
+
+SAVER_OPTIONS = {
+    "plain": {},
+    "delta": {"delta_messages": True},
+    "delta_cached": {"delta_messages": True, "cache": True},
+}
+
+
+def make_saver(async_redis_client, options, redis_client=None):
+    options = dict(options)
+    if options.pop("cache", False):
+        options["cache"] = CheckpointCache(max_entries=64)
+    return AsyncRedisCheckpointSaver(async_redis_client, redis_client, **options)
+
+
+@pytest.mark.parametrize("options", SAVER_OPTIONS.values(), ids=SAVER_OPTIONS.keys())
+def test_async_api_matches_memory_saver(async_redis_client, options):
+    assert_saver_api_parity(make_saver(async_redis_client, options), use_async=True)
+
+
+@pytest.mark.parametrize("options", SAVER_OPTIONS.values(), ids=SAVER_OPTIONS.keys())
+def test_async_history_matches_memory_saver(async_redis_client, options):
+    graph = build_graph(make_saver(async_redis_client, options))
+    config = {"configurable": {"thread_id": "history"}}
+
+    async def run():
+        await arun_turns(graph, config, 3)
+        return await ahistory_shape(graph, config)
+
+    assert asyncio.run(run()) == reference_history(3)
+
+
+@pytest.mark.parametrize("options", SAVER_OPTIONS.values(), ids=SAVER_OPTIONS.keys())
+def test_async_pending_writes_survive_a_failed_step(async_redis_client, options):
+    assert_pending_writes_resume(make_saver(async_redis_client, options), use_async=True)
+
+
+@pytest.mark.parametrize("delta_messages", [False, True], ids=["plain", "delta"])
+def test_sync_saver_reads_async_checkpoints(async_redis_client, redis_client, delta_messages):
+    config = {"configurable": {"thread_id": "shared"}}
+    asyncio.run(arun_turns(build_graph(AsyncRedisCheckpointSaver(async_redis_client, delta_messages=delta_messages)), config, 2))
+
+    sync_graph = build_graph(RedisCheckpointSaver(redis_client, delta_messages=delta_messages))
+    assert history_shape(sync_graph, config) == reference_history(2)
+
+    # ...and the async saver continues a thread the sync saver extended
+    run_turns(sync_graph, config, 1)
+    async_graph = build_graph(AsyncRedisCheckpointSaver(async_redis_client, delta_messages=delta_messages))
+    values = asyncio.run(async_graph.aget_state(config)).values
+    assert normalize_values(values) == normalize_values(sync_graph.get_state(config).values)
+    assert values["count"] == 3
+
+
+def test_sync_methods_use_the_blocking_client(async_redis_client, redis_client):
+    saver = AsyncRedisCheckpointSaver(async_redis_client, redis_client)
+    assert_saver_api_parity(saver)
@@ -0,0 +1,110 @@
+"""Checkpoint retention: turn_ends_only, keep_last, forks, completed-session and sliding TTLs."""
+
+import asyncio
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+
+from src.agents.async_redis_checkpointer import AsyncRedisCheckpointSaver
+from src.agents.redis_checkpointer import COMPLETED_CHANNEL, RedisCheckpointSaver
+from tests.graph_helpers import DURABILITY, arun_turns, build_graph, run_turns
+
+
+def stored_ids(redis_client, saver, thread_id):
+    """Checkpoint ids indexed for a thread, newest first."""
+    return [item.decode() for item in redis_client.zrevrange(saver._make_index_key(thread_id), 0, -1)]
+
+
+def assert_no_orphans(redis_client, saver, thread_id):
+    """Every indexed id has a blob, and every blob or writes hash is indexed."""
+    indexed = set(stored_ids(redis_client, saver, thread_id))
+    prefix = saver._make_key(thread_id)[:-len("latest")]
+    stored, writes = set(), set()
+    for key in (key.decode() for key in redis_client.keys(prefix + "*")):
+        suffix = key[len(prefix):]
+        if suffix.endswith(":writes"):
+            writes.add(suffix[:-len(":writes")])
+        elif suffix not in ("index", "latest", "summary", "messages"):
+            stored.add(suffix)
+    assert stored == indexed
+    assert writes <= indexed
+
+
+@pytest.mark.parametrize("delta_messages", [False, True], ids=["plain", "delta"])
+def test_turn_ends_only_keeps_the_last_checkpoint_of_each_turn(redis_client, delta_messages):
+    saver = RedisCheckpointSaver(redis_client, turn_ends_only=True, delta_messages=delta_messages)
+    graph = build_graph(saver)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(graph, config, 3)
+
+    history = list(graph.get_state_history(config))
+    assert [snapshot.values["count"] for snapshot in history] == [3, 2, 1]
+    assert all(snapshot.next == () for snapshot in history)
+    assert len(history[0].values["messages"]) == 6
+    assert_no_orphans(redis_client, saver, "t")
+
+
+def test_turn_ends_only_async(async_redis_client, redis_client):
+    saver = AsyncRedisCheckpointSaver(async_redis_client, turn_ends_only=True)
+    config = {"configurable": {"thread_id": "t"}}
+    asyncio.run(arun_turns(build_graph(saver), config, 3))
+
+    assert len(stored_ids(redis_client, saver, "t")) == 3
+    assert_no_orphans(redis_client, saver, "t")
+
+
+def test_turn_ends_only_keeps_history_under_a_fork(redis_client):
+    saver = RedisCheckpointSaver(redis_client, turn_ends_only=True)
+    graph = build_graph(saver)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(graph, config, 3)
+    turn_ends = stored_ids(redis_client, saver, "t")
+    first_turn = saver.get_tuple({"configurable": {"thread_id": "t", "checkpoint_id": turn_ends[-1]}})
+
+    # Re-run the second turn's branches from the end of the first turn
+    fork = graph.update_state(first_turn.config, {"log": ["fork"]}, as_node="start")
+    result = graph.invoke(None, fork, durability=DURABILITY)
+
+    assert result["count"] == 2
+    remaining = stored_ids(redis_client, saver, "t")
+    assert set(turn_ends) < set(remaining)
+    assert len(remaining) == len(turn_ends) + 1
+    assert saver.get_tuple(config).checkpoint["channel_values"]["count"] == 2
+    assert_no_orphans(redis_client, saver, "t")
+
+
+def test_keep_last_trims_the_index(redis_client):
+    saver = RedisCheckpointSaver(redis_client, keep_last=4)
+    graph = build_graph(saver)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(graph, config, 3)
+
+    assert len(stored_ids(redis_client, saver, "t")) == 4
+    assert len(list(saver.list(config))) == 4
+    assert graph.get_state(config).values["count"] == 3
+    assert_no_orphans(redis_client, saver, "t")
+
+
+def test_completed_sessions_get_the_completed_ttl(redis_client):
+    saver = RedisCheckpointSaver(redis_client, ttl=1000, completed_ttl=50)
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {COMPLETED_CHANNEL: True}
+    config = saver.put({"configurable": {"thread_id": "t", "checkpoint_ns": ""}}, checkpoint, {}, {})
+    saver.put_writes(config, [("log", ["late"])], "task-1")
+
+    assert 0 < redis_client.ttl(saver._make_key("t", "", checkpoint["id"])) <= 50
+    assert 0 < redis_client.ttl(saver._make_writes_key("t", "", checkpoint["id"])) <= 50
+    assert 0 < redis_client.ttl(saver._make_key("t")) <= 50
+
+
+def test_sliding_ttl_refreshes_on_read(redis_client):
+    saver = RedisCheckpointSaver(redis_client, ttl=1000, sliding_ttl=True)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(build_graph(saver), config, 1)
+    latest_id = saver.get_tuple(config).config["configurable"]["checkpoint_id"]
+    for key in (saver._make_key("t"), saver._make_key("t", "", latest_id), saver._make_index_key("t")):
+        redis_client.expire(key, 10)
+
+    saver.get_tuple(config)
+    for key in (saver._make_key("t"), saver._make_key("t", "", latest_id), saver._make_index_key("t")):
+        assert redis_client.ttl(key) > 10
@@ -0,0 +1,128 @@
+"""Question prompt context: window split, block folding, summary and window budgets."""
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.agents.context_window import (
+    SUMMARY_ANSWER_TOKENS,
+    SUMMARY_TRIMMED,
+    clip_to_tokens,
+    estimate_tokens,
+    fit_messages,
+    fold_into_summary,
+    split_context,
+)
+
+
+def history(turns):
+    """``turns`` question/answer exchanges, oldest first."""
+    messages = []
+    for turn in range(1, turns + 1):
+        messages += [AIMessage(content=f"question {turn}"), HumanMessage(content=f"answer {turn}")]
+    return messages
+
+
+def test_split_folds_nothing_until_a_block_has_left_the_window():
+    messages = history(7)
+    folded, window = split_context(messages, 0, recent_turns=4, fold_turns=4)
+    assert folded == []
+    assert window == messages
+
+
+def test_split_folds_a_whole_block_at_once():
+    messages = history(8)
+    folded, window = split_context(messages, 0, recent_turns=4, fold_turns=4)
+    assert [m.content for m in folded if isinstance(m, HumanMessage)] == [f"answer {n}" for n in range(1, 5)]
+    assert window == messages[len(folded):]
+
+
+def test_window_only_grows_at_the_end_between_folds():
+    messages = history(10)
+    summarized = len(split_context(history(8), 0, recent_turns=4, fold_turns=4)[0])
+    previous = split_context(messages[:-2], summarized, recent_turns=4, fold_turns=4)
+    current = split_context(messages, summarized, recent_turns=4, fold_turns=4)
+    assert previous[0] == current[0] == []
+    assert current[1][:len(previous[1])] == previous[1]
+
+
+def test_split_with_single_turn_folds_every_turn():
+    messages = history(6)
+    folded, window = split_context(messages, 0, recent_turns=4)
+    assert len(folded) == 5
+    assert isinstance(window[0], HumanMessage) and window[0].content == "answer 3"
+
+
+def test_estimate_counts_cjk_characters_as_one_token_each():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("我喜歡讀書") == 5
+    assert estimate_tokens("我喜歡 book") == 3 + 2
+
+
+def test_clip_marks_the_cut_and_fits_the_budget():
+    text = "word " * 100
+    clipped = clip_to_tokens(text, 10)
+    assert clipped.endswith("…")
+    assert estimate_tokens(clipped) <= 10
+    assert clip_to_tokens("short", 10) == "short"
+
+
+def test_split_keeps_the_last_user_turns_verbatim():
+    messages = history(6)
+    folded, window = split_context(messages, 0, recent_turns=2)
+    assert [m.content for m in window] == ["answer 5", "question 6", "answer 6"]
+    assert folded + window == messages
+
+
+def test_split_never_unfolds_already_summarized_messages():
+    messages = history(3)
+    folded, window = split_context(messages, 4, recent_turns=4)
+    assert folded == []
+    assert window == messages[4:]
+
+
+def test_fold_condenses_each_message_to_one_clipped_line():
+    long_answer = "because " * 200
+    summary = fold_into_summary("", [AIMessage(content="Why?"), HumanMessage(content=long_answer), AIMessage(content=" ")], 1000)
+    lines = summary.split("\n")
+    assert lines[0] == "Interviewer: Why?"
+    assert lines[1].startswith("Reader: because")
+    assert estimate_tokens(lines[1]) <= SUMMARY_ANSWER_TOKENS + 2
+    assert len(lines) == 2
+
+
+def test_fold_appends_to_the_running_summary():
+    first = fold_into_summary("", history(1), 1000)
+    assert fold_into_summary(first, history(2)[2:], 1000) == fold_into_summary("", history(2), 1000)
+
+
+def test_fold_drops_the_oldest_lines_past_the_cap():
+    summary = fold_into_summary("", history(40), 100)
+    lines = summary.split("\n")
+    assert lines[0] == SUMMARY_TRIMMED
+    assert lines[-1] == "Reader: answer 40"
+    assert estimate_tokens("\n".join(lines[1:])) <= 100
+
+    # The marker is not counted twice on the next fold
+    again = fold_into_summary(summary, history(41)[-2:], 100)
+    assert again.count(SUMMARY_TRIMMED) == 1
+    assert again.split("\n")[-1] == "Reader: answer 41"
+
+
+def test_fit_returns_the_window_unchanged_when_it_fits():
+    messages = history(2)
+    assert fit_messages(messages, 1000) is messages
+
+
+def test_fit_clips_the_oldest_messages_first():
+    messages = [
+        HumanMessage(content="old " * 200),
+        AIMessage(content="question"),
+        HumanMessage(content="new " * 200),
+    ]
+    fitted = fit_messages(messages, 250)
+    sizes = [estimate_tokens(str(m.content)) for m in fitted]
+    assert sum(sizes) <= 250
+    assert fitted[0].content.endswith("…")
+    assert fitted[2] is messages[2]
+    # Clipping copies; the state's messages are untouched
+    assert messages[0].content == "old " * 200
@@ -0,0 +1,66 @@
+"""ConversationAnalyzerTool: running coverage counters fed one turn at a time."""
+
+from src.tools import ConversationAnalyzerTool
+
+ANSWERS = [
+    "I love that novel, the plot twists kept me going",
+    "Mostly the prose and the narrator's voice",
+    "I read a few pages daily before bed",
+    "Nothing much",
+]
+
+
+def test_update_counts_each_message_once_per_dimension():
+    result = ConversationAnalyzerTool().update({}, 0, ANSWERS[:1])
+    # "novel" and "plot" are both in the first answer; one message counts once per dimension
+    assert result["coverage_hits"] == {
+        "taste_anchors": 1,
+        "style_preference": 0,
+        "narrative_desire": 1,
+        "consumption_habit": 0,
+    }
+    assert result["turn_count"] == 1
+    assert result["coverage_score"] == 0.5
+
+
+def test_incremental_updates_match_a_full_scan():
+    tool = ConversationAnalyzerTool()
+    hits, turns = {}, 0
+    for answer in ANSWERS:
+        result = tool.update(hits, turns, [answer])
+        hits, turns = result["coverage_hits"], result["turn_count"]
+
+    full = tool._run(
+        [{"role": "assistant", "content": "Tell me more"}]
+        + [{"role": "user", "content": answer} for answer in ANSWERS]
+    )
+    assert result == full
+    assert result["turn_count"] == 4
+    assert result["coverage"] == {dimension: True for dimension in hits}
+    assert not result["ready_for_summary"]
+
+
+def test_update_does_not_mutate_the_carried_counters():
+    tool = ConversationAnalyzerTool()
+    hits = tool.update({}, 0, ANSWERS[:1])["coverage_hits"]
+    before = dict(hits)
+    tool.update(hits, 1, ANSWERS[1:2])
+    assert hits == before
+
+
+def test_ready_for_summary_needs_eight_turns_and_coverage():
+    tool = ConversationAnalyzerTool()
+    covered = tool.update({}, 0, ANSWERS[:3])
+    assert not covered["ready_for_summary"]
+
+    later = tool.update(covered["coverage_hits"], covered["turn_count"], ["Nothing much"] * 5)
+    assert later["turn_count"] == 8
+    assert later["ready_for_summary"]
+    assert later["recommendation"] == "Consider wrapping up and summarizing profile"
+
+    uncovered = tool.update({}, 0, ["Nothing much"] * 8)
+    assert not uncovered["ready_for_summary"]
+
+
+def test_empty_history():
+    assert ConversationAnalyzerTool()._run([]) == {"turn_count": 0, "coverage": {}, "ready_for_summary": False}
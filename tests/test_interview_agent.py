@@ -0,0 +1,296 @@
+"""InterviewAgent: state updates, session summaries, and turns run on a fake chat model."""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.agents import interview_agent
+from src.agents.interview_agent import InterviewAgent
+from src.agents.redis_checkpointer import RedisCheckpointSaver
+from src.agents.sqlite_checkpointer import SQLiteCheckpointSaver
+from src.prompts.interview_prompts import InterviewPrompts
+from src.config import settings
+
+FACET_REPLY = '{"loves": ["Dune"]}'
+PROFILE_REPLY = '{"taste_anchors": {"loves": ["Dune"]}}'
+REASONING = "The reader likes science fiction."
+
+
+class FakeInterviewModel(BaseChatModel):
+    """Chat model that asks numbered questions, answers facet prompts after ``facet_delay`` seconds, and writes profiles.
+
+    Questions come with ``REASONING`` as reasoning content; streamed, that arrives
+    first and the question follows word by word. Question prompts are kept in ``prompts``.
+    """
+
+    facet_delay: float = 0.0
+    questions: int = 0
+    profiles: int = 0
+    prompts: List[List[BaseMessage]] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-interview"
+
+    def _reply(self, messages: List[BaseMessage]) -> AIMessage:
+        if "take notes during an interview" in str(messages[0].content):
+            time.sleep(self.facet_delay)
+            return AIMessage(content=FACET_REPLY)
+        if "INTERVIEW METADATA:" in str(messages[0].content):
+            self.profiles += 1
+            return AIMessage(content=PROFILE_REPLY)
+        self.questions += 1
+        self.prompts.append(messages)
+        return AIMessage(content=f"Question {self.questions}?", additional_kwargs={"reasoning_content": REASONING})
+
+    def _generate(
+        self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    def _stream(
+        self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any
+    ) -> Iterator[ChatGenerationChunk]:
+        reply = self._reply(messages)
+        if reply.additional_kwargs:
+            yield ChatGenerationChunk(message=AIMessageChunk(content="", additional_kwargs=reply.additional_kwargs))
+        words = reply.content.split(" ")
+        for index, word in enumerate(words):
+            token = word if index == len(words) - 1 else word + " "
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+
+@pytest.fixture
+def model():
+    return FakeInterviewModel()
+
+
+@pytest.fixture
+def fake_llm(monkeypatch, model):
+    """Agents built in the test run on ``model`` and skip settings validation."""
+    monkeypatch.setattr(settings, "validate", lambda: None)
+    monkeypatch.setattr(settings, "llm_warmup", False)
+    monkeypatch.setattr(interview_agent, "get_llm", lambda mode="interview": model)
+    return model
+
+
+@pytest.fixture
+def agent(fake_llm):
+    return InterviewAgent(checkpointer=MemorySaver())
+
+
+@pytest.mark.parametrize(
+    "completion_status, is_complete",
+    [("complete", True), ("early_exit", False), ("interrupted", False)],
+)
+def test_profile_update_marks_only_finished_interviews_complete(completion_status, is_complete):
+    state = {"messages": [AIMessage(content="What did you read last?"), HumanMessage(content="Dune")], "turn_count": 1}
+    reply = AIMessage(content='```json\n{"taste_anchors": ["Dune"]}\n```')
+
+    update = InterviewAgent._profile_update(state, reply, completion_status)
+
+    assert update["is_complete"] is is_complete
+    assert update["profile_data"]["taste_anchors"] == ["Dune"]
+    assert update["profile_data"]["_metadata"]["completion_status"] == completion_status
+    assert update["profile_data"]["_metadata"]["early_termination"] is not is_complete
+
+
+def test_slow_facet_extraction_does_not_delay_the_question(monkeypatch, agent, model):
+    monkeypatch.setattr(settings, "profile_facets", True)
+    model.facet_delay = 1.0
+    agent.start_interview("t")
+
+    started = time.monotonic()
+    events = list(agent.stream_message("I loved Dune", "t"))
+    assert time.monotonic() - started < model.facet_delay / 2
+    assert events[-1]["message"] == "Question 1?"
+    assert agent.get_facets("t") == {}
+
+    # The finished extraction is merged at the start of the next turn
+    agent._facet_jobs["t"].result()
+    agent.send_message("Mostly science fiction", "t")
+    assert agent.get_facets("t")["loves"] == ["Dune"]
+    assert agent.app.get_state({"configurable": {"thread_id": "t"}}).values["facet_messages"] == 1
+
+
+def test_profile_is_regenerated_when_the_completion_status_changes(agent, model):
+    agent.start_interview("t")
+    agent.send_message("I loved Dune", "t")
+
+    early = agent.generate_profile("t", completion_status="early_exit")
+    assert early["_metadata"]["completion_status"] == "early_exit"
+    assert agent.generate_profile("t", completion_status="early_exit") == early
+    assert model.profiles == 1
+
+    complete = agent.generate_profile("t", completion_status="complete")
+    assert model.profiles == 2
+    assert complete["_metadata"] == {"interview_turns": 1, "completion_status": "complete", "early_termination": False}
+    assert agent.get_profile("t")["profile_data"]["_metadata"]["completion_status"] == "complete"
+    assert agent.get_profile("t")["is_complete"] is True
+
+
+@pytest.mark.parametrize("backend", ["redis", "sqlite"])
+def test_get_profile_reads_the_session_summary(request, tmp_path, fake_llm, backend):
+    if backend == "redis":
+        checkpointer = RedisCheckpointSaver(request.getfixturevalue("redis_client"))
+    else:
+        checkpointer = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"))
+    agent = InterviewAgent(checkpointer=checkpointer)
+    agent.start_interview("t")
+    agent.send_message("I loved Dune", "t")
+    agent.send_message("Mostly science fiction", "t")
+    agent.generate_profile("t", completion_status="early_exit")
+    values = agent.app.get_state({"configurable": {"thread_id": "t"}}).values
+
+    summary = checkpointer.get_summary("t")
+    assert summary["turn_count"] == 2
+    assert summary["message_count"] == len(values["messages"])
+
+    # No checkpoint is loaded to answer get_profile
+    def no_state(config):
+        raise AssertionError("get_profile decoded the full checkpoint")
+
+    agent.app.get_state = no_state
+    assert agent.get_profile("t") == InterviewAgent._profile_result(None, values)
+
+
+def message_fields(agent, thread_id):
+    messages = agent.app.get_state({"configurable": {"thread_id": thread_id}}).values["messages"]
+    return [(m.type, m.content, m.additional_kwargs) for m in messages]
+
+
+def test_stream_message_streams_the_reply_that_send_message_returns(agent, model):
+    agent.start_interview("sent")
+    sent = agent.send_message("I loved Dune", "sent")
+    model.questions = 0
+    agent.start_interview("streamed")
+    events = list(agent.stream_message("I loved Dune", "streamed"))
+
+    assert events[0] == {"type": "reasoning", "text": REASONING}
+    tokens = [event["text"] for event in events if event["type"] == "token"]
+    assert len(tokens) > 1
+    assert "".join(tokens) == sent["message"]
+    assert events[-1] == {"type": "done", **sent}
+    assert sent["turn_count"] == 1
+    # The checkpointed state is the same either way
+    assert message_fields(agent, "streamed") == message_fields(agent, "sent")
+
+
+def test_async_api_matches_the_sync_api(agent, model):
+    sync_results = [
+        agent.start_interview("sync"),
+        agent.send_message("I loved Dune", "sync"),
+        list(agent.stream_message("Mostly science fiction", "sync")),
+        agent.generate_profile("sync", completion_status="early_exit"),
+        agent.get_profile("sync"),
+    ]
+    model.questions = model.profiles = 0
+
+    async def run():
+        events = []
+        results = [
+            await agent.astart_interview("async"),
+            await agent.asend_message("I loved Dune", "async"),
+        ]
+        async for event in agent.astream_message("Mostly science fiction", "async"):
+            events.append(event)
+        results.append(events)
+        results.append(await agent.agenerate_profile("async", completion_status="early_exit"))
+        results.append(await agent.aget_profile("async"))
+        return results
+
+    assert asyncio.run(run()) == sync_results
+    assert message_fields(agent, "async") == message_fields(agent, "sync")
+
+
+def test_async_interviews_run_concurrently(agent):
+    async def interview(thread_id):
+        await agent.astart_interview(thread_id)
+        await agent.asend_message(f"I loved book {thread_id}", thread_id)
+        return await agent.asend_message("Mostly science fiction", thread_id)
+
+    async def run():
+        return await asyncio.gather(*(interview(str(n)) for n in range(5)))
+
+    assert [result["turn_count"] for result in asyncio.run(run())] == [2] * 5
+    for n in range(5):
+        answers = [content for kind, content, _ in message_fields(agent, str(n)) if kind == "human"]
+        assert answers == [f"I loved book {n}", "Mostly science fiction"]
+
+
+def test_importing_the_agents_builds_no_graph():
+    code = "import src.agents\nfrom src.agents import interview_agent\nassert interview_agent._graph_app is None"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1])
+
+
+def test_graph_app_is_built_once_on_first_access(monkeypatch, fake_llm):
+    monkeypatch.setattr(interview_agent, "_graph_app", None)
+    monkeypatch.setattr(settings, "checkpoint_backend", "memory")
+
+    app = interview_agent.graph_app
+    assert isinstance(app.checkpointer, MemorySaver)
+    assert interview_agent.graph_app is app
+
+
+def test_create_graph_app_uses_the_host_checkpointer(fake_llm):
+    checkpointer = MemorySaver()
+    app = interview_agent.create_graph_app(checkpointer)
+    assert app.checkpointer is checkpointer
+
+
+def prompt_text(messages):
+    return "".join(f"<{message.type}>{message.content}" for message in messages)
+
+
+def test_question_prompt_has_the_static_system_prompt_first_and_turn_notes_last(agent, model):
+    agent.start_interview("t")
+    agent.send_message("I loved Dune", "t")
+    values = agent.app.get_state({"configurable": {"thread_id": "t"}}).values
+
+    prompt = model.prompts[-1]
+    assert prompt[0].content.startswith(InterviewPrompts.get_system_prompt())
+    turn_notes = InterviewPrompts.get_turn_notes(values["turn_count"], values["current_analysis"])
+    assert prompt[-1].content.endswith(turn_notes)
+    assert "I loved Dune" in prompt[-1].content
+
+    # An unchanged history gives a byte-identical prompt
+    before_reply = {**values, "messages": values["messages"][:-1]}
+    assert prompt_text(agent._question_messages(before_reply)[0]) == prompt_text(prompt)
+
+
+def test_each_question_prompt_extends_the_previous_one(monkeypatch, agent, model):
+    monkeypatch.setattr(settings, "context_recent_turns", 2)
+    monkeypatch.setattr(settings, "context_fold_turns", 2)
+    agent.start_interview("t")
+    for answer in ["I loved Dune", "Mostly science fiction", "Le Guin too", "Slow, quiet endings", "Paperbacks"]:
+        agent.send_message(answer, "t")
+
+    config = {"configurable": {"thread_id": "t"}}
+    states = [snapshot.values for snapshot in agent.app.get_state_history(config)]
+    turn_notes = {
+        values["turn_count"]: InterviewPrompts.get_turn_notes(values["turn_count"], values["current_analysis"])
+        for values in states if values.get("current_analysis")
+    }
+
+    # Between folds, the previous prompt up to the end of its answer is a byte-identical prefix
+    for turn in (1, 2, 4):
+        previous = prompt_text(model.prompts[turn - 1])
+        current = prompt_text(model.prompts[turn])
+        assert previous.endswith("\n\n---\n\n" + turn_notes[turn])
+        assert current.startswith(previous[:-len("\n\n---\n\n" + turn_notes[turn])])
+
+    # Turn 4 folds the oldest turns into the summary, right after the static system prompt
+    assert "EARLIER IN THIS INTERVIEW" not in prompt_text(model.prompts[2])
+    folded = model.prompts[3][0].content
+    assert folded.startswith(InterviewPrompts.get_system_prompt() + "\n\nEARLIER IN THIS INTERVIEW")
+    assert "I loved Dune" in folded.split("---")[0]
+    assert agent.app.get_state(config).values["summarized_messages"] > 0
@@ -0,0 +1,153 @@
+"""LLMResponseCache: store round-trips, keys, TTL, errors and the temperature bypass."""
+
+import time
+
+import pytest
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+
+from src.config import settings
+from src.utils import llm_factory
+from src.utils.llm_cache import (
+    CACHE_HIT_METADATA,
+    DiskLLMCache,
+    LLMResponseCache,
+    MemoryLLMCache,
+    RedisLLMCache,
+)
+
+PROMPT = '[{"type": "human", "content": "What did you read last?"}]'
+LLM_STRING = "ChatOpenAI model=gpt-4o temperature=0"
+
+
+@pytest.fixture(params=["memory", "disk", "redis"])
+def cache(request, tmp_path, redis_client):
+    if request.param == "memory":
+        return MemoryLLMCache(max_entries=8)
+    if request.param == "disk":
+        return DiskLLMCache(str(tmp_path / "llm"))
+    return RedisLLMCache(redis_client)
+
+
+def test_round_trip_restores_messages_and_flags_the_hit(cache):
+    reply = AIMessage(
+        content="Dune, mostly.",
+        usage_metadata={"input_tokens": 12, "output_tokens": 3, "total_tokens": 15},
+        response_metadata={"model_name": "gpt-4o"},
+    )
+    assert cache.lookup(PROMPT, LLM_STRING) is None
+    cache.update(PROMPT, LLM_STRING, [ChatGeneration(message=reply), Generation(text="plain")])
+
+    message, plain = cache.lookup(PROMPT, LLM_STRING)
+    assert message.message.content == "Dune, mostly."
+    assert message.message.usage_metadata["input_tokens"] == 12
+    assert message.message.response_metadata == {"model_name": "gpt-4o", CACHE_HIT_METADATA: True}
+    assert plain.text == "plain"
+    assert cache.stats() == {
+        "backend": cache.backend, "hits": 1, "misses": 1, "hit_rate": 0.5, "writes": 1, "bypassed": 0, "errors": 0,
+    }
+
+
+def test_a_different_prompt_or_model_misses(cache):
+    cache.update(PROMPT, LLM_STRING, [Generation(text="cached")])
+    assert cache.lookup(PROMPT + " ", LLM_STRING) is None
+    assert cache.lookup(PROMPT, LLM_STRING.replace("temperature=0", "temperature=0.7")) is None
+
+
+def test_clear_drops_every_response(cache):
+    cache.update(PROMPT, LLM_STRING, [Generation(text="cached")])
+    cache.clear()
+    assert cache.lookup(PROMPT, LLM_STRING) is None
+
+
+def test_stores_implement_get_set_and_clear():
+    with pytest.raises(TypeError):
+        LLMResponseCache()
+
+
+def test_memory_cache_expires_and_evicts():
+    cache = MemoryLLMCache(max_entries=2, ttl=1)
+    for n in range(3):
+        cache.update(f"prompt {n}", LLM_STRING, [Generation(text=str(n))])
+    assert cache.lookup("prompt 0", LLM_STRING) is None
+    assert cache.lookup("prompt 2", LLM_STRING)[0].text == "2"
+
+    cache._entries[cache.cache_key("prompt 2", LLM_STRING)] = (time.time() - 1, b"[]")
+    assert cache.lookup("prompt 2", LLM_STRING) is None
+
+
+def test_store_errors_count_as_misses(redis_server, redis_client):
+    cache = RedisLLMCache(redis_client)
+    redis_server.connected = False
+    cache.update(PROMPT, LLM_STRING, [Generation(text="lost")])
+    assert cache.lookup(PROMPT, LLM_STRING) is None
+    assert cache.stats()["errors"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_model_calls_are_served_from_the_cache():
+    cache = MemoryLLMCache()
+    model = FakeListChatModel(responses=["first", "second"], cache=cache)
+    assert model.invoke("hello").content == "first"
+    cached = model.invoke("hello")
+    assert cached.content == "first"
+    assert cached.response_metadata[CACHE_HIT_METADATA] is True
+    assert model.invoke("something else").content == "second"
+
+
+@pytest.fixture
+def shared_cache(monkeypatch):
+    cache = MemoryLLMCache()
+    monkeypatch.setattr(llm_factory, "get_llm_cache", lambda: cache)
+    monkeypatch.setattr(settings, "llm_cache_modes", ["interview", "profile"])
+    monkeypatch.setattr(settings, "llm_cache_max_temperature", 0.0)
+    return cache
+
+
+def test_models_above_the_max_temperature_bypass_the_cache(shared_cache):
+    assert llm_factory._response_cache("profile", 0.0) is shared_cache
+
+    bypass = llm_factory._response_cache("interview", 0.7)
+    model = FakeListChatModel(responses=["first", "second"], cache=bypass)
+    assert model.invoke("hello").content == "first"
+    assert model.invoke("hello").content == "second"
+    assert shared_cache.stats()["bypassed"] == 2
+    assert shared_cache.stats()["writes"] == 0
+
+
+def test_max_temperature_none_caches_sampled_models(shared_cache, monkeypatch):
+    monkeypatch.setattr(settings, "llm_cache_max_temperature", None)
+    assert llm_factory._response_cache("interview", 0.7) is shared_cache
+
+
+def test_modes_outside_llm_cache_modes_are_not_cached(shared_cache, monkeypatch):
+    monkeypatch.setattr(settings, "llm_cache_modes", ["profile"])
+    assert llm_factory._response_cache("interview", 0.0) is None
+
+
+@pytest.fixture
+def fake_provider(monkeypatch):
+    cache = MemoryLLMCache()
+    monkeypatch.setattr(llm_factory, "get_llm_cache", lambda: cache)
+    monkeypatch.setattr(settings, "llm_router", False)
+    monkeypatch.setattr(settings, "llm_provider", "fake")
+    monkeypatch.setitem(
+        llm_factory.PROVIDERS, "fake",
+        lambda mode, temperature, cache: FakeListChatModel(responses=["first", "second"], cache=cache),
+    )
+    llm_factory.clear_llm_clients()
+    yield cache
+    llm_factory.clear_llm_clients()
+
+
+def test_get_llm_caches_profiles_but_not_questions_by_default(fake_provider):
+    profile = llm_factory.get_llm("profile")
+    assert profile.invoke("transcript").content == "first"
+    assert profile.invoke("transcript").response_metadata[CACHE_HIT_METADATA] is True
+
+    interview = llm_factory.get_llm("interview")
+    assert interview.invoke("transcript").content == "first"
+    assert interview.invoke("transcript").content == "second"
+    assert fake_provider.stats()["hits"] == 1
+    assert fake_provider.stats()["bypassed"] == 2
@@ -0,0 +1,87 @@
+"""get_llm: provider SDKs imported on use, and one shared model per mode over pooled HTTP clients."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from langchain_core.language_models import FakeListChatModel
+
+from src.config import settings
+from src.utils import llm_factory
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def loaded_sdks(code: str) -> str:
+    """Provider SDK modules loaded after running ``code`` in a fresh interpreter."""
+    code += "\nimport sys\nprint(sorted(m for m in ('langchain_openai', 'langchain_google_genai') if m in sys.modules))"
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True, cwd=ROOT
+    ).stdout.strip().splitlines()[-1]
+
+
+def test_importing_the_agents_loads_no_provider_sdk():
+    assert loaded_sdks("import src.agents\nimport src.utils.llm_factory") == "[]"
+
+
+def test_building_a_model_loads_only_its_provider_sdk():
+    code = (
+        "from src.config import settings\n"
+        "from src.utils.llm_factory import _build_moonshot\n"
+        "settings.moonshot_api_key = 'sk-test'\n"
+        "_build_moonshot('interview', 0.7, None)"
+    )
+    assert loaded_sdks(code) == "['langchain_openai']"
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    """Use a counting fake provider; the list records the mode of every model built."""
+    built = []
+
+    def build(mode, temperature, cache):
+        built.append(mode)
+        return FakeListChatModel(responses=[mode])
+
+    monkeypatch.setattr(settings, "llm_router", False)
+    monkeypatch.setattr(settings, "llm_provider", "fake")
+    monkeypatch.setattr(settings, "llm_cache", "none")
+    monkeypatch.setitem(llm_factory.PROVIDERS, "fake", build)
+    llm_factory.clear_llm_clients()
+    yield built
+    llm_factory.clear_llm_clients()
+
+
+def test_get_llm_builds_one_model_per_mode(builds):
+    interview = llm_factory.get_llm("interview")
+    assert llm_factory.get_llm("interview") is interview
+    assert llm_factory.get_llm("profile") is not interview
+    assert builds == ["interview", "profile"]
+
+    llm_factory.clear_llm_clients()
+    assert llm_factory.get_llm("interview") is not interview
+    assert builds == ["interview", "profile", "interview"]
+
+
+def test_concurrent_callers_share_one_model(builds):
+    models = []
+    threads = [threading.Thread(target=lambda: models.append(llm_factory.get_llm("profile"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert builds == ["profile"]
+    assert all(model is models[0] for model in models)
+
+
+def test_openai_compatible_models_share_the_http_clients(monkeypatch):
+    monkeypatch.setattr(settings, "moonshot_api_key", "sk-test")
+    monkeypatch.setattr(settings, "openai_api_key", "sk-test")
+    moonshot = llm_factory._build_moonshot("interview", 0.7, None)
+    openai = llm_factory._build_openai("profile", 0, None)
+
+    assert moonshot.http_client is openai.http_client
+    assert moonshot.http_async_client is openai.http_async_client
@@ -0,0 +1,224 @@
+"""LLMRouter: failover, latency ranking, probing, hedging and stream failover."""
+
+import asyncio
+import time
+from typing import Any, List
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from src.utils.llm_router import PROBE_INTERVAL, UNHEALTHY_ERROR_RATE, LLMRouter
+
+
+class ScriptedModel(BaseChatModel):
+    """Answers with its own name after ``delay`` seconds, or raises if ``fail`` is set."""
+
+    reply: str
+    delay: float = 0.0
+    fail: bool = False
+    fail_after_chunks: int = -1
+    calls: int = 0
+    cancelled: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def _result(self) -> ChatResult:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError(f"{self.reply} is down")
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.reply))])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.delay)
+        return self._result()
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self._result()
+
+    def _chunks(self) -> List[str]:
+        self.calls += 1
+        return [f"{self.reply} ", "streams"]
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        for index, text in enumerate(self._chunks()):
+            if self.fail and index == max(self.fail_after_chunks, 0):
+                raise RuntimeError(f"{self.reply} is down")
+            yield ChatGenerationChunk(message=AIMessageChunk(content=text))
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        for index, text in enumerate(self._chunks()):
+            if self.fail and index == max(self.fail_after_chunks, 0):
+                raise RuntimeError(f"{self.reply} is down")
+            yield ChatGenerationChunk(message=AIMessageChunk(content=text))
+
+
+def make_router(*models: ScriptedModel, **options: Any) -> LLMRouter:
+    return LLMRouter(providers=[(model.reply, model) for model in models], **options)
+
+
+def prime(router: LLMRouter, name: str, seconds: float, calls: int = 1) -> None:
+    for _ in range(calls):
+        router._stats[name].observe(seconds, ok=True)
+
+
+def ranking(router: LLMRouter) -> List[str]:
+    return [name for name, _ in router._ranked()]
+
+
+def test_failed_call_moves_to_the_next_provider():
+    primary, backup = ScriptedModel(reply="primary", fail=True), ScriptedModel(reply="backup")
+    router = make_router(primary, backup)
+
+    assert router.invoke("hi").content == "backup"
+    stats = router.stats()
+    assert stats["primary"]["errors"] == 1
+    assert stats["backup"]["calls"] == 1
+
+
+def test_all_providers_failing_raises_the_last_error():
+    router = make_router(ScriptedModel(reply="one", fail=True), ScriptedModel(reply="two", fail=True))
+    with pytest.raises(RuntimeError, match="two is down"):
+        router.invoke("hi")
+
+
+def test_unhealthy_provider_is_tried_last():
+    router = make_router(ScriptedModel(reply="primary"), ScriptedModel(reply="backup"))
+    prime(router, "backup", 0.5)
+    while router._stats["primary"].error_rate <= UNHEALTHY_ERROR_RATE:
+        router._stats["primary"].observe(0.1, ok=False)
+
+    assert ranking(router) == ["backup", "primary"]
+    assert router.invoke("hi").content == "backup"
+
+
+def test_providers_are_ranked_by_latency():
+    router = make_router(ScriptedModel(reply="slow"), ScriptedModel(reply="fast"))
+    prime(router, "slow", 0.5, calls=3)
+    prime(router, "fast", 0.1, calls=3)
+
+    assert ranking(router) == ["fast", "slow"]
+    assert router.invoke("hi").content == "fast"
+
+
+def test_idle_time_does_not_reset_the_ranking():
+    router = make_router(ScriptedModel(reply="slow"), ScriptedModel(reply="fast"))
+    prime(router, "slow", 0.5)
+    prime(router, "fast", 0.1)
+    # A long pause between turns ages every provider equally
+    for stats in router._stats.values():
+        stats.last_call -= 10 * PROBE_INTERVAL
+
+    assert ranking(router) == ["fast", "slow"]
+
+
+def test_stale_provider_is_probed_again():
+    router = make_router(ScriptedModel(reply="slow"), ScriptedModel(reply="fast"))
+    prime(router, "slow", 0.5)
+    prime(router, "fast", 0.1)
+    router._stats["slow"].last_call -= PROBE_INTERVAL + 1
+
+    assert ranking(router) == ["slow", "fast"]
+    assert router.invoke("hi").content == "slow"
+    assert ranking(router) == ["fast", "slow"]
+
+
+def test_error_rate_decays_while_idle():
+    router = make_router(ScriptedModel(reply="primary"), ScriptedModel(reply="backup"))
+    prime(router, "backup", 0.5)
+    while router._stats["primary"].error_rate <= UNHEALTHY_ERROR_RATE:
+        router._stats["primary"].observe(0.1, ok=False)
+    router._stats["primary"].last_call -= 10 * PROBE_INTERVAL
+    router._stats["backup"].last_call -= 10 * PROBE_INTERVAL
+
+    unhealthy, _ = router._stats["primary"].score(time.monotonic())
+    assert not unhealthy
+
+
+def hedged_router(primary_delay: float, **primary_options: Any):
+    primary = ScriptedModel(reply="primary", delay=primary_delay, **primary_options)
+    backup = ScriptedModel(reply="backup")
+    router = make_router(primary, backup, hedge=True, hedge_min_samples=5, hedge_min_delay=0.05)
+    prime(router, "primary", 0.01, calls=5)
+    prime(router, "backup", 0.02, calls=5)
+    return router, primary, backup
+
+
+def test_hedge_waits_for_enough_samples():
+    primary, backup = ScriptedModel(reply="primary", delay=0.2), ScriptedModel(reply="backup")
+    router = make_router(primary, backup, hedge=True, hedge_min_samples=5, hedge_min_delay=0.05)
+    assert router.invoke("hi").content == "primary"
+    assert backup.calls == 0
+
+
+def test_slow_call_is_hedged_and_the_backup_wins():
+    router, primary, backup = hedged_router(primary_delay=0.5)
+
+    started = time.perf_counter()
+    assert router.invoke("hi").content == "backup"
+    assert time.perf_counter() - started < 0.4
+    stats = router.stats()
+    assert (stats["primary"]["hedges"], stats["primary"]["hedge_wins"]) == (1, 1)
+
+
+def test_fast_call_is_not_hedged():
+    router, primary, backup = hedged_router(primary_delay=0.0)
+
+    assert router.invoke("hi").content == "primary"
+    assert backup.calls == 0
+    assert router.stats()["primary"]["hedges"] == 0
+
+
+def test_failed_primary_falls_back_without_counting_a_hedge():
+    router, primary, backup = hedged_router(primary_delay=0.0, fail=True)
+
+    assert router.invoke("hi").content == "backup"
+    assert router.stats()["primary"]["hedges"] == 0
+
+
+def test_async_hedge_cancels_the_slow_call():
+    router, primary, backup = hedged_router(primary_delay=0.5)
+
+    assert asyncio.run(router.ainvoke("hi")).content == "backup"
+    assert primary.cancelled == 1
+    stats = router.stats()
+    assert (stats["primary"]["hedges"], stats["primary"]["hedge_wins"]) == (1, 1)
+
+
+def test_async_failover():
+    router = make_router(ScriptedModel(reply="primary", fail=True), ScriptedModel(reply="backup"))
+    assert asyncio.run(router.ainvoke("hi")).content == "backup"
+
+
+def test_stream_fails_over_before_the_first_chunk():
+    router = make_router(ScriptedModel(reply="primary", fail=True), ScriptedModel(reply="backup"))
+    assert "".join(chunk.content for chunk in router.stream("hi")) == "backup streams"
+    assert router.stats()["primary"]["errors"] == 1
+
+
+def test_stream_failing_after_a_chunk_is_not_retried():
+    backup = ScriptedModel(reply="backup")
+    router = make_router(ScriptedModel(reply="primary", fail=True, fail_after_chunks=1), backup)
+    chunks = []
+    with pytest.raises(RuntimeError):
+        for chunk in router.stream("hi"):
+            chunks.append(chunk.content)
+    assert chunks == ["primary "]
+    assert backup.calls == 0
+
+
+def test_async_stream_fails_over_before_the_first_chunk():
+    router = make_router(ScriptedModel(reply="primary", fail=True), ScriptedModel(reply="backup"))
+
+    async def collect():
+        return "".join([chunk.content async for chunk in router.astream("hi")])
+
+    assert asyncio.run(collect()) == "backup streams"
@@ -0,0 +1,63 @@
+"""Per-turn profile facets: merging, caps, JSON parsing and transcript formatting."""
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from src.agents.profile_facets import (
+    FACET_FIELDS,
+    MAX_FACET_ENTRIES,
+    format_exchange,
+    merge_facets,
+    parse_json_object,
+)
+
+
+def test_merge_adds_new_entries_in_first_seen_order():
+    merged = merge_facets({"loves": ["Dune"]}, {"loves": ["Hyperion", "Dune"], "genres": "science fiction"})
+    assert merged["loves"] == ["Dune", "Hyperion"]
+    assert merged["genres"] == ["science fiction"]
+    assert set(merged) == set(FACET_FIELDS)
+
+
+def test_merge_deduplicates_case_insensitively_and_strips():
+    merged = merge_facets({"themes": ["Grief"]}, {"themes": ["grief", "  memory ", "MEMORY", ""]})
+    assert merged["themes"] == ["Grief", "memory"]
+
+
+def test_merge_ignores_unknown_keys_and_non_strings():
+    merged = merge_facets({}, {"favourite_colour": ["blue"], "hates": [None, 3, {"x": 1}, "cliffhangers"]})
+    assert "favourite_colour" not in merged
+    assert merged["hates"] == ["cliffhangers"]
+
+
+def test_merge_caps_each_list():
+    facets = {"loves": [f"book {n}" for n in range(MAX_FACET_ENTRIES - 1)]}
+    merged = merge_facets(facets, {"loves": ["new 1", "new 2", "new 3"]})
+    assert len(merged["loves"]) == MAX_FACET_ENTRIES
+    assert merged["loves"][-1] == "new 1"
+
+
+def test_merge_does_not_mutate_its_inputs():
+    facets = {"loves": ["Dune"]}
+    merge_facets(facets, {"loves": ["Hyperion"]})
+    assert facets == {"loves": ["Dune"]}
+
+
+def test_parse_plain_and_fenced_json():
+    assert parse_json_object('{"loves": ["Dune"]}') == {"loves": ["Dune"]}
+    assert parse_json_object('Here you go:\n```json\n{"genres": []}\n```\nDone.') == {"genres": []}
+
+
+def test_parse_rejects_invalid_or_non_object_json():
+    assert parse_json_object("not json") is None
+    assert parse_json_object('["Dune"]') is None
+    assert parse_json_object('```json\n{"loves": \n```') is None
+
+
+def test_format_exchange_labels_roles_and_skips_empty_and_system_messages():
+    transcript = format_exchange([
+        SystemMessage(content="instructions"),
+        AIMessage(content="What did you read last?"),
+        HumanMessage(content="Dune"),
+        AIMessage(content=" "),
+    ])
+    assert transcript == "INTERVIEWER: What did you read last?\n\nUSER: Dune"
@@ -0,0 +1,199 @@
+"""RedisCheckpointSaver: MemorySaver parity, the MULTI write path and the Lua read path."""
+
+import pytest
+import redis
+from langchain_core.messages import HumanMessage, RemoveMessage
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.agents.checkpoint_cache import CheckpointCache
+from src.agents.redis_checkpointer import RedisCheckpointSaver
+from tests.graph_helpers import (
+    assert_pending_writes_resume,
+    assert_saver_api_parity,
+    build_graph,
+    history_shape,
+    reference_history,
+    run_turns,
+)
+
+SAVER_OPTIONS = {
+    "plain": {},
+    "delta": {"delta_messages": True},
+    "cluster_keys": {"cluster_mode": True},
+    "cached": {"cache": "cache"},
+    "delta_cached": {"delta_messages": True, "cache": "cache"},
+}
+
+
+def make_saver(redis_client, options):
+    options = dict(options)
+    if options.get("cache") == "cache":
+        options["cache"] = CheckpointCache(max_entries=64)
+    return RedisCheckpointSaver(redis_client, **options)
+
+
+@pytest.mark.parametrize("options", SAVER_OPTIONS.values(), ids=SAVER_OPTIONS.keys())
+def test_api_matches_memory_saver(redis_client, options):
+    assert_saver_api_parity(make_saver(redis_client, options))
+
+
+@pytest.mark.parametrize("options", SAVER_OPTIONS.values(), ids=SAVER_OPTIONS.keys())
+def test_history_matches_memory_saver(redis_client, options):
+    graph = build_graph(make_saver(redis_client, options))
+    config = {"configurable": {"thread_id": "history"}}
+    run_turns(graph, config, 3)
+    assert history_shape(graph, config) == reference_history(3)
+
+
+@pytest.mark.parametrize("options", SAVER_OPTIONS.values(), ids=SAVER_OPTIONS.keys())
+def test_pending_writes_survive_a_failed_step(redis_client, options):
+    assert_pending_writes_resume(make_saver(redis_client, options))
+
+
+def test_put_returns_the_saved_checkpoint(redis_client):
+    saver = RedisCheckpointSaver(redis_client)
+    graph = build_graph(saver)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(graph, config, 1)
+    updated = graph.update_state(config, {"count": 7}, as_node="join")
+    latest = saver.get_tuple(config)
+    assert updated["configurable"]["checkpoint_id"] == latest.config["configurable"]["checkpoint_id"]
+    assert latest.checkpoint["channel_values"]["count"] == 7
+
+
+def test_latest_pointer_matches_index(redis_client):
+    saver = RedisCheckpointSaver(redis_client)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(build_graph(saver), config, 2)
+
+    newest = redis_client.zrevrange(saver._make_index_key("t"), 0, 0)[0].decode()
+    pointer = redis_client.hget(saver._make_key("t"), "id").decode()
+    assert pointer == newest == saver.get_tuple(config).config["configurable"]["checkpoint_id"]
+
+
+def test_read_script_rebuilds_messages_from_the_log(redis_client):
+    saver = RedisCheckpointSaver(redis_client, delta_messages=True)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(build_graph(saver), config, 2)
+
+    latest = saver.get_tuple(config)
+    stored = redis_client.get(saver._make_key("t", "", latest.config["configurable"]["checkpoint_id"]))
+    assert "messages" not in saver.serializer.loads(stored)["checkpoint"]["channel_values"]
+    assert [msg.content for msg in latest.checkpoint["channel_values"]["messages"]] == [
+        "answer 0", "reply 1", "answer 1", "reply 2"
+    ]
+    assert redis_client.llen(saver._make_messages_key("t")) == 4
+
+
+def test_read_script_returns_only_the_logged_prefix(redis_client):
+    saver = RedisCheckpointSaver(redis_client, delta_messages=True)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(build_graph(saver), config, 2)
+    # Entries past the latest checkpoint's offset (e.g. from a fork) are not sent back
+    redis_client.rpush(saver._make_messages_key("t"), b"x", b"y")
+
+    read = saver._read_checkpoint(**saver._read_args("t", "", None))
+    assert len(read[2]) == 4
+    assert len(saver.get_tuple(config).checkpoint["channel_values"]["messages"]) == 4
+
+
+def test_fork_from_an_older_checkpoint_is_stored_inline(redis_client):
+    def fork(graph, saver):
+        config = {"configurable": {"thread_id": "t"}}
+        run_turns(graph, config, 2)
+        older = list(saver.list(config))[3].config
+        forked = graph.update_state(older, {"messages": [HumanMessage(content="fork")]}, as_node="join")
+        return [msg.content for msg in graph.get_state(forked).values["messages"]]
+
+    saver = RedisCheckpointSaver(redis_client, delta_messages=True)
+    reference = MemorySaver()
+    assert fork(build_graph(saver), saver) == fork(build_graph(reference), reference)
+    # The log belongs to the main line; the fork did not extend it
+    assert redis_client.llen(saver._make_messages_key("t")) == 4
+
+
+def test_failed_write_leaves_no_orphaned_log_entries(redis_client, monkeypatch):
+    saver = RedisCheckpointSaver(redis_client, delta_messages=True)
+    graph = build_graph(saver)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(graph, config, 1)
+    messages_key = saver._make_messages_key("t")
+    assert redis_client.llen(messages_key) == 2
+
+    write_pipeline = saver._write_pipeline
+    writes = []
+
+    def failing_pipeline():
+        # The turn's input checkpoint is saved; the next one, which logs the answer, fails
+        pipe = write_pipeline()
+        writes.append(pipe)
+        if len(writes) > 1:
+            def execute(*args, **kwargs):
+                pipe.reset()
+                raise redis.exceptions.ConnectionError("connection lost")
+
+            pipe.execute = execute
+        return pipe
+
+    monkeypatch.setattr(saver, "_write_pipeline", failing_pipeline)
+    with pytest.raises(redis.exceptions.ConnectionError):
+        run_turns(graph, config, 1)
+    assert redis_client.llen(messages_key) == 2
+
+    # The log still ends where the latest checkpoint left it, so later turns keep delta storage
+    monkeypatch.setattr(saver, "_write_pipeline", write_pipeline)
+    run_turns(graph, {"configurable": {"thread_id": "t"}}, 1)
+    latest = saver.get_tuple(config)
+    stored = saver.serializer.loads(redis_client.get(saver._make_key("t", "", latest.config["configurable"]["checkpoint_id"])))
+    assert stored["message_offset"] == redis_client.llen(messages_key)
+
+
+@pytest.mark.parametrize("options", [SAVER_OPTIONS["delta"], SAVER_OPTIONS["delta_cached"]], ids=["delta", "delta_cached"])
+@pytest.mark.parametrize("edit", ["remove", "replace"])
+def test_rewritten_history_is_stored_inline(redis_client, options, edit):
+    def rewrite(graph, config):
+        first = graph.get_state(config).values["messages"][0]
+        if edit == "remove":
+            update = [RemoveMessage(id=first.id)]
+        else:
+            update = [HumanMessage(content="edited", id=first.id)]
+        graph.update_state(config, {"messages": update}, as_node="join")
+        run_turns(graph, config, 1)
+        return [msg.content for msg in graph.get_state(config).values["messages"]]
+
+    config = {"configurable": {"thread_id": "t"}}
+    saver = make_saver(redis_client, options)
+    reference = build_graph(MemorySaver())
+    graph = build_graph(saver)
+    run_turns(reference, config, 2)
+    run_turns(graph, config, 2)
+
+    assert rewrite(graph, config) == rewrite(reference, config)
+    # The log still holds the original prefix; only checkpoints before the edit point into it
+    assert redis_client.llen(saver._make_messages_key("t")) == 4
+    fresh = RedisCheckpointSaver(redis_client, delta_messages=True)
+    assert fresh.get_tuple(config).checkpoint["channel_values"]["messages"] == \
+        graph.get_state(config).values["messages"]
+
+
+def test_legacy_latest_blob_is_readable(redis_client):
+    saver = RedisCheckpointSaver(redis_client)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(build_graph(saver), config, 1)
+    latest = saver.get_tuple(config)
+
+    # Before the pointer hash, "latest" held a copy of the newest blob
+    blob = redis_client.get(saver._make_key("t", "", latest.config["configurable"]["checkpoint_id"]))
+    redis_client.delete(saver._make_key("t"))
+    redis_client.set(saver._make_key("t"), blob)
+
+    legacy = saver.get_tuple(config)
+    assert legacy.config == latest.config
+    assert legacy.checkpoint["channel_values"] == latest.checkpoint["channel_values"]
+
+
+def test_cluster_mode_tags_every_key(redis_client):
+    saver = RedisCheckpointSaver(redis_client, cluster_mode=True, delta_messages=True)
+    run_turns(build_graph(saver), {"configurable": {"thread_id": "t"}}, 1)
+    keys = [key.decode() for key in redis_client.keys("*")]
+    assert keys and all("{t}" in key for key in keys)
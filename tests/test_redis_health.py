@@ -0,0 +1,116 @@
+"""CircuitBreaker transitions and breaker-guarded saver calls."""
+
+import asyncio
+import pickle
+import time
+
+import pytest
+import redis
+
+from src.agents.async_redis_checkpointer import AsyncRedisCheckpointSaver
+from src.agents.redis_checkpointer import RedisCheckpointSaver
+from src.agents.redis_health import CircuitBreaker, CircuitOpenError
+
+RESET_TIMEOUT = 0.05
+
+
+def fail(breaker, times):
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_breaker_opens_at_the_threshold():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    fail(breaker, 2)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    fail(breaker, 1)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.stats() == {"state": "open", "consecutive_failures": 3, "times_opened": 1, "rejected": 1}
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    fail(breaker, 2)
+    breaker.record_success()
+    fail(breaker, 2)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_success_closes():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=RESET_TIMEOUT)
+    fail(breaker, 1)
+    time.sleep(RESET_TIMEOUT * 2)
+
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=RESET_TIMEOUT)
+    fail(breaker, 2)
+    time.sleep(RESET_TIMEOUT * 2)
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.times_opened == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_saver_fails_fast_while_redis_is_down(redis_server, redis_client):
+    saver = RedisCheckpointSaver(redis_client, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=RESET_TIMEOUT))
+    config = {"configurable": {"thread_id": "t"}}
+
+    redis_server.connected = False
+    for _ in range(2):
+        with pytest.raises(redis.exceptions.ConnectionError) as raised:
+            saver.get_tuple(config)
+        assert not isinstance(raised.value, CircuitOpenError)
+    with pytest.raises(CircuitOpenError):
+        saver.get_tuple(config)
+    health = saver.health()
+    assert health["circuit"]["state"] == "open"
+    assert health["latency"]["errors"] == 2
+
+    redis_server.connected = True
+    time.sleep(RESET_TIMEOUT * 2)
+    assert saver.get_tuple(config) is None
+    assert saver.health()["circuit"]["state"] == "closed"
+
+
+def test_other_errors_do_not_trip_the_breaker(redis_client):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    saver = RedisCheckpointSaver(redis_client, breaker=breaker)
+    # Redis answered; the blob just isn't a checkpoint (headerless blobs are read as legacy pickles)
+    redis_client.set(saver._make_key("t"), b"not a checkpoint")
+    with pytest.raises(pickle.UnpicklingError):
+        saver.get_tuple({"configurable": {"thread_id": "t"}})
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_async_saver_shares_the_breaker(redis_server, async_redis_client):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    saver = AsyncRedisCheckpointSaver(async_redis_client, breaker=breaker)
+    config = {"configurable": {"thread_id": "t"}}
+
+    async def read():
+        return await saver.aget_tuple(config)
+
+    redis_server.connected = False
+    with pytest.raises(redis.exceptions.ConnectionError):
+        asyncio.run(read())
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(read())
+    assert breaker.stats()["rejected"] == 1
@@ -0,0 +1,196 @@
+"""SQLiteCheckpointSaver: MemorySaver parity, durability and rollback of writes, retention, and the async wrappers."""
+
+import asyncio
+import sqlite3
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+
+from src.agents import sqlite_checkpointer
+from src.agents.sqlite_checkpointer import SQLiteCheckpointSaver
+from tests.graph_helpers import (
+    ahistory_shape,
+    arun_turns,
+    assert_pending_writes_resume,
+    assert_saver_api_parity,
+    build_graph,
+    history_shape,
+    reference_history,
+    run_turns,
+)
+
+
+def test_api_matches_memory_saver(tmp_path):
+    assert_saver_api_parity(SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db")))
+
+
+def test_async_api_matches_memory_saver(tmp_path):
+    assert_saver_api_parity(SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db")), use_async=True)
+
+
+def test_history_matches_memory_saver(tmp_path):
+    graph = build_graph(SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db")))
+    config = {"configurable": {"thread_id": "history"}}
+    run_turns(graph, config, 3)
+    assert history_shape(graph, config) == reference_history(3)
+
+
+def test_async_history_matches_memory_saver(tmp_path):
+    graph = build_graph(SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db")))
+    config = {"configurable": {"thread_id": "history"}}
+
+    async def run():
+        await arun_turns(graph, config, 3)
+        return await ahistory_shape(graph, config)
+
+    assert asyncio.run(run()) == reference_history(3)
+
+
+def test_pending_writes_survive_a_failed_step(tmp_path):
+    assert_pending_writes_resume(SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db")))
+
+
+def test_async_pending_writes_survive_a_failed_step(tmp_path):
+    assert_pending_writes_resume(SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db")), use_async=True)
+
+
+def test_writes_are_durable_once_put_writes_returns(tmp_path):
+    path = str(tmp_path / "checkpoints.db")
+    saver = SQLiteCheckpointSaver(path)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(build_graph(saver), config, 1)
+    latest = saver.get_tuple(config)
+    saver.put_writes(latest.config, [("log", ["late"])], "task-1")
+
+    # A second connection only sees committed rows
+    reader = SQLiteCheckpointSaver(path)
+    assert [(channel, value) for _, channel, value in reader.get_tuple(config).pending_writes] == [("log", ["late"])]
+    reader.close()
+    saver.close()
+
+
+def test_reopened_database_resumes_the_thread(tmp_path):
+    path = str(tmp_path / "checkpoints.db")
+    saver = SQLiteCheckpointSaver(path)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(build_graph(saver), config, 2)
+    saver.close()
+
+    graph = build_graph(SQLiteCheckpointSaver(path))
+    assert graph.get_state(config).values["count"] == 2
+    run_turns(graph, config, 1)
+    assert graph.get_state(config).values["count"] == 3
+
+
+def test_turn_ends_only_keeps_one_checkpoint_per_turn(tmp_path):
+    saver = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"), turn_ends_only=True)
+    graph = build_graph(saver)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(graph, config, 3)
+    assert [snapshot.values["count"] for snapshot in graph.get_state_history(config)] == [3, 2, 1]
+
+
+def test_failed_put_rolls_back_and_keeps_the_parent(tmp_path, monkeypatch):
+    path = str(tmp_path / "checkpoints.db")
+    saver = SQLiteCheckpointSaver(path, turn_ends_only=True)
+    parent = saver.put({"configurable": {"thread_id": "t"}}, empty_checkpoint(), {"source": "input"}, {})
+
+    # Fails after the superseded parent has been deleted inside the transaction
+    def broken_summary(checkpoint):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(sqlite_checkpointer, "build_summary", broken_summary)
+    with pytest.raises(sqlite3.OperationalError):
+        saver.put(parent, empty_checkpoint(), {"source": "loop"}, {})
+    monkeypatch.undo()
+
+    # The next successful write must not commit the failed put's deletes
+    saver.put({"configurable": {"thread_id": "other"}}, empty_checkpoint(), {"source": "input"}, {})
+    reader = SQLiteCheckpointSaver(path)
+    assert reader.get_tuple(parent).config == parent
+    assert [t.config for t in reader.list({"configurable": {"thread_id": "t"}})] == [parent]
+    reader.close()
+    saver.close()
+
+
+def test_failed_put_writes_rolls_back(tmp_path):
+    saver = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"))
+    checkpoint_config = saver.put({"configurable": {"thread_id": "t"}}, empty_checkpoint(), {"source": "input"}, {})
+
+    with pytest.raises(TypeError):
+        saver.put_writes(checkpoint_config, [("log", ["kept?"]), ("log", object())], "task-1")
+    assert not saver.conn.in_transaction
+    assert saver.get_tuple(checkpoint_config).pending_writes == []
+    saver.close()
+
+
+def test_keep_last_trims_old_checkpoints(tmp_path):
+    saver = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"), keep_last=2)
+    graph = build_graph(saver)
+    config = {"configurable": {"thread_id": "t"}}
+    run_turns(graph, config, 3)
+    assert graph.get_state(config).values["count"] == 3
+    kept = [t.config["configurable"]["checkpoint_id"] for t in saver.list(config)]
+    assert len(kept) == 2
+    assert saver.conn.execute("SELECT COUNT(*) FROM writes WHERE checkpoint_id < ?", (kept[-1],)).fetchone()[0] == 0
+
+
+def test_expired_sessions_read_as_missing_and_are_swept(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(sqlite_checkpointer.time, "time", lambda: now[0])
+    saver = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"), ttl=1000, completed_ttl=10)
+    open_config = saver.put({"configurable": {"thread_id": "open"}}, empty_checkpoint(), {"source": "input"}, {})
+    done = empty_checkpoint()
+    done["channel_values"] = {"is_complete": True}
+    done_config = saver.put({"configurable": {"thread_id": "done"}}, done, {"source": "loop"}, {})
+
+    now[0] += 50
+    assert saver.get_tuple(done_config) is None
+    assert saver.get_summary("done") is None
+    assert list(saver.list({"configurable": {"thread_id": "done"}})) == []
+    assert saver.get_tuple(open_config) is not None
+
+    # The next write past the sweep interval deletes the expired rows
+    now[0] += sqlite_checkpointer.PURGE_INTERVAL
+    saver.put({"configurable": {"thread_id": "other"}}, empty_checkpoint(), {"source": "input"}, {})
+    assert saver.conn.execute("SELECT thread_id FROM checkpoints ORDER BY thread_id").fetchall() == [
+        ("open",), ("other",)
+    ]
+    saver.close()
+
+
+def test_sliding_ttl_restarts_on_read(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(sqlite_checkpointer.time, "time", lambda: now[0])
+    saver = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"), ttl=100, sliding_ttl=True)
+    config = saver.put({"configurable": {"thread_id": "t"}}, empty_checkpoint(), {"source": "input"}, {})
+
+    for _ in range(3):
+        now[0] += 80
+        assert saver.get_tuple(config) is not None
+    now[0] += 120
+    assert saver.get_tuple(config) is None
+    saver.close()
+
+
+def test_batched_writes_commit_with_the_next_checkpoint(tmp_path):
+    path = str(tmp_path / "checkpoints.db")
+    saver = SQLiteCheckpointSaver(path, batch_writes=True)
+    config = saver.put({"configurable": {"thread_id": "t"}}, empty_checkpoint(), {"source": "input"}, {})
+    saver.put_writes(config, [("log", ["a"])], "task-1")
+    with pytest.raises(TypeError):
+        saver.put_writes(config, [("log", ["b"]), ("log", object())], "task-2")
+
+    reader = SQLiteCheckpointSaver(path)
+    assert reader.get_tuple(config).pending_writes == []
+    saver.flush()
+    # Only the failed call was undone
+    assert [(channel, value) for _, channel, value in reader.get_tuple(config).pending_writes] == [("log", ["a"])]
+    reader.close()
+    saver.close()
+
+
+def test_batched_writes_match_memory_saver(tmp_path):
+    saver = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"), batch_writes=True)
+    assert_saver_api_parity(saver)
+    assert_pending_writes_resume(SQLiteCheckpointSaver(str(tmp_path / "resume.db"), batch_writes=True))
@@ -0,0 +1,66 @@
+"""TextSignals: word-boundary keyword matching, prefixes, phrases and the shared cache."""
+
+import json
+
+from src.tools import ProfileAnalyzerTool
+from src.tools.text_signals import TextSignals, TextStats, get_text_signals
+
+
+def matcher():
+    return TextSignals(
+        {
+            "habit": ["read", "pages"],
+            "taste": ["novel*", "such as"],
+            "emotion": ["love*"],
+        },
+        dimensions=["habit", "taste"],
+    )
+
+
+def test_keywords_only_match_whole_words():
+    signals = matcher()
+    assert signals.analyze("I already finished it").groups == frozenset()
+    assert signals.analyze("Bread and thread").groups == frozenset()
+    assert signals.analyze("I read before bed").groups == {"habit"}
+    assert signals.analyze("Read it, then read again.").groups == {"habit"}
+
+
+def test_starred_keywords_match_prefixes_only():
+    signals = matcher()
+    assert signals.analyze("Novels and novella").groups == {"taste"}
+    assert signals.analyze("Lovely, I LOVED it").groups == {"emotion"}
+    assert signals.analyze("a supernovel").groups == frozenset()
+
+
+def test_phrases_match_across_whitespace():
+    signals = matcher()
+    assert signals.analyze("Authors such\n as Le Guin").groups == {"taste"}
+    assert signals.analyze("such a good book, as always").groups == frozenset()
+
+
+def test_word_counts():
+    assert matcher().analyze("The the THE book") == TextStats(word_count=4, unique_words=2, groups=frozenset())
+    assert matcher().analyze("") == TextStats(word_count=0, unique_words=0, groups=frozenset())
+
+
+def test_results_are_cached_per_text():
+    signals = matcher()
+    assert signals.analyze("I read daily") is signals.analyze("I read daily")
+    assert signals.analyze.cache_info().hits == 1
+
+
+def test_from_file_adds_dimensions_as_groups(tmp_path):
+    path = tmp_path / "keywords.json"
+    path.write_text(json.dumps({
+        "emotion_words": ["boring"],
+        "dimensions": {"consumption_habit": ["read"]},
+    }))
+    signals = TextSignals.from_file(path)
+    assert signals.dimensions == ["consumption_habit"]
+    assert signals.analyze("Reading is boring, I read less").groups == {"emotion_words", "consumption_habit"}
+
+
+def test_bundled_keywords_do_not_match_inside_words():
+    # "already" used to count as "read", marking consumption habits as covered
+    assert "consumption_habit" not in get_text_signals().analyze("I already told you").groups
+    assert ProfileAnalyzerTool()._run("I already told you")["engagement_level"] == 0.5
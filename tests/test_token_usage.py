@@ -0,0 +1,62 @@
+"""Prompt token accounting, including replies assembled from a stream."""
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from src.config import settings
+from src.utils.llm_cache import CACHE_HIT_METADATA
+from src.utils.llm_factory import _build_moonshot, _build_openai
+from src.utils.token_usage import TokenUsage
+
+
+@pytest.mark.parametrize("builder, key", [(_build_openai, "openai_api_key"), (_build_moonshot, "moonshot_api_key")])
+def test_openai_compatible_models_report_usage_when_streaming(monkeypatch, builder, key):
+    monkeypatch.setattr(settings, key, "sk-test")
+    assert builder("interview", 0.7, None).stream_usage is True
+
+
+def test_usage_is_recorded_from_a_streamed_reply():
+    # With stream_usage the usage arrives on the last chunk, after the content
+    chunks = [
+        AIMessageChunk(content="What did you "),
+        AIMessageChunk(content="read last?"),
+        AIMessageChunk(
+            content="",
+            usage_metadata={
+                "input_tokens": 1500,
+                "output_tokens": 6,
+                "total_tokens": 1506,
+                "input_token_details": {"cache_read": 1024},
+            },
+        ),
+    ]
+    reply = chunks[0]
+    for chunk in chunks[1:]:
+        reply += chunk
+
+    usage = TokenUsage()
+    assert usage.record("question", reply) == (1500, 1024)
+    assert usage.stats()["question"] == {
+        "calls": 1,
+        "response_cache_hits": 0,
+        "prompt_tokens": 1500,
+        "cached_tokens": 1024,
+        "cache_rate": 0.683,
+    }
+
+
+def test_moonshot_cached_tokens_are_read_from_token_usage():
+    reply = AIMessage(content="ok", response_metadata={"token_usage": {"prompt_tokens": 900, "cached_tokens": 512}})
+    assert TokenUsage().record("question", reply) == (900, 512)
+
+
+def test_response_cache_hits_are_not_counted_as_tokens():
+    reply = AIMessage(
+        content="ok",
+        usage_metadata={"input_tokens": 900, "output_tokens": 1, "total_tokens": 901},
+        response_metadata={CACHE_HIT_METADATA: True},
+    )
+    usage = TokenUsage()
+    assert usage.record("profile", reply) == (0, 0)
+    assert usage.stats()["profile"]["response_cache_hits"] == 1
+    assert usage.stats()["profile"]["prompt_tokens"] == 0